@@ -1,8 +1,11 @@
 from __future__ import annotations
 import heapq
 import math
-from typing import Dict, Optional, Tuple, List
-from .base import neighbors, edge_weight, reconstruct_path, node_pos
+from array import array
+from typing import Mapping, Tuple, List
+from .base import as_csr, node_pos
+from .landmarks import get_landmarks
+from .results import PathResult
 
 
 def heuristic(graph, a: int, b: int) -> float:
@@ -11,28 +14,65 @@ def heuristic(graph, a: int, b: int) -> float:
     return math.hypot(ax - bx, ay - by)
 
 
-def astar(graph, start: int, goal: int) -> Dict:
-    g: Dict[int, float] = {start: 0.0}
-    prev: Dict[int, Optional[int]] = {start: None}
-    pq: List[Tuple[float, int]] = [(heuristic(graph, start, goal), start)]
-    closed = set()
+# Bu boyutun altında ALT ön işlemesi (k tam Dijkstra, her graph version'ında
+# yeniden) tek sorgudan pahalıdır; "alt" modu sezgiseli 0 alır (kesin sonuç).
+ALT_MIN_NODES = 5000
+
+
+def astar(graph, start: int, goal: int, mode: str = "alt", landmarks: int = 8) -> Mapping:
+    """
+    {"g", "prev", "path", "cost"} (bkz. PathResult).
+    mode="alt": landmark üçgen eşitsizliği alt sınırı (kabul edilebilir); landmark'lar
+    yalnız ALT_MIN_NODES ve üstü düğümlü graflarda, ilk sorguda kurulur.
+    mode="euclid": çizim konumları arası öklid uzaklığı (eski davranış, bkz. heuristic).
+    """
+    if mode not in ("alt", "euclid"):
+        raise ValueError(f"Bilinmeyen sezgisel: {mode}")
+    csr = as_csr(graph)
+    s = csr.index.get(start)
+    t = csr.index.get(goal, -1)
+    if s is None:
+        path = [start] if goal == start else []
+        return {"g": {start: 0.0}, "prev": {start: None}, "path": path, "cost": 0.0 if goal == start else float("inf")}
+
+    indptr, indices, weights = csr.indptr, csr.indices, csr.weights
+    n = len(csr.ids)
+    if mode == "alt":
+        if t >= 0 and n >= ALT_MIN_NODES:
+            h = get_landmarks(csr, landmarks).lower_bounds(t)
+        else:
+            h = [0.0] * n
+    else:
+        xs, ys = csr.xs, csr.ys
+        gx, gy = (xs[t], ys[t]) if t >= 0 else (0.0, 0.0)
+        hypot = math.hypot
+        h = [hypot(xs[i] - gx, ys[i] - gy) for i in range(n)]
+
+    inf = float("inf")
+    g = [inf] * n
+    prev = [-1] * n
+    closed = bytearray(n)
+    g[s] = 0.0
+    reached = array("q", [s])
+    pq: List[Tuple[float, int]] = [(h[s], s)]
 
     while pq:
         f, u = heapq.heappop(pq)
-        if u in closed:
+        if closed[u]:
             continue
-        if u == goal:
+        if u == t:
             break
-        closed.add(u)
+        closed[u] = 1
 
-        for v in neighbors(graph, u):
-            w = edge_weight(graph, u, v)
-            ng = g[u] + w
-            if v not in g or ng < g[v]:
+        gu = g[u]
+        for j in range(indptr[u], indptr[u + 1]):
+            v = indices[j]
+            ng = gu + weights[j]
+            if ng < g[v]:
+                if g[v] == inf:
+                    reached.append(v)
                 g[v] = ng
                 prev[v] = u
-                nf = ng + heuristic(graph, v, goal)
-                heapq.heappush(pq, (nf, v))
+                heapq.heappush(pq, (ng + h[v], v))
 
-    path = reconstruct_path(prev, start, goal)
-    return {"g": g, "prev": prev, "path": path, "cost": g.get(goal, float("inf"))}
+    return PathResult(csr, array("d", g), array("q", prev), reached, s, t, dist_key="g")
@@ -3,6 +3,37 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Dict, List, Optional, Iterable, Tuple
 from app.core.edge import undirected_key
+from app.core.csr import CSRGraph
+
+
+@dataclass(slots=True)
+class VisitEvent:
+    """Akış (generator) gezintilerinin olayı: ziyaret edilen düğüm, ağaçtaki ebeveyni ve uzaklığı."""
+    node: int
+    parent: Optional[int]
+    distance: float     # BFS: hop, DFS: derinlik, Dijkstra: yol maliyeti
+
+
+def as_csr(graph) -> CSRGraph:
+    # Algoritmalar dizi tabanlı anlık görüntü üzerinde çalışır
+    if isinstance(graph, CSRGraph):
+        return graph
+    if hasattr(graph, "freeze"):
+        return graph.freeze()
+    return CSRGraph.from_graph(graph)
+
+
+def target_marks(n: int, targets: Iterable[int]) -> Tuple[Optional[bytearray], int]:
+    # çok hedefli aramalar için: (hedef işaretleri ya da None, farklı hedef sayısı)
+    if not targets:
+        return None, 0
+    want = bytearray(n)
+    count = 0
+    for x in targets:
+        if not want[x]:
+            want[x] = 1
+            count += 1
+    return want, count
 
 
 def neighbors(graph, u: int) -> Iterable[int]:
@@ -44,6 +75,19 @@ def reconstruct_path(prev: Dict[int, Optional[int]], start: int, goal: int) -> L
     return path
 
 
+def reconstruct_path_idx(prev: List[int], s: int, t: int, ids: List[int]) -> List[int]:
+    # prev: yoğun indeks dizisi, -1 = yok
+    if t != s and prev[t] < 0:
+        return []
+    path = [ids[t]]
+    cur = t
+    while cur != s:
+        cur = prev[cur]
+        path.append(ids[cur])
+    path.reverse()
+    return path
+
+
 def node_pos(graph, nid: int) -> Tuple[float, float]:
     n = getattr(graph, "nodes", {}).get(nid)
     if not n:
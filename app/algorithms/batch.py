@@ -0,0 +1,87 @@
+from __future__ import annotations
+from array import array
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+from .base import as_csr, reconstruct_path_idx
+from .dijkstra import dijkstra_arrays
+from .parallel import map_chunks
+
+# (kaynak, hedefler), yoğun indekslerle
+_Group = Tuple[int, Sequence[int]]
+
+
+def _batch_chunk(csr, groups: Sequence[_Group]) -> List[Tuple[List[float], List[List[int]]]]:
+    # kaynak başına tek çok hedefli Dijkstra; yollar yoğun indekslerle döner
+    # (işçideki CSR'nin id'leri 0..n-1 olduğundan seri ve paralel sürüm aynıdır)
+    dense = range(len(csr.ids))
+    out = []
+    for s, targets in groups:
+        dist, prev, _reached = dijkstra_arrays(csr, s, targets=targets, queue="auto")
+        out.append(([dist[t] for t in targets],
+                    [reconstruct_path_idx(prev, s, t, dense) for t in targets]))
+    return out
+
+
+def shortest_paths_batch(graph, pairs: Iterable[Tuple[int, int]], workers: int = 1) -> Dict:
+    """
+    Çok sayıda (start, goal) sorgusu için en kısa yollar.
+
+    Sorgular kaynağa göre gruplanır; her kaynak için tek bir Dijkstra koşar ve
+    o kaynağın tüm hedefleri kesinleşince durur. workers > 1 ise kaynaklar süreç
+    havuzuna dağıtılır. Sonuç sorgu sırasıyla sıkışık dizilerdir:
+      cost[i]: i. sorgunun maliyeti (ulaşılamıyorsa inf),
+      path_nodes[path_ptr[i]:path_ptr[i + 1]]: i. sorgunun yolu (yoksa boş).
+    Grafta olmayan uçlar ulaşılamaz sayılır; start == goal ise maliyet 0, yol [start].
+    """
+    csr = as_csr(graph)
+    index, ids = csr.index, csr.ids
+    pairs = list(pairs)
+
+    # kaynak -> grup sırası; grup içinde farklı hedefler ilk görülme sırasıyla
+    group_of: Dict[int, int] = {}
+    groups: List[Tuple[int, List[int]]] = []
+    slot_of: List[Dict[int, int]] = []
+    where: List[Tuple[int, int]] = []     # sorgu -> (grup, hedef sırası) ya da (-1, -1)
+    for start, goal in pairs:
+        s, t = index.get(start), index.get(goal)
+        if s is None or t is None:
+            where.append((-1, -1))
+            continue
+        g = group_of.get(s)
+        if g is None:
+            g = group_of[s] = len(groups)
+            groups.append((s, []))
+            slot_of.append({})
+        slots = slot_of[g]
+        k = slots.get(t)
+        if k is None:
+            k = slots[t] = len(groups[g][1])
+            groups[g][1].append(t)
+        where.append((g, k))
+
+    results = [r for part in map_chunks(csr, _batch_chunk, groups, workers) for r in part]
+
+    inf = float("inf")
+    cost = array("d")
+    path_ptr = array("q", [0])
+    path_nodes = array("q")
+    for (start, goal), (g, k) in zip(pairs, where):
+        if g < 0:
+            # uçlardan biri grafta yok: dijkstra() ile aynı davranış
+            same = start == goal
+            cost.append(0.0 if same else inf)
+            if same:
+                path_nodes.append(start)
+        else:
+            costs, paths = results[g]
+            cost.append(costs[k])
+            path_nodes.extend(ids[i] for i in paths[k])
+        path_ptr.append(len(path_nodes))
+
+    return {"cost": cost, "path_ptr": path_ptr, "path_nodes": path_nodes}
+
+
+def batch_path(result: Dict, i: int) -> List[int]:
+    """shortest_paths_batch sonucundan i. sorgunun yolu (id listesi)."""
+    ptr = result["path_ptr"]
+    return result["path_nodes"][ptr[i]:ptr[i + 1]].tolist()
@@ -1,22 +1,55 @@
 from __future__ import annotations
+from array import array
 from collections import deque
-from typing import Dict, List, Optional
-from .base import neighbors
+from typing import Iterator, Mapping
+from .base import VisitEvent, as_csr
+from .results import TraversalResult
 
 
-def bfs(graph, start: int) -> Dict:
-    q = deque([start])
-    visited = set([start])
-    parent: Dict[int, Optional[int]] = {start: None}
-    order: List[int] = []
+def bfs(graph, start: int) -> Mapping:
+    """{"order", "parent"}; ikisi de yoğun dizilere id görünümüdür (bkz. TraversalResult)."""
+    csr = as_csr(graph)
+    s = csr.index.get(start)
+    if s is None:
+        return {"order": [start], "parent": {start: None}}
+
+    indptr, indices, ids = csr.indptr, csr.indices, csr.ids
+    q = deque([s])
+    parent = array("q", [-2]) * len(ids)    # -2: ziyaret edilmedi, -1: kök
+    parent[s] = -1
+    order = array("q")
 
     while q:
         u = q.popleft()
         order.append(u)
-        for v in neighbors(graph, u):
-            if v not in visited:
-                visited.add(v)
+        for v in indices[indptr[u]:indptr[u + 1]]:
+            if parent[v] == -2:
                 parent[v] = u
                 q.append(v)
 
-    return {"order": order, "parent": parent}
+    return TraversalResult(csr, order, parent)
+
+
+def iter_bfs(graph, start: int) -> Iterator[VisitEvent]:
+    """
+    bfs() ile aynı sırada, düğümleri tembel (lazy) olarak üreten BFS.
+    Çağıran istediği anda durabilir; gezilmeyen kısım için iş yapılmaz.
+    """
+    csr = as_csr(graph)
+    s = csr.index.get(start)
+    if s is None:
+        yield VisitEvent(start, None, 0)
+        return
+
+    indptr, indices, ids = csr.indptr, csr.indices, csr.ids
+    q = deque([(s, -1, 0)])
+    visited = bytearray(len(ids))
+    visited[s] = 1
+
+    while q:
+        u, p, h = q.popleft()
+        yield VisitEvent(ids[u], ids[p] if p >= 0 else None, h)
+        for v in indices[indptr[u]:indptr[u + 1]]:
+            if not visited[v]:
+                visited[v] = 1
+                q.append((v, u, h + 1))
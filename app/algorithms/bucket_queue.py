@@ -0,0 +1,157 @@
+from __future__ import annotations
+import weakref
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from app.core.csr import CSRGraph
+from .base import target_marks
+
+# en büyük / en küçük ağırlık oranı bunu aşarsa kova sayısı (ve boş kova taraması) çok büyür
+MAX_BUCKETS = 4096
+
+_width_cache: "weakref.WeakKeyDictionary[CSRGraph, Optional[Tuple[float, int]]]" = weakref.WeakKeyDictionary()
+_prefer_cache: "weakref.WeakKeyDictionary[CSRGraph, bool]" = weakref.WeakKeyDictionary()
+
+
+def bucket_params(csr: CSRGraph) -> Optional[Tuple[float, int]]:
+    """
+    (kova genişliği, dairesel kova sayısı) ya da kova kuyruğu uygun değilse None.
+
+    Genişlik en küçük edge ağırlığıdır; bir kovadaki düğümlerden yapılan her
+    gevşetme en az bir sonraki kovaya düşer. Sıfır/negatif ağırlıkta ya da
+    ağırlık oranı MAX_BUCKETS'ı aşınca None döner. Anlık görüntü başına önbelleklenir.
+    """
+    if csr in _width_cache:
+        return _width_cache[csr]
+    w = np.frombuffer(csr.weights, dtype=np.float64)
+    params = None
+    if len(w):
+        lo, hi = float(w.min()), float(w.max())
+        if lo > 0 and np.isfinite(hi) and hi / lo <= MAX_BUCKETS:
+            params = (lo, int(hi / lo) + 3)
+    _width_cache[csr] = params
+    return params
+
+
+def _hop_depth(csr: CSRGraph) -> int:
+    # en yüksek dereceli düğümden BFS seviye sayısı (hop çapının kestirimi), O(n + m)
+    indptr, indices = csr.indptr, csr.indices
+    deg = np.diff(np.frombuffer(indptr, dtype=np.int64))
+    start = int(np.argmax(deg))
+    seen = bytearray(len(deg))
+    seen[start] = 1
+    frontier = [start]
+    depth = 0
+    while frontier:
+        nxt = []
+        for u in frontier:
+            for v in indices[indptr[u]:indptr[u + 1]]:
+                if not seen[v]:
+                    seen[v] = 1
+                    nxt.append(v)
+        if nxt:
+            depth += 1
+        frontier = nxt
+    return depth
+
+
+def prefer_buckets(csr: CSRGraph) -> bool:
+    """
+    queue="auto" için: kova kuyruğu heap'ten ucuz mu?
+
+    Kova taraması kaynaktan en uzak düğümün uzaklığı / genişlik kadar adım
+    sürer (boş kovalar dahil); bu ortalama ağırlık / genişlik × hop derinliği
+    ile kestirilir ve edge sayısını aşarsa heap seçilir. Uzun yol benzeri
+    graflarda büyük ağırlık oranıyla kovalar heap'ten çok yavaştır.
+    Anlık görüntü başına bir BFS ile önbelleklenir.
+    """
+    if csr in _prefer_cache:
+        return _prefer_cache[csr]
+    params = bucket_params(csr)
+    prefer = False
+    if params is not None:
+        width = params[0]
+        mean_w = float(np.frombuffer(csr.weights, dtype=np.float64).mean())
+        prefer = mean_w / width * _hop_depth(csr) <= csr.m
+    _prefer_cache[csr] = prefer
+    return prefer
+
+
+def dijkstra_buckets(csr: CSRGraph, s: int, t: int = -1,
+                     targets: Sequence[int] = ()) -> Tuple[List[float], List[int], List[int]]:
+    """
+    Dinitz kovalı Dijkstra: genişliği en küçük ağırlık olan dairesel kovalar.
+
+    Aynı kovadaki düğümlerin uzaklıkları kesindir ve herhangi sırayla
+    kesinleştirilebilir; heap, (uzaklık, düğüm) demetleri ve log çarpanı yoktur.
+    Düğümün kovası değişmeyen azalmalarda yeni kayıt eklenmez. dijkstra_arrays
+    ile aynı uzaklıkları verir (eşit maliyetli yollarda prev farklı olabilir).
+    Döner: (dist, prev, reached).
+    """
+    n = len(csr.ids)
+    if not len(csr.indices):
+        # edge yok: yalnız kaynak ulaşılır
+        dist = [float("inf")] * n
+        dist[s] = 0.0
+        return dist, [-1] * n, [s]
+    params = bucket_params(csr)
+    if params is None:
+        raise ValueError("Kova kuyruğu için ağırlıklar pozitif ve sınırlı oranda olmalıdır.")
+    width, nb = params
+    inv = 1.0 / width
+
+    indptr, indices, weights = csr.indptr, csr.indices, csr.weights
+    inf = float("inf")
+    dist = [inf] * n
+    prev = [-1] * n
+    bkey = [-1] * n         # düğümün son kaydının bulunduğu (mutlak) kova
+    done = bytearray(n)
+    dist[s] = 0.0
+    bkey[s] = 0
+    reached = [s]
+    buckets: List[List[int]] = [[] for _ in range(nb)]
+    buckets[0].append(s)
+    pending = 1
+    cur = 0
+    want, remaining = target_marks(n, targets)
+
+    while pending:
+        slot = cur % nb
+        bucket = buckets[slot]
+        if not bucket:
+            cur += 1
+            continue
+        buckets[slot] = []
+        pending -= len(bucket)
+        nxt = cur + 1
+        for u in bucket:
+            if done[u]:
+                continue    # daha önceki bir kovada kesinleşmiş eski kayıt
+            done[u] = 1
+            if u == t:
+                return dist, prev, reached
+            if want is not None and want[u]:
+                remaining -= 1
+                if not remaining:
+                    return dist, prev, reached
+            du = dist[u]
+            for j in range(indptr[u], indptr[u + 1]):
+                v = indices[j]
+                nd = du + weights[j]
+                if nd < dist[v]:
+                    if dist[v] == inf:
+                        reached.append(v)
+                    dist[v] = nd
+                    prev[v] = u
+                    # yuvarlama hatasına karşı en erken bir sonraki kova
+                    k = int(nd * inv)
+                    if k < nxt:
+                        k = nxt
+                    if bkey[v] != k:
+                        bkey[v] = k
+                        buckets[k % nb].append(v)
+                        pending += 1
+        cur = nxt
+
+    return dist, prev, reached
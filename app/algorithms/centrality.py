@@ -1,34 +1,428 @@
 from __future__ import annotations
-from typing import Dict
-from .base import neighbors
-from .dijkstra import dijkstra
+import heapq
+import math
+import random
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .base import as_csr
+from .components import component_labels
+from .dijkstra import dijkstra_arrays
+from .parallel import map_chunks
+
+
+def _rows(graph, csr) -> Sequence[int]:
+    # sonuç sözlükleri graph'a eklenme sırasını (graph.nodes sırası) korur;
+    # CSR girdide id sırası kullanılır
+    if hasattr(graph, "nodes"):
+        index = csr.index
+        return [index[nid] for nid in graph.nodes]
+    return range(len(csr.ids))
 
 
 def degree_centrality(graph) -> Dict[int, float]:
-    nodes = list(getattr(graph, "nodes", {}).keys())
-    n = len(nodes)
+    csr = as_csr(graph)
+    ids, indptr = csr.ids, csr.indptr
+    n = len(ids)
+    rows = _rows(graph, csr)
     if n <= 1:
-        return {nid: 0.0 for nid in nodes}
+        return {ids[i]: 0.0 for i in rows}
+
+    return {ids[i]: (indptr[i + 1] - indptr[i]) / (n - 1) for i in rows}
+
+
+def _closeness_of(csr, s: int) -> float:
+    # tek kaynak çekirdeği: seri ve paralel sürüm aynı işlemleri yapar
+    dist, _prev, reached = dijkstra_arrays(csr, s, queue="auto")  # dist tüm düğümlere
+    # ulaşamadıklarını sayma (inf gibi davran)
+    if len(reached) <= 1:
+        return 0.0
+    total = sum(dist[i] for i in reached if i != s)
+    return ((len(reached) - 1) / total) if total > 0 else 0.0
+
+
+def _closeness_chunk(csr, sources: Sequence[int]) -> List[float]:
+    return [_closeness_of(csr, s) for s in sources]
+
+
+def closeness_centrality(graph, workers: int = 1) -> Dict[int, float]:
+    """workers > 1 ise kaynak düğümler parçalara bölünüp süreç havuzunda hesaplanır."""
+    csr = as_csr(graph)
+    ids = csr.ids
+    n = len(ids)
+    rows = _rows(graph, csr)
+    if n <= 1:
+        return {ids[i]: 0.0 for i in rows}
+
+    parts = map_chunks(csr, _closeness_chunk, rows, workers)
+    values = [v for part in parts for v in part]
+    return {ids[i]: v for i, v in zip(rows, values)}
+
+
+def _pivot_chunk(csr, pivots: Sequence[int]) -> Tuple[np.ndarray, np.ndarray, List[float]]:
+    # pivot parçası için uzaklık toplamları, ulaşan pivot sayıları ve eksantriklikler
+    n = len(csr.ids)
+    sums = np.zeros(n)
+    counts = np.zeros(n, dtype=np.int64)
+    eccs: List[float] = []
+    for p in pivots:
+        dist, _prev, reached = dijkstra_arrays(csr, p, queue="auto")
+        idx = np.asarray(reached, dtype=np.int64)
+        d = np.asarray(dist)[idx]
+        sums[idx] += d
+        counts[idx] += 1
+        eccs.append(float(d.max()))
+    return sums, counts, eccs
 
-    deg = {nid: len(list(neighbors(graph, nid))) for nid in nodes}
-    return {nid: deg[nid] / (n - 1) for nid in nodes}
 
+def closeness_approx(graph, samples: Optional[int] = None, epsilon: Optional[float] = None,
+                     delta: float = 0.1, seed: Optional[int] = None, workers: int = 1) -> Dict:
+    """
+    Eppstein–Wang örneklemeli yakınlık merkeziliği.
 
-def closeness_centrality(graph) -> Dict[int, float]:
-    nodes = list(getattr(graph, "nodes", {}).keys())
-    n = len(nodes)
+    Rastgele pivotlardan Dijkstra çalıştırılır; her düğümün bileşenindeki ortalama
+    uzaklığı pivot uzaklıklarının ortalamasıyla kestirilir. samples ya da epsilon
+    verilir: epsilon modunda pivot sayısı ceil(ln(2n/delta) / (2 eps^2)) olur ve
+    1 - delta olasılıkla tüm düğümlerde ortalama uzaklık hatası <= eps * çap olur
+    (Hoeffding + birleşim sınırı). Çap, pivot eksantrikliğinin iki katıyla üstten sınırlanır.
+
+    Döner: closeness (kestirim), bounds (id -> (alt, üst) güven aralığı),
+    samples, epsilon (gerçekleşen), delta.
+    """
+    if (samples is None) == (epsilon is None):
+        raise ValueError("samples ya da epsilon değerlerinden tam olarak biri verilmelidir.")
+    if not 0.0 < delta < 1.0:
+        raise ValueError("delta 0 ile 1 arasında olmalıdır.")
+    csr = as_csr(graph)
+    ids = csr.ids
+    n = len(ids)
     if n <= 1:
-        return {nid: 0.0 for nid in nodes}
-
-    res: Dict[int, float] = {}
-    for s in nodes:
-        out = dijkstra(graph, s)  # dist tüm düğümlere
-        dist = out["dist"]
-        # ulaşamadıklarını sayma (inf gibi davran)
-        reachable = [d for (nid, d) in dist.items() if nid != s]
-        if not reachable:
-            res[s] = 0.0
+        return {"closeness": {nid: 0.0 for nid in ids}, "bounds": {nid: (0.0, 0.0) for nid in ids},
+                "samples": 0, "epsilon": 0.0, "delta": delta}
+
+    log_term = math.log(2 * n / delta)
+    if epsilon is not None:
+        if epsilon <= 0:
+            raise ValueError("epsilon pozitif olmalıdır.")
+        samples = math.ceil(log_term / (2 * epsilon ** 2))
+    if samples <= 0:
+        raise ValueError("samples pozitif olmalıdır.")
+    k = min(int(samples), n)
+
+    pivots = random.Random(seed).sample(range(n), k)
+    sums = np.zeros(n)
+    counts = np.zeros(n, dtype=np.int64)
+    eccs: List[float] = []
+    for part_sums, part_counts, part_eccs in map_chunks(csr, _pivot_chunk, pivots, workers):
+        sums += part_sums
+        counts += part_counts
+        eccs.extend(part_eccs)
+
+    labels, sizes = component_labels(csr)
+    lab = np.asarray(labels, dtype=np.int64)
+    size = np.asarray(sizes, dtype=np.int64)[lab]
+    # bileşen başına çap üst sınırı: min(2 * ecc(pivot))
+    diam = np.full(len(sizes), np.inf)
+    np.minimum.at(diam, lab[pivots], 2.0 * np.asarray(eccs))
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mean = sums / counts
+        err = diam[lab] * np.sqrt(log_term / (2.0 * counts))
+    err[counts >= size] = 0.0     # bileşenin tamamı pivot: kestirim kesin
+
+    closeness: Dict[int, float] = {}
+    bounds: Dict[int, Tuple[float, float]] = {}
+    for i, nid in enumerate(ids):
+        r = int(size[i])
+        if r <= 1:
+            closeness[nid] = 0.0
+            bounds[nid] = (0.0, 0.0)
             continue
-        total = sum(reachable)
-        res[s] = (len(reachable) / total) if total > 0 else 0.0
-    return res
+        if counts[i] == 0:
+            # bileşenine pivot düşmedi (küçük bileşen): kesin hesapla
+            c = _closeness_of(csr, i)
+            closeness[nid] = c
+            bounds[nid] = (c, c)
+            continue
+        m, e = float(mean[i]), float(err[i])
+        scale = (r - 1) / r
+        closeness[nid] = scale / m if m > 0 else 0.0
+        lo = scale / (m + e) if m + e > 0 else 0.0
+        hi = scale / (m - e) if m - e > 0 else math.inf
+        bounds[nid] = (lo, hi)
+
+    return {"closeness": closeness, "bounds": bounds, "samples": k,
+            "epsilon": math.sqrt(log_term / (2 * k)), "delta": delta}
+
+
+def _closeness_cut(csr, s: int, r: int, threshold: float) -> Optional[float]:
+    """
+    Eşikli tek kaynak çekirdeği. Settle edilmemiş her düğümün uzaklığı en az
+    son çekilen d olduğundan uzaklık toplamı >= S + (r - c) * d; bu sınırla
+    yakınlık threshold'un altına düştüğü anda aramayı keser ve None döner.
+    Kesilmezse _closeness_of ile aynı değeri döndürür.
+    """
+    indptr, indices, weights = csr.indptr, csr.indices, csr.weights
+    n = len(csr.ids)
+    inf = float("inf")
+    dist = [inf] * n
+    done = bytearray(n)
+    dist[s] = 0.0
+    reached = [s]
+    pq: List[Tuple[float, int]] = [(0.0, s)]
+    heappush, heappop = heapq.heappush, heapq.heappop
+    settled, settled_sum = 0, 0.0
+    scale = r - 1
+
+    while pq:
+        d, u = heappop(pq)
+        if done[u]:
+            continue
+        done[u] = 1
+        settled += 1
+        settled_sum += d
+        lb = settled_sum + (r - settled) * d
+        if lb > 0 and scale / lb < threshold:
+            return None
+
+        for j in range(indptr[u], indptr[u + 1]):
+            v = indices[j]
+            nd = d + weights[j]
+            if nd < dist[v]:
+                if dist[v] == inf:
+                    reached.append(v)
+                dist[v] = nd
+                heappush(pq, (nd, v))
+
+    if len(reached) <= 1:
+        return 0.0
+    total = sum(dist[i] for i in reached if i != s)
+    return ((len(reached) - 1) / total) if total > 0 else 0.0
+
+
+def closeness_topk(graph, k: int = 5, samples: Optional[int] = 64, epsilon: Optional[float] = None,
+                   delta: float = 0.1, seed: Optional[int] = None, workers: int = 1,
+                   patience: int = 100) -> Dict:
+    """
+    En yüksek yakınlık merkeziliğine sahip k düğüm.
+
+    Adaylar closeness_approx kestirimine göre azalan sırada işlenir. Her aday için
+    Dijkstra, yakınlığın üst sınırı o ana kadarki k. en iyi değerin altına düştüğü
+    anda kesilir; böylece çoğu aday için tam arama yapılmaz. Sıradaki adayın
+    güven aralığı üst sınırı k. değerin altındaysa atlanır (1 - delta olasılıkla doğru).
+    Sıralama art arda patience aday boyunca değişmezse kararlı sayılıp durulur
+    (patience <= 0: tüm adaylar işlenir, sonuç kesin). epsilon verilirse samples yerine o kullanılır.
+    Döner: top [(id, closeness)], evaluated (tam hesaplanan), cut (kesilen),
+    stable (kararlılık ile erken duruldu mu), samples, epsilon.
+    """
+    if k <= 0:
+        raise ValueError("k pozitif olmalıdır.")
+    if epsilon is not None:
+        samples = None
+    csr = as_csr(graph)
+    approx = closeness_approx(csr, samples=samples, epsilon=epsilon, delta=delta, seed=seed, workers=workers)
+    est, bounds = approx["closeness"], approx["bounds"]
+    index = csr.index
+    labels, sizes = component_labels(csr)
+
+    order = sorted(est, key=est.get, reverse=True)
+    best: List[Tuple[float, int]] = []     # (closeness, id), azalan
+    evaluated = cut = 0
+    unchanged = 0
+    stable = False
+    for nid in order:
+        if patience > 0 and len(best) >= k and unchanged >= patience:
+            stable = True
+            break
+        unchanged += 1
+        threshold = best[k - 1][0] if len(best) >= k else 0.0
+        if len(best) >= k and bounds[nid][1] < threshold:
+            continue
+        i = index[nid]
+        c = _closeness_cut(csr, i, sizes[labels[i]], threshold)
+        if c is None:
+            cut += 1
+            continue
+        evaluated += 1
+        best.append((c, nid))
+        best.sort(key=lambda t: t[0], reverse=True)
+        if len(best) <= k or best[k][1] != nid:
+            unchanged = 0
+        del best[k:]
+
+    return {"top": [(nid, c) for c, nid in best], "evaluated": evaluated, "cut": cut, "stable": stable,
+            "samples": approx["samples"], "epsilon": approx["epsilon"]}
+
+
+def _brandes_chunk(csr, sources: Sequence[int]) -> np.ndarray:
+    """
+    Ağırlıklı Brandes çekirdeği: verilen kaynaklar için bağımlılık (dependency)
+    toplamları. Öncüller listede tutulmaz; geri adımda dist[v] + w == dist[u]
+    ile ileri adımdaki aynı ifade yeniden hesaplanır.
+    """
+    indptr, indices, weights = csr.indptr, csr.indices, csr.weights
+    n = len(csr.ids)
+    inf = float("inf")
+    heappush, heappop = heapq.heappush, heapq.heappop
+    bc = [0.0] * n
+
+    for s in sources:
+        dist = [inf] * n
+        sigma = [0.0] * n
+        done = bytearray(n)
+        dist[s] = 0.0
+        sigma[s] = 1.0
+        order: List[int] = []
+        pq: List[Tuple[float, int]] = [(0.0, s)]
+
+        while pq:
+            d, u = heappop(pq)
+            if done[u]:
+                continue
+            done[u] = 1
+            order.append(u)
+            su = sigma[u]
+            for j in range(indptr[u], indptr[u + 1]):
+                v = indices[j]
+                if done[v]:
+                    continue
+                nd = d + weights[j]
+                dv = dist[v]
+                if nd < dv:
+                    dist[v] = nd
+                    sigma[v] = su
+                    heappush(pq, (nd, v))
+                elif nd == dv:
+                    sigma[v] += su
+
+        delta = [0.0] * n
+        for u in reversed(order):
+            du = dist[u]
+            coeff = (1.0 + delta[u]) / sigma[u]
+            for j in range(indptr[u], indptr[u + 1]):
+                v = indices[j]
+                if dist[v] + weights[j] == du:
+                    delta[v] += sigma[v] * coeff
+            if u != s:
+                bc[u] += delta[u]
+
+    return np.asarray(bc)
+
+
+def betweenness_centrality(graph, normalized: bool = True, samples: Optional[int] = None,
+                           seed: Optional[int] = None, workers: int = 1) -> Dict[int, float]:
+    """
+    Ağırlıklı Brandes arasındalık merkeziliği (O(n·m log n)).
+
+    samples verilirse yalnız rastgele seçilen o kadar kaynaktan hesaplanır ve
+    sonuç n / samples ile ölçeklenir (yansız kestirim). workers > 1 ise kaynak
+    parçaları süreç havuzunda işlenir, bağımlılık vektörleri toplanır.
+    normalized=True: 1 / ((n-1)(n-2)) ile ölçeklenir; toplam her yönsüz çifti iki
+    uçtan saydığından bu 2 / ((n-1)(n-2)) · (toplam / 2) ile aynıdır. Yıldızın
+    merkezi ve 3 düğümlü yolun ortası 1.0 alır.
+    """
+    csr = as_csr(graph)
+    ids = csr.ids
+    n = len(ids)
+    if n <= 2:
+        return {nid: 0.0 for nid in ids}
+
+    if samples is None or samples >= n:
+        sources: Sequence[int] = range(n)
+    else:
+        if samples <= 0:
+            raise ValueError("samples pozitif olmalıdır.")
+        sources = sorted(random.Random(seed).sample(range(n), samples))
+
+    bc = np.zeros(n)
+    for part in map_chunks(csr, _brandes_chunk, sources, workers):
+        bc += part
+
+    # her yönsüz yol iki uçtan da sayıldı
+    scale = 1.0 / ((n - 1) * (n - 2)) if normalized else 0.5
+    if len(sources) < n:
+        scale *= n / len(sources)
+    return dict(zip(ids, (bc * scale).tolist()))
+
+
+def _matvec_arrays(csr, weighted: bool) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    # CSR -> (satır, sütun, ağırlık) dizileri; y = bincount(rows, w * x[cols]) seyrek A·x'tir
+    n = len(csr.ids)
+    indptr = np.frombuffer(csr.indptr, dtype=np.int64)
+    cols = np.frombuffer(csr.indices, dtype=np.int64)
+    rows = np.repeat(np.arange(n, dtype=np.int64), np.diff(indptr))
+    w = np.frombuffer(csr.weights, dtype=np.float64) if weighted else np.ones(len(cols))
+    return rows, cols, w
+
+
+def _start_vector(csr, nstart: Optional[Dict[int, float]]) -> np.ndarray:
+    # sıcak başlangıç: önceki sonuç (yeni düğümler ortalama değerle), yoksa uniform
+    n = len(csr.ids)
+    if not nstart:
+        return np.full(n, 1.0 / n)
+    x = np.fromiter((nstart.get(nid, np.nan) for nid in csr.ids), dtype=np.float64, count=n)
+    missing = np.isnan(x)
+    if missing.all():
+        return np.full(n, 1.0 / n)
+    x[missing] = x[~missing].mean()
+    total = x.sum()
+    if total <= 0:
+        raise ValueError("nstart toplamı pozitif olmalıdır.")
+    return x / total
+
+
+def pagerank(graph, alpha: float = 0.85, tol: float = 1e-6, max_iter: int = 100,
+             nstart: Optional[Dict[int, float]] = None, weighted: bool = True) -> Dict[int, float]:
+    """
+    Ağırlıklı PageRank; NumPy seyrek matris-vektör çarpımı ile kuvvet yinelemesi.
+
+    Geçiş olasılığı u -> v: w(u, v) / Σ w(u, ·). Komşusu olmayan düğümlerin
+    payı tüm düğümlere eşit dağıtılır. L1 değişim n * tol altına inince durur;
+    max_iter içinde yakınsamazsa ValueError. nstart: önceki sonuç (sıcak başlangıç).
+    """
+    csr = as_csr(graph)
+    n = len(csr.ids)
+    if n == 0:
+        return {}
+    rows, cols, w = _matvec_arrays(csr, weighted)
+    strength = np.bincount(rows, weights=w, minlength=n)
+    dangling = strength == 0
+    inv = np.zeros(n)
+    np.divide(1.0, strength, out=inv, where=~dangling)
+
+    x = _start_vector(csr, nstart)
+    for _ in range(max_iter):
+        prev = x
+        z = prev * inv
+        x = alpha * np.bincount(rows, weights=w * z[cols], minlength=n)
+        x += (alpha * prev[dangling].sum() + (1.0 - alpha)) / n
+        if np.abs(x - prev).sum() < n * tol:
+            return dict(zip(csr.ids, x.tolist()))
+    raise ValueError(f"PageRank {max_iter} yinelemede yakınsamadı.")
+
+
+def eigenvector_centrality(graph, tol: float = 1e-6, max_iter: int = 100,
+                           nstart: Optional[Dict[int, float]] = None, weighted: bool = True) -> Dict[int, float]:
+    """
+    Ağırlıklı özvektör merkeziliği; (A + I)·x kuvvet yinelemesi (iki parçalı
+    graflarda salınımı önler), her adımda L2 normalize. L1 değişim n * tol
+    altına inince durur; max_iter içinde yakınsamazsa ValueError.
+    """
+    csr = as_csr(graph)
+    n = len(csr.ids)
+    if n == 0:
+        return {}
+    rows, cols, w = _matvec_arrays(csr, weighted)
+
+    x = _start_vector(csr, nstart)
+    for _ in range(max_iter):
+        prev = x
+        x = prev + np.bincount(rows, weights=w * prev[cols], minlength=n)
+        norm = np.linalg.norm(x)
+        if norm == 0:
+            return {nid: 0.0 for nid in csr.ids}
+        x /= norm
+        if np.abs(x - prev).sum() < n * tol:
+            return dict(zip(csr.ids, x.tolist()))
+    raise ValueError(f"Özvektör merkeziliği {max_iter} yinelemede yakınsamadı.")
@@ -0,0 +1,168 @@
+from __future__ import annotations
+import math
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from .base import as_csr
+
+
+# bir parçada aranacak en fazla (kenar, aday üçüncü köşe) çifti
+_PROBE_CHUNK = 1 << 22
+
+
+def _triangle_counts(csr) -> List[int]:
+    """
+    Düğüm başına üçgen sayısı (yoğun indeksle), O(m^1.5).
+
+    Kenarlar (derece, indeks) sırasına göre küçükten büyüğe yönlendirilir; her
+    düğümün "ileri" komşu sayısı O(sqrt(m)) ile sınırlı kalır. CSR satırları
+    sıralı olduğundan ileri kenarların u * n + v anahtarları da sıralıdır. Her
+    u -> v kenarı için iki ileri listeden kısa olanın her w'si, öbür uçtan
+    w'ye ileri kenar olarak sıralı anahtarlarda ikili aramayla (searchsorted)
+    aranır; her üçgen tam bir kez (en küçük iki köşesinin kenarından) bulunur.
+    """
+    n = len(csr.ids)
+    if n == 0:
+        return []
+    indptr = np.frombuffer(csr.indptr, dtype=np.int64)
+    indices = np.frombuffer(csr.indices, dtype=np.int64)
+    deg = np.diff(indptr)
+    rank = np.lexsort((np.arange(n), deg))
+    pos = np.empty(n, dtype=np.int64)
+    pos[rank] = np.arange(n)
+
+    # ileri kenarlar (satır ve satır içi indeks sırasıyla)
+    src = np.repeat(np.arange(n, dtype=np.int64), deg)
+    fwd = pos[indices] > pos[src]
+    fu, fv = src[fwd], indices[fwd]
+    keys = fu * n + fv
+    fdeg = np.bincount(fu, minlength=n)
+    fptr = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(fdeg, out=fptr[1:])
+
+    # kenar başına: gezilecek (kısa) satır ve aramanın yapılacağı öbür uç
+    short_u = fdeg[fu] <= fdeg[fv]
+    walk = np.where(short_u, fu, fv)
+    other = np.where(short_u, fv, fu)
+    cnt = fdeg[walk]
+    ends = np.cumsum(cnt)
+
+    tri = np.zeros(n, dtype=np.int64)
+    e0 = 0
+    while e0 < len(fu):
+        # toplam arama sayısı _PROBE_CHUNK'ı geçmeyecek kadar kenar (en az bir)
+        base = ends[e0 - 1] if e0 else 0
+        e1 = max(int(np.searchsorted(ends, base + _PROBE_CHUNK, side="right")), e0 + 1)
+        c = cnt[e0:e1]
+        total = int(c.sum())
+        if total:
+            edge = np.repeat(np.arange(e0, e1), c)
+            start = np.cumsum(c) - c
+            w = fv[fptr[walk[edge]] + np.arange(total) - np.repeat(start, c)]
+            q = other[edge] * n + w
+            j = np.searchsorted(keys, q)
+            hit = j < len(keys)
+            hit[hit] = keys[j[hit]] == q[hit]
+            edge = edge[hit]
+            for col in (fu[edge], fv[edge], w[hit]):
+                tri += np.bincount(col, minlength=n)
+        e0 = e1
+    return tri.tolist()
+
+
+def triangles(graph) -> Dict[int, int]:
+    """Her düğümün içinde bulunduğu üçgen sayısı."""
+    csr = as_csr(graph)
+    return dict(zip(csr.ids, _triangle_counts(csr)))
+
+
+def local_clustering(graph) -> Dict[int, float]:
+    """Yerel kümelenme katsayısı: C(u) = 2 T(u) / (d(u) (d(u) - 1)); d < 2 ise 0."""
+    csr = as_csr(graph)
+    indptr = csr.indptr
+    out: Dict[int, float] = {}
+    for i, (nid, t) in enumerate(zip(csr.ids, _triangle_counts(csr))):
+        d = indptr[i + 1] - indptr[i]
+        out[nid] = 2.0 * t / (d * (d - 1)) if d >= 2 else 0.0
+    return out
+
+
+def average_clustering(graph) -> float:
+    """Yerel kümelenme katsayılarının tüm düğümler üzerindeki ortalaması."""
+    local = local_clustering(graph)
+    return sum(local.values()) / len(local) if local else 0.0
+
+
+def global_clustering(graph) -> float:
+    """Geçişlilik (transitivity): 3 x üçgen sayısı / kama (wedge) sayısı."""
+    csr = as_csr(graph)
+    deg = np.diff(np.frombuffer(csr.indptr, dtype=np.int64))
+    wedges = int((deg * (deg - 1) // 2).sum())
+    if wedges == 0:
+        return 0.0
+    # her üçgen üç köşesinde birer kez sayılır
+    return sum(_triangle_counts(csr)) / wedges
+
+
+def clustering_approx(graph, samples: Optional[int] = None, epsilon: Optional[float] = None,
+                      delta: float = 0.1, seed: Optional[int] = None) -> Dict:
+    """
+    Kama (wedge) örneklemeli kümelenme kestirimi; çok büyük graflar için.
+
+    Geçişlilik: kamalar düzgün örneklenir (merkez d(d-1)/2 ağırlıkla, iki uç
+    komşu rastgele), kapalı olanların oranı kestirimdir. Ortalama yerel katsayı:
+    düğümler düzgün örneklenir, her birinden tek bir kama denenir (d < 2 ise 0).
+    samples ya da epsilon verilir: epsilon modunda örnek sayısı
+    ceil(ln(2/delta) / (2 eps^2)) olur ve her iki kestirim 1 - delta olasılıkla
+    ±eps içindedir (Hoeffding). Kapalılık testi sıralı CSR satırlarında ikili aramadır.
+
+    Döner: transitivity, average, samples, epsilon (gerçekleşen), delta.
+    """
+    if (samples is None) == (epsilon is None):
+        raise ValueError("samples ya da epsilon değerlerinden tam olarak biri verilmelidir.")
+    if not 0.0 < delta < 1.0:
+        raise ValueError("delta 0 ile 1 arasında olmalıdır.")
+    log_term = math.log(2 / delta)
+    if epsilon is not None:
+        if epsilon <= 0:
+            raise ValueError("epsilon pozitif olmalıdır.")
+        samples = math.ceil(log_term / (2 * epsilon ** 2))
+    if samples <= 0:
+        raise ValueError("samples pozitif olmalıdır.")
+    k = int(samples)
+
+    csr = as_csr(graph)
+    n = len(csr.ids)
+    indptr = np.frombuffer(csr.indptr, dtype=np.int64)
+    indices = np.frombuffer(csr.indices, dtype=np.int64)
+    deg = np.diff(indptr)
+    wedges = (deg * (deg - 1) // 2).astype(np.float64)
+    if n == 0 or wedges.sum() == 0:
+        return {"transitivity": 0.0, "average": 0.0, "samples": k,
+                "epsilon": math.sqrt(log_term / (2 * k)), "delta": delta}
+
+    rng = np.random.default_rng(seed)
+    # satırlar ve satır içi komşular artan: row * n + col genel olarak sıralı
+    keys = np.repeat(np.arange(n, dtype=np.int64), deg) * n + indices
+
+    def closed(centers: np.ndarray) -> np.ndarray:
+        d = deg[centers]
+        a = rng.integers(0, d)
+        b = rng.integers(0, d - 1)
+        b += b >= a
+        x = indices[indptr[centers] + a]
+        y = indices[indptr[centers] + b]
+        q = x * n + y
+        at = np.minimum(np.searchsorted(keys, q), len(keys) - 1)
+        return keys[at] == q
+
+    centers = rng.choice(n, size=k, p=wedges / wedges.sum())
+    transitivity = float(closed(centers).mean())
+
+    nodes = rng.integers(0, n, size=k)
+    ok = nodes[deg[nodes] >= 2]
+    average = float(closed(ok).sum() / k) if len(ok) else 0.0
+
+    return {"transitivity": transitivity, "average": average, "samples": k,
+            "epsilon": math.sqrt(log_term / (2 * k)), "delta": delta}
@@ -0,0 +1,154 @@
+from __future__ import annotations
+import random
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .base import as_csr
+
+# (indptr, indices, weights) seviye grafiği; kendi döngüleri A[i][i] olarak satırda durur
+_Level = Tuple[np.ndarray, np.ndarray, np.ndarray]
+
+
+def _renumber(labels) -> List[int]:
+    # etiketleri ilk görülme sırasına göre 0..k-1 yap
+    seen: Dict[int, int] = {}
+    return [seen.setdefault(x, len(seen)) for x in labels]
+
+
+def label_propagation(graph, seed: Optional[int] = None, max_iter: int = 100) -> Dict[int, int]:
+    """
+    Asenkron etiket yayılımı: her turda düğümler rastgele sırayla, komşularında
+    toplam ağırlığı en büyük etikete geçer (eşitlikte mevcut etiket korunur,
+    yoksa rastgele). Hiçbir etiket değişmeyince durur; tur başına O(m).
+    Döner: id -> topluluk numarası (0'dan başlayarak).
+    """
+    csr = as_csr(graph)
+    indptr, indices, weights = csr.indptr, csr.indices, csr.weights
+    n = len(csr.ids)
+    rng = random.Random(seed)
+    label = list(range(n))
+    order = list(range(n))
+
+    for _ in range(max_iter):
+        rng.shuffle(order)
+        changed = False
+        for u in order:
+            start, end = indptr[u], indptr[u + 1]
+            if start == end:
+                continue
+            score: Dict[int, float] = {}
+            for j in range(start, end):
+                lv = label[indices[j]]
+                score[lv] = score.get(lv, 0.0) + weights[j]
+            best = max(score.values())
+            cur = label[u]
+            if score.get(cur) == best:
+                continue
+            top = [lv for lv, s in score.items() if s == best]
+            label[u] = top[0] if len(top) == 1 else rng.choice(top)
+            changed = True
+        if not changed:
+            break
+
+    return dict(zip(csr.ids, _renumber(label)))
+
+
+def _local_moving(level: _Level, resolution: float, rng: random.Random) -> Tuple[List[int], bool]:
+    """Louvain 1. aşama: modülerlik artışı kalmayana kadar düğümleri komşu topluluklara taşı."""
+    indptr, indices, weights = (a.tolist() for a in level)
+    n = len(indptr) - 1
+    strength = [sum(weights[indptr[i]:indptr[i + 1]]) for i in range(n)]
+    m2 = sum(strength)
+    comm = list(range(n))
+    tot = strength[:]
+    order = list(range(n))
+    rng.shuffle(order)
+    moved_any = False
+
+    improved = True
+    while improved:
+        improved = False
+        for i in order:
+            ki = strength[i]
+            ci = comm[i]
+            links: Dict[int, float] = {}
+            for j in range(indptr[i], indptr[i + 1]):
+                v = indices[j]
+                if v != i:
+                    c = comm[v]
+                    links[c] = links.get(c, 0.0) + weights[j]
+            tot[ci] -= ki
+            # kazanç: w(i -> C) - γ · tot(C) · k_i / 2m
+            scale = resolution * ki / m2
+            best_c = ci
+            best_gain = links.get(ci, 0.0) - tot[ci] * scale
+            for c, w in links.items():
+                gain = w - tot[c] * scale
+                if gain > best_gain + 1e-12:
+                    best_gain, best_c = gain, c
+            tot[best_c] += ki
+            if best_c != ci:
+                comm[i] = best_c
+                improved = moved_any = True
+
+    return _renumber(comm), moved_any
+
+
+def _aggregate(level: _Level, comm: np.ndarray, k: int) -> _Level:
+    # topluluk grafiği: A'[c][d] = Σ A[u][v] (u ∈ c, v ∈ d); NumPy ile tek geçiş
+    indptr, indices, weights = level
+    rows = np.repeat(np.arange(len(indptr) - 1, dtype=np.int64), np.diff(indptr))
+    key = comm[rows] * k + comm[indices]
+    uniq, inv = np.unique(key, return_inverse=True)
+    w = np.bincount(inv, weights=weights)
+    src, dst = uniq // k, uniq % k
+    new_indptr = np.concatenate([[0], np.cumsum(np.bincount(src, minlength=k))]).astype(np.int64)
+    return new_indptr, dst, w
+
+
+def louvain(graph, resolution: float = 1.0, seed: Optional[int] = None, max_levels: int = 20) -> Dict[int, int]:
+    """
+    Louvain modülerlik optimizasyonu (ağırlıklı). Her seviyede yerel taşıma
+    (Python döngüsü, O(m) tur başına) ve NumPy ile topluluk grafiğine
+    indirgeme yapılır; taşıma kalmayınca durur.
+    Döner: id -> topluluk numarası (0'dan başlayarak).
+    """
+    csr = as_csr(graph)
+    n = len(csr.ids)
+    if n == 0:
+        return {}
+    level: _Level = (np.frombuffer(csr.indptr, dtype=np.int64),
+                     np.frombuffer(csr.indices, dtype=np.int64),
+                     np.frombuffer(csr.weights, dtype=np.float64))
+    if level[2].sum() == 0:
+        return {nid: i for i, nid in enumerate(csr.ids)}
+
+    rng = random.Random(seed)
+    assign = np.arange(n, dtype=np.int64)     # düğüm -> güncel seviye düğümü
+    for _ in range(max_levels):
+        comm, moved = _local_moving(level, resolution, rng)
+        if not moved:
+            break
+        comm_arr = np.asarray(comm, dtype=np.int64)
+        assign = comm_arr[assign]
+        level = _aggregate(level, comm_arr, int(comm_arr.max()) + 1)
+
+    return dict(zip(csr.ids, _renumber(assign.tolist())))
+
+
+def modularity(graph, communities: Dict[int, int], resolution: float = 1.0) -> float:
+    """Q = Σ_c [ in_c / 2m - γ (tot_c / 2m)^2 ] (ağırlıklı)."""
+    csr = as_csr(graph)
+    n = len(csr.ids)
+    indptr = np.frombuffer(csr.indptr, dtype=np.int64)
+    cols = np.frombuffer(csr.indices, dtype=np.int64)
+    w = np.frombuffer(csr.weights, dtype=np.float64)
+    m2 = w.sum()
+    if n == 0 or m2 == 0:
+        return 0.0
+    comm = np.fromiter((communities[nid] for nid in csr.ids), dtype=np.int64, count=n)
+    rows = np.repeat(np.arange(n, dtype=np.int64), np.diff(indptr))
+    inside = w[comm[rows] == comm[cols]].sum()
+    tot = np.bincount(comm[rows], weights=w)
+    return float(inside / m2 - resolution * np.sum((tot / m2) ** 2))
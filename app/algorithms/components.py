@@ -1,27 +1,58 @@
 from __future__ import annotations
-from typing import List, Set
+from typing import List, Tuple
 from collections import deque
-from .base import neighbors
+from .base import as_csr
 
 
 def connected_components(graph) -> List[List[int]]:
-    nodes = sorted(getattr(graph, "nodes", {}).keys())
-    visited: Set[int] = set()
+    # Graph union-find ile bileşenleri güncel tutuyorsa BFS'e gerek yok
+    if hasattr(graph, "components"):
+        return graph.components()
+    csr = as_csr(graph)
+    indptr, indices, ids = csr.indptr, csr.indices, csr.ids
+    visited = bytearray(len(ids))
     comps: List[List[int]] = []
 
-    for s in nodes:
-        if s in visited:
+    for s in range(len(ids)):
+        if visited[s]:
             continue
         q = deque([s])
-        visited.add(s)
+        visited[s] = 1
         comp = []
         while q:
             u = q.popleft()
-            comp.append(u)
-            for v in neighbors(graph, u):
-                if v not in visited:
-                    visited.add(v)
+            comp.append(ids[u])
+            for v in indices[indptr[u]:indptr[u + 1]]:
+                if not visited[v]:
+                    visited[v] = 1
                     q.append(v)
         comps.append(comp)
 
     return comps
+
+
+def component_labels(graph) -> Tuple[List[int], List[int]]:
+    """Yoğun indeks başına bileşen etiketi ve bileşen boyutları."""
+    csr = as_csr(graph)
+    indptr, indices = csr.indptr, csr.indices
+    n = len(csr.ids)
+    labels = [-1] * n
+    sizes: List[int] = []
+
+    for s in range(n):
+        if labels[s] >= 0:
+            continue
+        c = len(sizes)
+        labels[s] = c
+        q = deque([s])
+        size = 0
+        while q:
+            u = q.popleft()
+            size += 1
+            for v in indices[indptr[u]:indptr[u + 1]]:
+                if labels[v] < 0:
+                    labels[v] = c
+                    q.append(v)
+        sizes.append(size)
+
+    return labels, sizes
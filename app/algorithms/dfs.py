@@ -1,28 +1,65 @@
 from __future__ import annotations
-from typing import Dict, List, Optional
-from .base import neighbors
+from array import array
+from typing import Iterator, Mapping
+from .base import VisitEvent, as_csr
+from .results import TraversalResult
 
 
-def dfs(graph, start: int) -> Dict:
-    stack = [start]
-    visited = set()
-    parent: Dict[int, Optional[int]] = {start: None}
-    order: List[int] = []
+def dfs(graph, start: int) -> Mapping:
+    """{"order", "parent"}; parent düğümü yığına ilk ekleyen komşudur (bkz. TraversalResult)."""
+    csr = as_csr(graph)
+    s = csr.index.get(start)
+    if s is None:
+        return {"order": [start], "parent": {start: None}}
+
+    indptr, indices, ids = csr.indptr, csr.indices, csr.ids
+    stack = [s]
+    visited = bytearray(len(ids))
+    parent = array("q", [-2]) * len(ids)    # -2: henüz görülmedi, -1: kök
+    parent[s] = -1
+    order = array("q")
 
     while stack:
         u = stack.pop()
-        if u in visited:
+        if visited[u]:
             continue
-        visited.add(u)
+        visited[u] = 1
         order.append(u)
 
         # DFS hissi için ters sırayla push
-        ns = list(neighbors(graph, u))
-        ns.reverse()
-        for v in ns:
-            if v not in visited:
-                if v not in parent:
+        for j in range(indptr[u + 1] - 1, indptr[u] - 1, -1):
+            v = indices[j]
+            if not visited[v]:
+                if parent[v] == -2:
                     parent[v] = u
                 stack.append(v)
 
-    return {"order": order, "parent": parent}
+    return TraversalResult(csr, order, parent)
+
+
+def iter_dfs(graph, start: int) -> Iterator[VisitEvent]:
+    """
+    dfs() ile aynı ziyaret sırasında tembel DFS. Olaydaki parent, düğümü
+    yığından çıkaran DFS ağacındaki gerçek ebeveyndir; distance ağaç derinliğidir.
+    """
+    csr = as_csr(graph)
+    s = csr.index.get(start)
+    if s is None:
+        yield VisitEvent(start, None, 0)
+        return
+
+    indptr, indices, ids = csr.indptr, csr.indices, csr.ids
+    stack = [(s, -1, 0)]
+    visited = bytearray(len(ids))
+
+    while stack:
+        u, p, depth = stack.pop()
+        if visited[u]:
+            continue
+        visited[u] = 1
+        yield VisitEvent(ids[u], ids[p] if p >= 0 else None, depth)
+
+        for j in range(indptr[u + 1] - 1, indptr[u] - 1, -1):
+            v = indices[j]
+            if not visited[v]:
+                stack.append((v, u, depth + 1))
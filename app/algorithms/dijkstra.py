@@ -1,34 +1,221 @@
 from __future__ import annotations
 import heapq
-from typing import Dict, Optional, Tuple, List
-from .base import neighbors, edge_weight, reconstruct_path
+from array import array
+from typing import Iterator, Mapping, Optional, Sequence, Tuple, List
+from app.core.csr import CSRGraph
+from .base import VisitEvent, as_csr, reconstruct_path_idx, target_marks
+from .bucket_queue import bucket_params, dijkstra_buckets, prefer_buckets
+from .results import PathResult
 
+QUEUES = ("heap", "bucket", "auto")
 
-def dijkstra(graph, start: int, goal: Optional[int] = None) -> Dict:
-    dist: Dict[int, float] = {start: 0.0}
-    prev: Dict[int, Optional[int]] = {start: None}
-    pq: List[Tuple[float, int]] = [(0.0, start)]
-    seen = set()
+
+def dijkstra_arrays(csr: CSRGraph, s: int, t: int = -1, queue: str = "heap",
+                    targets: Sequence[int] = ()) -> Tuple[List[float], List[int], List[int]]:
+    """
+    CSR üzerinde Dijkstra çekirdeği (yoğun indekslerle).
+    queue: "heap" (heapq), "bucket" (kovalı kuyruk, bkz. bucket_queue) ya da
+    "auto" (kestirilen boş kova taraması edge sayısını aşmıyorsa kova, değilse
+    heap; bkz. prefer_buckets). Ağırlıklar kovaya uygun değilse (edge yok, sıfır
+    ağırlık, oran MAX_BUCKETS'ı aşıyor) "bucket" da heap'e düşer.
+    Döner: (dist, prev, reached) — reached keşif sırasıdır; t ya da targets'ın
+    tamamı settle edilince durur.
+    """
+    if queue not in QUEUES:
+        raise ValueError(f"Bilinmeyen kuyruk: {queue}")
+    if (queue == "auto" and prefer_buckets(csr)) or (queue == "bucket" and bucket_params(csr) is not None):
+        return dijkstra_buckets(csr, s, t, targets)
+
+    indptr, indices, weights = csr.indptr, csr.indices, csr.weights
+    n = len(csr.ids)
+    inf = float("inf")
+    dist = [inf] * n
+    prev = [-1] * n
+    done = bytearray(n)
+    dist[s] = 0.0
+    reached = [s]
+    pq: List[Tuple[float, int]] = [(0.0, s)]
+    heappush, heappop = heapq.heappush, heapq.heappop
+    want, remaining = target_marks(n, targets)
+
+    while pq:
+        d, u = heappop(pq)
+        if done[u]:
+            continue
+        done[u] = 1
+
+        if u == t:
+            break
+        if want is not None and want[u]:
+            remaining -= 1
+            if not remaining:
+                break
+
+        for j in range(indptr[u], indptr[u + 1]):
+            v = indices[j]
+            nd = d + weights[j]
+            if nd < dist[v]:
+                if dist[v] == inf:
+                    reached.append(v)
+                dist[v] = nd
+                prev[v] = u
+                heappush(pq, (nd, v))
+
+    return dist, prev, reached
+
+
+def dijkstra(graph, start: int, goal: Optional[int] = None, queue: str = "heap") -> Mapping:
+    """
+    {"dist", "prev", "path", "cost"}; dist/prev yoğun dizilere görünümdür, path
+    istenince kurulur (bkz. PathResult). goal verilmezse cost None'dır.
+    """
+    csr = as_csr(graph)
+    s = csr.index.get(start)
+    if s is None:
+        # start grafta yok: yalnız kendisi
+        path = [start] if goal == start else []
+        cost = (0.0 if goal == start else float("inf")) if goal is not None else None
+        return {"dist": {start: 0.0}, "prev": {start: None}, "path": path, "cost": cost}
+
+    t = csr.index.get(goal, -1) if goal is not None else None
+    dist, prev, reached = dijkstra_arrays(csr, s, -1 if t is None else t, queue)
+    return PathResult(csr, array("d", dist), array("q", prev), array("q", reached), s, t)
+
+
+def iter_dijkstra(graph, start: int, goal: Optional[int] = None) -> Iterator[VisitEvent]:
+    """
+    Düğümleri kesinleşme (settle) sırasıyla tembel üreten Dijkstra; distance
+    kesin en kısa yol maliyetidir. goal kesinleşince durur.
+    """
+    csr = as_csr(graph)
+    s = csr.index.get(start)
+    if s is None:
+        yield VisitEvent(start, None, 0.0)
+        return
+
+    indptr, indices, weights, ids = csr.indptr, csr.indices, csr.weights, csr.ids
+    n = len(ids)
+    inf = float("inf")
+    t = csr.index.get(goal, -1) if goal is not None else -1
+    dist = [inf] * n
+    prev = [-1] * n
+    done = bytearray(n)
+    dist[s] = 0.0
+    pq: List[Tuple[float, int]] = [(0.0, s)]
+    heappush, heappop = heapq.heappush, heapq.heappop
 
     while pq:
-        d, u = heapq.heappop(pq)
-        if u in seen:
+        d, u = heappop(pq)
+        if done[u]:
             continue
-        seen.add(u)
+        done[u] = 1
+        p = prev[u]
+        yield VisitEvent(ids[u], ids[p] if p >= 0 else None, d)
+
+        if u == t:
+            return
+
+        for j in range(indptr[u], indptr[u + 1]):
+            v = indices[j]
+            nd = d + weights[j]
+            if nd < dist[v]:
+                dist[v] = nd
+                prev[v] = u
+                heappush(pq, (nd, v))
+
+
+def _edge_weight_idx(csr: CSRGraph, u: int, v: int) -> float:
+    # u-v kenarının ağırlığı (yoğun indekslerle)
+    indices, weights = csr.indices, csr.weights
+    for j in range(csr.indptr[u], csr.indptr[u + 1]):
+        if indices[j] == v:
+            return weights[j]
+    raise KeyError((u, v))
+
 
-        if goal is not None and u == goal:
+def bidirectional_arrays(csr: CSRGraph, s: int, t: int):
+    """
+    İki yönlü Dijkstra çekirdeği: s'den ileri, t'den geri aynı anda arar.
+    İki kuyruğun en küçük anahtarları toplamı bulunan en iyi yol uzunluğunu (mu)
+    geçince durur. Döner: (mu, meet, dist_f, prev_f, reached_f, prev_b).
+    """
+    indptr, indices, weights = csr.indptr, csr.indices, csr.weights
+    n = len(csr.ids)
+    inf = float("inf")
+    dist_f, dist_b = [inf] * n, [inf] * n
+    prev_f, prev_b = [-1] * n, [-1] * n
+    done_f, done_b = bytearray(n), bytearray(n)
+    dist_f[s] = 0.0
+    dist_b[t] = 0.0
+    reached_f = [s]
+    pq_f: List[Tuple[float, int]] = [(0.0, s)]
+    pq_b: List[Tuple[float, int]] = [(0.0, t)]
+    heappush, heappop = heapq.heappush, heapq.heappop
+
+    mu, meet = inf, -1
+    if s == t:
+        return 0.0, s, dist_f, prev_f, reached_f, prev_b
+
+    while pq_f and pq_b:
+        if pq_f[0][0] + pq_b[0][0] >= mu:
             break
+        # küçük anahtarlı taraf bir adım ilerler
+        forward = pq_f[0][0] <= pq_b[0][0]
+        if forward:
+            pq, dist, prev, done, other = pq_f, dist_f, prev_f, done_f, dist_b
+        else:
+            pq, dist, prev, done, other = pq_b, dist_b, prev_b, done_b, dist_f
+
+        d, u = heappop(pq)
+        if done[u]:
+            continue
+        done[u] = 1
 
-        for v in neighbors(graph, u):
-            w = edge_weight(graph, u, v)
-            nd = d + w
-            if v not in dist or nd < dist[v]:
+        for j in range(indptr[u], indptr[u + 1]):
+            v = indices[j]
+            nd = d + weights[j]
+            if nd < dist[v]:
+                if forward and dist[v] == inf:
+                    reached_f.append(v)
                 dist[v] = nd
                 prev[v] = u
-                heapq.heappush(pq, (nd, v))
+                heappush(pq, (nd, v))
+            # karşı arama v'ye ulaştıysa yeni bir s-t yolu adayı var
+            if other[v] != inf and nd + other[v] < mu:
+                mu = nd + other[v]
+                meet = v
+
+    return mu, meet, dist_f, prev_f, reached_f, prev_b
+
+
+def dijkstra_bidirectional(graph, start: int, goal: Optional[int] = None) -> Mapping:
+    """
+    Noktadan noktaya sorgular için iki yönlü Dijkstra; dijkstra() ile aynı
+    sözlük şeklini döndürür. path ve cost iki yarının birleşimidir; dist/prev
+    ise yalnız ileri aramayı kapsar (geri yarıdaki düğümler eksik olabilir,
+    ileri sınırdaki etiketler kesinleşmemiş olabilir).
+    goal verilmezse ya da grafta yoksa tek yönlü dijkstra() kullanılır.
+    """
+    csr = as_csr(graph)
+    s = csr.index.get(start)
+    t = csr.index.get(goal) if goal is not None else None
+    if s is None or t is None:
+        return dijkstra(csr, start, goal)
+
+    mu, meet, dist_f, prev_f, reached_f, prev_b = bidirectional_arrays(csr, s, t)
+    reached = array("q", reached_f)
+    if meet < 0:
+        return PathResult(csr, array("d", dist_f), array("q", prev_f), reached, s, t, path=[])
 
-    path = []
-    if goal is not None:
-        path = reconstruct_path(prev, start, goal)
+    # s -> meet (ileri ağaç) + meet -> t (geri ağaç); maliyet ileri yönde toplanır.
+    # Geri parça ayrı listede kurulur; ileri diziler olduğu gibi kalır.
+    ids = csr.ids
+    path = reconstruct_path_idx(prev_f, s, meet, ids)
+    cur, d = meet, dist_f[meet]
+    while cur != t:
+        nxt = prev_b[cur]
+        d += _edge_weight_idx(csr, cur, nxt)
+        path.append(ids[nxt])
+        cur = nxt
 
-    return {"dist": dist, "prev": prev, "path": path, "cost": dist.get(goal, float("inf")) if goal is not None else None}
+    return PathResult(csr, array("d", dist_f), array("q", prev_f), reached, s, t, path=path, cost=d)
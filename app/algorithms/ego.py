@@ -0,0 +1,52 @@
+from __future__ import annotations
+from collections import deque
+from typing import Dict, List, Optional
+
+from app.core.subgraph import SubgraphView
+from .base import neighbors
+
+
+def k_hop(graph, start: int, k: int, limit: Optional[int] = None) -> Dict:
+    """
+    start'tan en fazla k hop uzaklıktaki düğümler (BFS sırasıyla, start dahil).
+    Tüm bileşen yerine yalnız k derinliğe kadar gezilir; limit verilirse o
+    kadar düğüme ulaşınca durur. CSR anlık görüntüsü kurulmaz, adj doğrudan okunur.
+
+    Döner: order (id listesi), hops (id -> hop), truncated (limit yüzünden kesildiyse True)
+    """
+    if k < 0:
+        raise ValueError("k negatif olamaz.")
+    if limit is not None and limit < 1:
+        raise ValueError("limit pozitif olmalıdır.")
+    known = graph.index if hasattr(graph, "index") else graph.nodes
+    if start not in known:
+        raise ValueError(f"Node yok: id={start}")
+
+    adj = getattr(graph, "adj", None)
+    hops: Dict[int, int] = {start: 0}
+    order: List[int] = [start]
+    q = deque([start])
+    truncated = False
+
+    while q and not truncated:
+        u = q.popleft()
+        h = hops[u]
+        if h >= k:
+            # BFS sırasında derinlik artmaz: kalan düğümler de k'da
+            break
+        nbs = sorted(adj[u]) if adj is not None else neighbors(graph, u)
+        for v in nbs:
+            if v not in hops:
+                if limit is not None and len(order) >= limit:
+                    truncated = True
+                    break
+                hops[v] = h + 1
+                order.append(v)
+                q.append(v)
+
+    return {"order": order, "hops": hops, "truncated": truncated}
+
+
+def ego_network(graph, node: int, k: int = 1, limit: Optional[int] = None) -> SubgraphView:
+    """node'un k-hop ego ağı: k_hop düğümleriyle indüklenen alt graf görünümü."""
+    return SubgraphView(graph, k_hop(graph, node, k, limit)["order"])
@@ -0,0 +1,36 @@
+from __future__ import annotations
+from typing import Dict, Tuple
+
+from app.core.core_index import core_decomposition
+from app.core.subgraph import SubgraphView
+
+
+def core_numbers(graph) -> Dict[int, int]:
+    """
+    Her düğümün k-çekirdek numarası: düğümün içinde kalabildiği en büyük k için
+    (tüm dereceleri >= k olan alt graf). Graph'ta güncel tutulan indeks varsa o
+    kullanılır; yoksa adj (CSRGraph için satırlar) üzerinde Batagelj–Zaveršnik, O(n + m).
+    """
+    if hasattr(graph, "core_numbers"):
+        return graph.core_numbers()
+    adj = getattr(graph, "adj", None)
+    if adj is None:
+        adj = {nid: set(graph.neighbors(nid)) for nid in graph.ids}
+    return core_decomposition(adj)
+
+
+def k_core(graph, k: int) -> SubgraphView:
+    """
+    Çekirdek numarası >= k olan düğümlerin indüklediği alt graf (k-çekirdek).
+    graph bir Graph, SubgraphView ya da CSRGraph olabilir; görünüm aynı grafa bakar.
+    """
+    if k < 0:
+        raise ValueError("k negatif olamaz.")
+    return SubgraphView(graph, [nid for nid, c in core_numbers(graph).items() if c >= k])
+
+
+def max_core(graph) -> Tuple[int, SubgraphView]:
+    """En yoğun çekirdek: (k_max, k_max-çekirdek alt grafı); girdi türleri k_core ile aynı."""
+    cores = core_numbers(graph)
+    k = max(cores.values(), default=0)
+    return k, SubgraphView(graph, [nid for nid, c in cores.items() if c == k])
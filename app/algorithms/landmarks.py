@@ -0,0 +1,77 @@
+from __future__ import annotations
+import weakref
+from typing import List
+
+import numpy as np
+
+from app.core.csr import CSRGraph
+from .base import as_csr
+from .dijkstra import dijkstra_arrays
+
+
+class Landmarks:
+    """
+    ALT ön işlemesi: k landmark düğümü ve her birinden tüm düğümlere uzaklıklar.
+
+    Üçgen eşitsizliğinden d(v, t) >= |d(L, t) - d(L, v)| olduğu için bu farkların
+    en büyüğü A* için kabul edilebilir (admissible) bir alt sınırdır.
+    """
+    __slots__ = ("version", "nodes", "dist")
+
+    def __init__(self, version: int, nodes: List[int], dist: np.ndarray) -> None:
+        self.version = version
+        self.nodes = nodes      # landmark yoğun indeksleri
+        self.dist = dist        # (k, n) float64, ulaşılamayan = inf
+
+    @property
+    def k(self) -> int:
+        return len(self.nodes)
+
+    def lower_bounds(self, t: int) -> List[float]:
+        """Her düğüm için t'ye olan uzaklığın alt sınırı (yoğun indeks sırasında)."""
+        if self.k == 0:
+            return [0.0] * self.dist.shape[1]
+        with np.errstate(invalid="ignore"):
+            diff = np.abs(self.dist - self.dist[:, t:t + 1])
+        # iki uç da landmark'tan ulaşılamıyorsa (inf - inf) bilgi yok: 0
+        diff[np.isnan(diff)] = 0.0
+        return diff.max(axis=0).tolist()
+
+
+def select_landmarks(csr: CSRGraph, k: int = 8) -> Landmarks:
+    """
+    En uzak nokta seçimi: en yüksek dereceli düğümle başlar, sonra seçilmiş
+    landmark'lara en uzak düğümü ekler (önce henüz kapsanmayan bileşenler).
+    """
+    n = csr.n
+    k = min(k, n)
+    dist = np.empty((k, n), dtype=np.float64)
+    nodes: List[int] = []
+    if k == 0:
+        return Landmarks(csr.version, nodes, dist)
+
+    deg = np.diff(np.frombuffer(csr.indptr, dtype=np.int64))
+    cur = int(deg.argmax())
+    closest = np.full(n, np.inf)
+    for i in range(k):
+        nodes.append(cur)
+        d, _prev, _reached = dijkstra_arrays(csr, cur, queue="auto")
+        dist[i] = d
+        closest = np.minimum(closest, dist[i])
+        closest[nodes] = -1.0
+        cur = int(closest.argmax())
+    return Landmarks(csr.version, nodes, dist)
+
+
+# CSR anlık görüntüsü başına önbellek; graph değişince freeze() yeni görüntü
+# döndürdüğü için eski kayıt kendiliğinden geçersizleşir (ve çöp toplanır).
+_cache: "weakref.WeakKeyDictionary[CSRGraph, Landmarks]" = weakref.WeakKeyDictionary()
+
+
+def get_landmarks(graph, k: int = 8) -> Landmarks:
+    csr = as_csr(graph)
+    lm = _cache.get(csr)
+    if lm is None or lm.version != csr.version or lm.k < min(k, csr.n):
+        lm = select_landmarks(csr, k)
+        _cache[csr] = lm
+    return lm
@@ -0,0 +1,120 @@
+from __future__ import annotations
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+
+from .base import as_csr
+
+_WORD = 64
+
+
+def _level_counts(words: np.ndarray, k: int) -> np.ndarray:
+    # kaynak başına yeni düğüm sayısı = bit sütunlarının toplamı
+    bitmat = np.unpackbits(words.astype("<u8").view(np.uint8).reshape(len(words), 8), axis=1, bitorder="little")
+    return bitmat[:, :k].sum(axis=0, dtype=np.int64)
+
+
+def _batch_hops(indptr: np.ndarray, indices_ext: np.ndarray, empty: np.ndarray,
+                starts: np.ndarray, max_hops: Optional[int]) -> np.ndarray:
+    """
+    En fazla 64 kaynaktan aynı anda BFS: düğüm başına bir uint64, i. bit i. kaynak.
+
+    Sınır (frontier) seyrek tutulur: (düğüm indeksleri, kelimeleri). Sınırdan
+    çıkan edge az ise yalnız onlar toplanıp hedefe göre OR'lanır (itme); çoksa
+    tüm düğümler komşularının sınır kelimelerini tek bitwise_or.reduceat ile
+    OR'lar (çekme). Böylece bir seviyenin maliyeti sınırın edge sayısıyla
+    sınırlı kalır, uzun çaplı graflarda toplam O(çap · m) olmaz.
+    Döner: (seviye sayısı, len(starts)) seviye başına yeni ulaşılan düğüm sayıları.
+    """
+    n = len(indptr) - 1
+    m = len(indices_ext) - 1
+    indices = indices_ext[:m]
+    k = len(starts)
+    bits = np.left_shift(np.uint64(1), np.arange(k, dtype=np.uint64))
+    seen = np.zeros(n, dtype=np.uint64)
+    np.bitwise_or.at(seen, starts, bits)
+    f_idx = np.flatnonzero(seen)
+    f_words = seen[f_idx]
+    levels = [np.ones(k, dtype=np.int64)]
+
+    while len(f_idx) and (max_hops is None or len(levels) <= max_hops):
+        lens = indptr[f_idx + 1] - indptr[f_idx]
+        out_edges = int(lens.sum())
+        if out_edges * 4 < m:
+            # itme: yalnız sınırdan çıkan edge'ler
+            offs = np.cumsum(lens) - lens
+            pos = np.arange(out_edges, dtype=np.int64) - np.repeat(offs - indptr[f_idx], lens)
+            dst = indices[pos]
+            words = np.repeat(f_words, lens)
+            order = np.argsort(dst, kind="stable")
+            dst, words = dst[order], words[order]
+            heads = np.flatnonzero(np.r_[True, dst[1:] != dst[:-1]]) if out_edges else np.zeros(0, dtype=np.int64)
+            tgt = dst[heads]
+            new = (np.bitwise_or.reduceat(words, heads) if out_edges else words) & ~seen[tgt]
+        else:
+            # çekme: tüm satırlar için tek reduceat (sonda 0: boş satırların dizini için)
+            frontier = np.zeros(n + 1, dtype=np.uint64)
+            frontier[f_idx] = f_words
+            nxt = np.bitwise_or.reduceat(frontier[indices_ext], indptr[:-1])
+            nxt[empty] = 0
+            nxt &= ~seen
+            tgt = np.flatnonzero(nxt)
+            new = nxt[tgt]
+        keep = new != 0
+        f_idx, f_words = tgt[keep], new[keep]
+        if not len(f_idx):
+            break
+        seen[f_idx] |= f_words
+        levels.append(_level_counts(f_words, k))
+
+    return np.stack(levels)
+
+
+def multi_source_hops(graph, sources: Optional[Iterable[int]] = None, max_hops: Optional[int] = None) -> Dict:
+    """
+    Ağırlıksız (hop) analizleri için çok kaynaklı bit-paralel BFS (MS-BFS).
+    Kaynaklar 64'lük gruplar halinde aynı anda ilerletilir.
+
+    Döner:
+      hist: kaynak id -> [h. hop'ta ulaşılan düğüm sayısı] (hist[0] == 1, kaynağın kendisi)
+      reach: kaynak id -> max_hops içinde ulaşılan düğüm sayısı (kaynak hariç)
+      avg_hops: ulaşılabilir tüm (kaynak, hedef) çiftleri için ortalama hop sayısı
+    """
+    csr = as_csr(graph)
+    ids = csr.ids
+    n = len(ids)
+    if sources is None:
+        src_idx = list(range(n))
+    else:
+        src_idx = [csr.index[s] for s in sources if s in csr.index]
+
+    indptr = np.frombuffer(csr.indptr, dtype=np.int64)
+    indices_ext = np.append(np.frombuffer(csr.indices, dtype=np.int64), n)
+    empty = indptr[1:] == indptr[:-1]
+
+    hist: Dict[int, List[int]] = {}
+    reach: Dict[int, int] = {}
+    pairs = 0
+    hop_sum = 0
+    for b in range(0, len(src_idx), _WORD):
+        starts = np.asarray(src_idx[b:b + _WORD], dtype=np.int64)
+        levels = _batch_hops(indptr, indices_ext, empty, starts, max_hops)
+        depth = np.arange(len(levels), dtype=np.int64)
+        reached = levels[1:].sum(axis=0)
+        pairs += int(reached.sum())
+        hop_sum += int((levels * depth[:, None]).sum())
+        for col, s in enumerate(starts.tolist()):
+            counts = levels[:, col].tolist()
+            while counts and counts[-1] == 0:
+                counts.pop()
+            hist[ids[s]] = counts
+            reach[ids[s]] = int(reached[col])
+
+    return {"hist": hist, "reach": reach, "avg_hops": (hop_sum / pairs) if pairs else 0.0}
+
+
+def reach_within(graph, k: int, sources: Optional[Iterable[int]] = None) -> Dict[int, int]:
+    """Her kaynak için en fazla k hop uzaklıktaki düğüm sayısı (kaynak hariç)."""
+    if k < 0:
+        raise ValueError("k negatif olamaz.")
+    return multi_source_hops(graph, sources, max_hops=k)["reach"]
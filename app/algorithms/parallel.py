@@ -0,0 +1,99 @@
+from __future__ import annotations
+import multiprocessing as mp
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Any, Callable, List, Optional, Sequence, Tuple
+
+from app.core.csr import CSRGraph
+
+# (paylaşılan bellek adı, öğe sayısı, typecode) x indptr/indices/weights
+_Handle = Tuple[int, Tuple[Tuple[str, int, str], ...]]
+
+# işçi sürecindeki CSR kopyası (initializer doldurur)
+_WORKER_CSR: Optional[CSRGraph] = None
+
+
+def default_workers() -> int:
+    return os.cpu_count() or 1
+
+
+class SharedCSR:
+    """
+    CSR dizilerini (indptr, indices, weights) bir kez paylaşılan belleğe yazar.
+    İşçilere görev başına graph yerine yalnız küçük bir handle gönderilir.
+    """
+
+    def __init__(self, csr: CSRGraph) -> None:
+        self._blocks: List[shared_memory.SharedMemory] = []
+        parts = []
+        for arr in (csr.indptr, csr.indices, csr.weights):
+            raw = arr.tobytes()
+            shm = shared_memory.SharedMemory(create=True, size=max(len(raw), 1))
+            shm.buf[:len(raw)] = raw
+            self._blocks.append(shm)
+            parts.append((shm.name, len(arr), arr.typecode))
+        self.handle: _Handle = (csr.n, tuple(parts))
+
+    def close(self) -> None:
+        for shm in self._blocks:
+            shm.close()
+            shm.unlink()
+        self._blocks.clear()
+
+    def __enter__(self) -> SharedCSR:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def attach_csr(handle: _Handle) -> CSRGraph:
+    # paylaşılan bloklardan süreç içi CSR kur (yoğun indeksler = id'ler)
+    n, parts = handle
+    arrays = []
+    for name, count, typecode in parts:
+        shm = shared_memory.SharedMemory(name=name)
+        arr = array(typecode)
+        arr.frombytes(bytes(shm.buf[:count * arr.itemsize]))
+        shm.close()
+        arrays.append(arr)
+    indptr, indices, weights = arrays
+    return CSRGraph(list(range(n)), indptr, indices, weights, array("d"), array("d"))
+
+
+def _init_worker(handle: _Handle) -> None:
+    global _WORKER_CSR
+    _WORKER_CSR = attach_csr(handle)
+
+
+def _run_chunk(fn: Callable[[CSRGraph, Sequence[int]], Any], chunk: Sequence[int]) -> Any:
+    return fn(_WORKER_CSR, chunk)
+
+
+def chunked(items: Sequence[int], size: int) -> List[Sequence[int]]:
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+
+def map_chunks(csr: CSRGraph, fn: Callable[[CSRGraph, Sequence[int]], Any], sources: Sequence[int],
+               workers: int, chunk_size: Optional[int] = None) -> List[Any]:
+    """
+    sources'u parçalara böler ve fn(csr, parça) çağrılarını workers süreçte çalıştırır.
+    Sonuçlar parça sırasıyla döner. fn modül düzeyinde (pickle edilebilir) olmalıdır.
+    workers <= 1 ise aynı çağrılar bu süreçte yapılır.
+    """
+    if chunk_size is None:
+        chunk_size = max(1, len(sources) // (max(workers, 1) * 4))
+    chunks = chunked(sources, chunk_size)
+    if workers <= 1 or len(chunks) <= 1:
+        return [fn(csr, c) for c in chunks]
+
+    # Qt süreçlerinde fork güvenli değil: işçiler spawn ile başlatılır
+    with SharedCSR(csr) as shared, ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=mp.get_context("spawn"),
+        initializer=_init_worker,
+        initargs=(shared.handle,),
+    ) as pool:
+        return list(pool.map(_run_chunk, [fn] * len(chunks), chunks))
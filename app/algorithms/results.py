@@ -0,0 +1,193 @@
+from __future__ import annotations
+from collections.abc import Mapping, Sequence
+from typing import Iterator, List, Optional, Tuple
+
+from app.core.csr import CSRGraph
+from .base import reconstruct_path_idx
+
+
+class DistMap(Mapping):
+    """
+    Yoğun uzaklık dizisi üzerinde id -> uzaklık görünümü (kopyasız).
+    Ulaşılamayan (inf) düğümler eşlemede yoktur; reached ulaşılan indekslerin
+    keşif sırasıdır, gezinti ve len onun üzerinden O(ulaşılan) çalışır.
+    """
+    __slots__ = ("_csr", "_dist", "_reached")
+
+    def __init__(self, csr: CSRGraph, dist, reached) -> None:
+        self._csr = csr
+        self._dist = dist
+        self._reached = reached
+
+    def __getitem__(self, node_id: int) -> float:
+        i = self._csr.index.get(node_id)
+        if i is None or self._dist[i] == float("inf"):
+            raise KeyError(node_id)
+        return self._dist[i]
+
+    def __iter__(self) -> Iterator[int]:
+        ids = self._csr.ids
+        return (ids[i] for i in self._reached)
+
+    def __len__(self) -> int:
+        return len(self._reached)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({len(self)} düğüm)"
+
+
+class PrevMap(DistMap):
+    """id -> önceki düğüm id'si (kaynak için None); anahtarlar DistMap ile aynı."""
+    __slots__ = ("_prev",)
+
+    def __init__(self, csr: CSRGraph, dist, reached, prev) -> None:
+        super().__init__(csr, dist, reached)
+        self._prev = prev
+
+    def __getitem__(self, node_id: int) -> Optional[int]:
+        i = self._csr.index.get(node_id)
+        if i is None or self._dist[i] == float("inf"):
+            raise KeyError(node_id)
+        p = self._prev[i]
+        return self._csr.ids[p] if p >= 0 else None
+
+
+class ParentMap(Mapping):
+    """
+    Gezinti ağacı: yoğun ebeveyn dizisi üzerinde id -> ebeveyn id'si görünümü.
+    -1 kök (None), -2 ulaşılmamış düğüm (eşlemede yok) demektir.
+    """
+    __slots__ = ("_csr", "_parent", "_len")
+
+    def __init__(self, csr: CSRGraph, parent, size: int) -> None:
+        self._csr = csr
+        self._parent = parent
+        self._len = size
+
+    def __getitem__(self, node_id: int) -> Optional[int]:
+        i = self._csr.index.get(node_id)
+        p = -2 if i is None else self._parent[i]
+        if p == -2:
+            raise KeyError(node_id)
+        return self._csr.ids[p] if p >= 0 else None
+
+    def __iter__(self) -> Iterator[int]:
+        ids = self._csr.ids
+        return (ids[i] for i, p in enumerate(self._parent) if p != -2)
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._len} düğüm)"
+
+
+class OrderView(Sequence):
+    """Yoğun indeks dizisi üzerinde id sırası (ziyaret sırası gibi); dilimler liste döner."""
+    __slots__ = ("_csr", "_idx")
+
+    def __init__(self, csr: CSRGraph, idx) -> None:
+        self._csr = csr
+        self._idx = idx
+
+    def __getitem__(self, k):
+        ids = self._csr.ids
+        if isinstance(k, slice):
+            return [ids[i] for i in self._idx[k]]
+        return ids[self._idx[k]]
+
+    def __iter__(self) -> Iterator[int]:
+        ids = self._csr.ids
+        return (ids[i] for i in self._idx)
+
+    def __len__(self) -> int:
+        return len(self._idx)
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, (list, OrderView)) and list(self) == list(other)
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+
+class TraversalResult(Mapping):
+    """bfs()/dfs() sonucu: {"order", "parent"} anahtarlı, dizi tabanlı salt okunur eşleme."""
+    __slots__ = ("order", "parent")
+
+    _KEYS = ("order", "parent")
+
+    def __init__(self, csr: CSRGraph, order, parent) -> None:
+        self.order = OrderView(csr, order)
+        self.parent = ParentMap(csr, parent, len(order))
+
+    def __getitem__(self, key: str):
+        if key not in self._KEYS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._KEYS)
+
+    def __len__(self) -> int:
+        return len(self._KEYS)
+
+
+class PathResult(Mapping):
+    """
+    dijkstra()/astar() sonucu: {dist_key, "prev", "path", "cost"} anahtarlı eşleme.
+    dist/prev yoğun dizilere kopyasız görünümdür (anahtarlar reached sırasıyla);
+    path ilk istenince prev üzerinden kurulur. target: hedefin yoğun indeksi, grafta yoksa -1, hedef
+    verilmediyse None (path boş, cost None). path/cost verilirse dist/prev
+    yerine onlar kullanılır (iki yönlü arama yolu ileri dizilerin dışında kurar).
+    """
+    __slots__ = ("_csr", "_dist", "_prev", "_reached", "_source", "_target", "_path", "_cost", "_keys")
+
+    def __init__(self, csr: CSRGraph, dist, prev, reached, source: int, target: Optional[int] = None,
+                 path: Optional[List[int]] = None, dist_key: str = "dist",
+                 cost: Optional[float] = None) -> None:
+        self._csr = csr
+        self._dist = dist
+        self._prev = prev
+        self._reached = reached
+        self._source = source
+        self._target = target
+        self._path = path
+        self._cost = cost
+        self._keys: Tuple[str, ...] = (dist_key, "prev", "path", "cost")
+
+    @property
+    def path(self) -> List[int]:
+        if self._path is None:
+            t = self._target
+            self._path = [] if t is None or t < 0 else reconstruct_path_idx(self._prev, self._source, t, self._csr.ids)
+        return self._path
+
+    @property
+    def cost(self) -> Optional[float]:
+        t = self._target
+        if t is None:
+            return None
+        if self._cost is not None:
+            return self._cost
+        return self._dist[t] if t >= 0 else float("inf")
+
+    def __getitem__(self, key: str):
+        keys = self._keys
+        if key == keys[0]:
+            return DistMap(self._csr, self._dist, self._reached)
+        if key == "prev":
+            return PrevMap(self._csr, self._dist, self._reached, self._prev)
+        if key == "path":
+            return self.path
+        if key == "cost":
+            return self.cost
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._keys)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(path={self.path!r}, cost={self.cost!r})"
@@ -0,0 +1,138 @@
+from __future__ import annotations
+from array import array
+from collections import OrderedDict
+from typing import Iterator, Mapping, Optional, Tuple
+
+import numpy as np
+
+from app.core.csr import CSRGraph
+from .base import VisitEvent, as_csr, reconstruct_path_idx
+from .dijkstra import dijkstra, dijkstra_arrays
+from .results import PathResult
+
+# (graph version, kaynak id). Ağırlık parametresi değişikliği ağırlıkları
+# set_weights ile yeniden yazar ve journal üzerinden version'ı artırır; ağırlığı
+# değişmeyen parametre değişikliğinde ağaç zaten geçerlidir. Ayrı bir parametre
+# özeti gerekmez.
+SPTKey = Tuple[int, int]
+
+
+class ShortestPathTree:
+    """
+    Tek kaynaklı en kısa yol ağacı: yoğun dist/prev dizileri ve ulaşılan
+    indeksler (keşif sırası); düğüm başına en çok 24 bayt.
+    """
+    __slots__ = ("csr", "source", "dist", "prev", "reached")
+
+    def __init__(self, csr: CSRGraph, source: int, dist: array, prev: array, reached: array) -> None:
+        self.csr = csr
+        self.source = source    # yoğun indeks
+        self.dist = dist
+        self.prev = prev
+        self.reached = reached
+
+    @classmethod
+    def build(cls, csr: CSRGraph, source: int) -> ShortestPathTree:
+        dist, prev, reached = dijkstra_arrays(csr, source, queue="auto")
+        return cls(csr, source, array("d", dist), array("q", prev), array("q", reached))
+
+    @property
+    def nbytes(self) -> int:
+        return sum(a.itemsize * len(a) for a in (self.dist, self.prev, self.reached))
+
+    def path_to(self, goal: int):
+        """Hedefe yol ve maliyet, O(yol uzunluğu)."""
+        t = self.csr.index.get(goal)
+        if t is None:
+            return [], float("inf")
+        return reconstruct_path_idx(self.prev, self.source, t, self.csr.ids), self.dist[t]
+
+    def iter_settled(self, goal: Optional[int] = None) -> Iterator[VisitEvent]:
+        """
+        Düğümleri uzaklık sırasıyla (Dijkstra'nın kesinleştirme sırası) üretir;
+        goal'e gelince durur. Yeniden arama yapılmaz, yalnız dist sıralanır.
+        """
+        dist = np.frombuffer(self.dist, dtype=np.float64)
+        reached = np.frombuffer(self.reached, dtype=np.int64)
+        order = reached[np.argsort(dist[reached], kind="stable")]
+        ids, prev = self.csr.ids, self.prev
+        t = self.csr.index.get(goal, -1) if goal is not None else -1
+        for u in order.tolist():
+            p = prev[u]
+            yield VisitEvent(ids[u], ids[p] if p >= 0 else None, self.dist[u])
+            if u == t:
+                return
+
+    def result(self, goal: Optional[int] = None, dist_key: str = "dist") -> Mapping:
+        """dijkstra() ile aynı şekil (PathResult); dist/prev dizilere kopyasız görünümdür."""
+        t = self.csr.index.get(goal, -1) if goal is not None else None
+        return PathResult(self.csr, self.dist, self.prev, self.reached, self.source, t, dist_key=dist_key)
+
+
+class SPTCache:
+    """
+    En kısa yol ağaçları için bellek sınırlı LRU önbellek.
+
+    Anahtar (version, kaynak). Graph version'ı değişince eski ağaçlar ilk
+    erişimde topluca atılır. Bir kaynağın ilk sorgusu tam ağacı kurar (tek
+    Dijkstra); o kaynaktan sonraki tüm hedefler ağaçtan O(yol uzunluğu) okunur.
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024) -> None:
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self._trees: OrderedDict[SPTKey, ShortestPathTree] = OrderedDict()
+        self._csr: Optional[CSRGraph] = None
+        self.hits = 0
+        self.misses = 0
+
+    def _sync(self, csr: CSRGraph) -> None:
+        # yeni anlık görüntü = version değişti (ya da başka bir graph): eski ağaçları at
+        if self._csr is not csr:
+            self.clear()
+            self._csr = csr
+
+    def clear(self) -> None:
+        self._trees.clear()
+        self.nbytes = 0
+
+    def get(self, graph, source: int, build: bool = True) -> Optional[ShortestPathTree]:
+        csr = as_csr(graph)
+        self._sync(csr)
+        s = csr.index.get(source)
+        if s is None:
+            return None
+        key = (csr.version, source)
+        tree = self._trees.get(key)
+        if tree is not None:
+            self._trees.move_to_end(key)
+            self.hits += 1
+            return tree
+        if not build:
+            return None
+        self.misses += 1
+        tree = ShortestPathTree.build(csr, s)
+        self._put(key, tree)
+        return tree
+
+    def _put(self, key: SPTKey, tree: ShortestPathTree) -> None:
+        if tree.nbytes > self.max_bytes:
+            return
+        self._trees[key] = tree
+        self.nbytes += tree.nbytes
+        while self.nbytes > self.max_bytes:
+            _old_key, old = self._trees.popitem(last=False)
+            self.nbytes -= old.nbytes
+
+    def shortest_path(self, graph, start: int, goal: Optional[int] = None) -> Mapping:
+        """dijkstra() sonucu; kaynağın ağacı önbellekte kurulur, hedefler ondan okunur."""
+        csr = as_csr(graph)
+        tree = self.get(csr, start)
+        if tree is None:
+            # start grafta yok
+            return dijkstra(csr, start, goal)
+        return tree.result(goal)
+
+
+# uygulama genelindeki varsayılan önbellek
+spt_cache = SPTCache()
@@ -1,33 +1,50 @@
 from __future__ import annotations
-from typing import Dict, List
-from .base import neighbors
+from typing import Dict, Iterable, List, Optional
+from .base import as_csr
 
 
-def welsh_powell_coloring(graph) -> Dict[int, int]:
-    nodes = list(getattr(graph, "nodes", {}).keys())
-    # dereceye göre azalan sırala
-    nodes.sort(key=lambda x: len(list(neighbors(graph, x))), reverse=True)
+def degree_order(csr, rows: Optional[Iterable[int]] = None) -> List[int]:
+    """
+    Dereceye göre azalan sıra; kova sıralaması ile O(n). Eşit dereceliler rows
+    sırasında kalır (verilmezse artan indeks).
+    """
+    indptr = csr.indptr
+    n = len(csr.ids)
+    deg = [indptr[i + 1] - indptr[i] for i in range(n)]
+    buckets: List[List[int]] = [[] for _ in range(max(deg, default=0) + 1)]
+    for i in (range(n) if rows is None else rows):
+        buckets[deg[i]].append(i)
+    return [i for b in reversed(buckets) for i in b]
 
-    color: Dict[int, int] = {}
-    current_color = 0
 
-    for u in nodes:
-        if u in color:
-            continue
-        color[u] = current_color
+def welsh_powell_coloring(graph) -> Dict[int, int]:
+    """
+    Welsh–Powell: derece sırasıyla her düğüme, kendinden önce boyanmış
+    komşularında olmayan en küçük rengi verir. Renk renk tüm düğümleri taramakla
+    aynı sonucu üretir, ama O(n + m): yasak renkler düğüm başına damgalanır.
+    """
+    csr = as_csr(graph)
+    indptr, indices, ids = csr.indptr, csr.indices, csr.ids
+    n = len(ids)
+    # eşitlikte graph'a eklenme sırası (graph.nodes sırası) korunur
+    index = csr.index
+    rows = [index[nid] for nid in graph.nodes] if hasattr(graph, "nodes") else None
+    nodes = degree_order(csr, rows)
 
-        for v in nodes:
-            if v in color:
-                continue
-            # v’nin aynı renge boyanması için komşularında bu renk olmamalı
-            ok = True
-            for nb in neighbors(graph, v):
-                if color.get(nb) == current_color:
-                    ok = False
-                    break
-            if ok:
-                color[v] = current_color
+    color = [-1] * n
+    # forbidden[c] == u: c rengi u'nun bir komşusunda kullanılıyor
+    forbidden: List[int] = []
 
-        current_color += 1
+    for u in nodes:
+        for j in range(indptr[u], indptr[u + 1]):
+            c = color[indices[j]]
+            if c >= 0:
+                forbidden[c] = u
+        c = 0
+        while c < len(forbidden) and forbidden[c] == u:
+            c += 1
+        if c == len(forbidden):
+            forbidden.append(-1)
+        color[u] = c
 
-    return color
+    return {ids[u]: color[u] for u in nodes}
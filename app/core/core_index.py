@@ -0,0 +1,246 @@
+from __future__ import annotations
+import heapq
+
+
+def _peel(adj: dict[int, set[int]]) -> tuple[list[int], list[int], list[int], list[list[int]]]:
+    """
+    Batagelj–Zaveršnik soyma işlemi, O(n + m).
+
+    Düğümler derecelerine göre kovalara (bin) dizilir; en küçük dereceli düğüm
+    çıkarıldıkça komşularının derecesi bir azaltılıp bir alt kovaya taşınır.
+    Çıkarıldığı andaki derece düğümün çekirdek numarasıdır.
+    Döner: (ids, çekirdek, çıkarılma sırası (vert), yoğun komşu listeleri).
+    """
+    ids = list(adj)
+    n = len(ids)
+    index = {nid: i for i, nid in enumerate(ids)}
+    nbrs = [[index[x] for x in adj[nid]] for nid in ids]
+    deg = [len(nb) for nb in nbrs]
+    max_deg = max(deg, default=0)
+
+    # bin[d]: d dereceli düğümlerin vert içindeki ilk konumu
+    bin_start = [0] * (max_deg + 1)
+    for d in deg:
+        bin_start[d] += 1
+    start = 0
+    for d in range(max_deg + 1):
+        start, bin_start[d] = start + bin_start[d], start
+    vert = [0] * n
+    pos = [0] * n
+    for v in range(n):
+        pos[v] = bin_start[deg[v]]
+        vert[pos[v]] = v
+        bin_start[deg[v]] += 1
+    for d in range(max_deg, 0, -1):
+        bin_start[d] = bin_start[d - 1]
+    bin_start[0] = 0
+
+    for i in range(n):
+        v = vert[i]
+        dv = deg[v]
+        for u in nbrs[v]:
+            du = deg[u]
+            if du > dv:
+                # u'yu kendi kovasının başına al ve kovayı bir daralt
+                pu = pos[u]
+                pw = bin_start[du]
+                w = vert[pw]
+                if u != w:
+                    pos[u], pos[w] = pw, pu
+                    vert[pu], vert[pw] = w, u
+                bin_start[du] += 1
+                deg[u] = du - 1
+
+    return ids, deg, vert, nbrs
+
+
+def core_decomposition(adj: dict[int, set[int]]) -> dict[int, int]:
+    """Batagelj–Zaveršnik k-çekirdek ayrıştırması: id -> çekirdek numarası, O(n + m)."""
+    ids, core, _vert, _nbrs = _peel(adj)
+    return dict(zip(ids, core))
+
+
+class CoreIndex:
+    """
+    Güncel tutulan k-çekirdek numaraları (sıra tabanlı bakım, Zhang vd. 2017).
+
+    Soyma sırası (k-order) saklanır: düğümler (çekirdek, etiket) ile sıralanır ve
+    her düğüm için deg_plus = sırada kendisinden sonra gelen komşu sayısı tutulur;
+    geçerli bir sırada daima deg_plus <= çekirdek. Edge eklenince yalnız öndeki
+    ucun deg_plus'ı artar; çekirdeği aşmıyorsa hiçbir şey değişmez (çoğu ekleme
+    O(1)). Aşıyorsa o seviyede yalnız uçtan sonra gelen etkilenmiş düğümler
+    sırayla taranır. Silmede düşen düğümler bir alt seviyenin sonuna taşınır.
+    Olay anındaki adj'i görmesi gerektiğinden Graph tarafından eşzamanlı çağrılır.
+    """
+
+    # etiket demeti bu uzunluğu aşınca seviye baştan numaralanır
+    MAX_LABEL_LEN = 8
+
+    def __init__(self, adj: dict[int, set[int]]) -> None:
+        self.adj = adj
+        ids, core, vert, nbrs = _peel(adj)
+        self.core: dict[int, int] = dict(zip(ids, core))
+        # seviye içi sıra etiketi: araya yer açmak için uzatılabilen demet
+        self.label: dict[int, tuple] = {}
+        self.deg_plus: dict[int, int] = {}
+        # seviye başına etiketlerin ilk öğesinin alt/üst sınırı (başa/sona ekleme için)
+        self.lo: dict[int, int] = {}
+        self.hi: dict[int, int] = {}
+        self._epoch = 0
+
+        pos = [0] * len(ids)
+        for i, v in enumerate(vert):
+            pos[v] = i
+            self.label[ids[v]] = (i,)
+            self.lo.setdefault(core[v], i)
+            self.hi[core[v]] = i
+        for v, nb in enumerate(nbrs):
+            pv = pos[v]
+            self.deg_plus[ids[v]] = sum(1 for u in nb if pos[u] > pv)
+
+    def _before(self, a: int, b: int) -> bool:
+        ca, cb = self.core[a], self.core[b]
+        return ca < cb or (ca == cb and self.label[a] < self.label[b])
+
+    def _append(self, node_id: int, k: int) -> None:
+        # k seviyesinin sonuna
+        h = self.hi.get(k, self.lo.get(k, 0) - 1) + 1
+        self.hi[k] = h
+        self.lo.setdefault(k, h)
+        self.label[node_id] = (h,)
+
+    def _relabel(self, k: int) -> None:
+        # seviyeyi sırasını koruyarak 0..s-1 ile yeniden etiketle
+        level = sorted((nid for nid, c in self.core.items() if c == k), key=self.label.__getitem__)
+        for i, nid in enumerate(level):
+            self.label[nid] = (i,)
+        self.lo[k], self.hi[k] = 0, len(level) - 1
+
+    def add_node(self, node_id: int) -> None:
+        self.core[node_id] = 0
+        self.deg_plus[node_id] = 0
+        self._append(node_id, 0)
+
+    def remove_node(self, node_id: int) -> None:
+        # bağlı edge'ler önce tek tek silinir (edge_removed)
+        self.core.pop(node_id, None)
+        self.label.pop(node_id, None)
+        self.deg_plus.pop(node_id, None)
+
+    def edge_added(self, u: int, v: int) -> None:
+        """u-v eklendikten sonra çekirdekleri ve sırayı güncelle."""
+        if self._before(v, u):
+            u, v = v, u
+        adj, core, label, deg_plus = self.adj, self.core, self.label, self.deg_plus
+        k = core[u]
+        deg_plus[u] += 1
+        if deg_plus[u] <= k:
+            return
+
+        # deg_star: düğümden önce gelen aday komşu sayısı; aday = K+1'e çıkabilecek düğüm
+        deg_star: dict[int, int] = {}
+        cand: set[int] = set()
+        cand_order: list[int] = []
+        heap = [(label[u], u)]
+        queued = {u}
+        self._epoch += 1
+        placed = 0
+        long_label = False
+
+        while heap:
+            _lab, w = heapq.heappop(heap)
+            ds = deg_star.get(w, 0)
+            if ds + deg_plus[w] > k:
+                # ileri: w aday; sonraki K komşularına destek verir
+                cand.add(w)
+                cand_order.append(w)
+                lw = label[w]
+                for x in adj[w]:
+                    if core[x] == k and label[x] > lw:
+                        deg_star[x] = deg_star.get(x, 0) + 1
+                        if x not in queued:
+                            queued.add(x)
+                            heapq.heappush(heap, (label[x], x))
+                continue
+            if ds == 0:
+                continue
+
+            # geri: w yükselemez; önündeki aday komşular artık w'den sonra sayılır
+            deg_plus[w] += ds
+            deg_star[w] = 0
+            drop: list[int] = []
+            for p in adj[w]:
+                if p in cand:
+                    deg_plus[p] -= 1
+                    if deg_star.get(p, 0) + deg_plus[p] <= k:
+                        drop.append(p)
+            anchor = label[w]
+            while drop:
+                x = drop.pop()
+                if x not in cand:
+                    continue
+                # x adaylıktan düşer ve w'nin hemen arkasına (düşme sırasıyla) taşınır
+                cand.discard(x)
+                deg_plus[x] += deg_star.get(x, 0)
+                deg_star[x] = 0
+                lx = label[x]
+                for y in adj[x]:
+                    if core[y] != k:
+                        continue
+                    if y in cand and label[y] < lx:
+                        deg_plus[y] -= 1
+                        if deg_star.get(y, 0) + deg_plus[y] <= k:
+                            drop.append(y)
+                    elif label[y] > lx and deg_star.get(y, 0) > 0:
+                        deg_star[y] -= 1
+                        if y in cand and deg_star[y] + deg_plus[y] <= k:
+                            drop.append(y)
+                placed += 1
+                label[x] = anchor + (-self._epoch, placed)
+                long_label = long_label or len(label[x]) > self.MAX_LABEL_LEN
+
+        # kalan adaylar K+1'e çıkar ve K+1 seviyesinin başına işlenme sırasıyla geçer
+        risen = [w for w in cand_order if w in cand]
+        if risen:
+            lo = self.lo.get(k + 1, self.hi.get(k + 1, 0) + 1) - len(risen)
+            self.lo[k + 1] = lo
+            self.hi.setdefault(k + 1, lo + len(risen) - 1)
+            for i, w in enumerate(risen):
+                core[w] = k + 1
+                label[w] = (lo + i,)
+        if long_label:
+            self._relabel(k)
+
+    def edge_removed(self, u: int, v: int) -> None:
+        """u-v silindikten sonra: düşen düğümleri yay ve K-1 seviyesinin sonuna taşı."""
+        adj, core, label, deg_plus = self.adj, self.core, self.label, self.deg_plus
+        if u not in core or v not in core:
+            return
+        if self._before(v, u):
+            u, v = v, u
+        deg_plus[u] -= 1
+        k = core[u]
+        # cd: çekirdeği >= K olan komşu sayısı (ilk bakışta hesaplanır)
+        cd: dict[int, int] = {}
+        stack = [w for w in (u, v) if core[w] == k]
+        while stack:
+            w = stack.pop()
+            if core[w] != k:
+                continue
+            if w not in cd:
+                cd[w] = sum(1 for x in adj[w] if core[x] >= k)
+            if cd[w] >= k:
+                continue
+            lw = label[w]
+            for x in adj[w]:
+                if core[x] == k:
+                    # x'in sayacı w düşmeden önce hesaplandıysa güncelle
+                    if x in cd:
+                        cd[x] -= 1
+                    if label[x] < lw:
+                        # w artık x'ten önce geliyor
+                        deg_plus[x] -= 1
+                    stack.append(x)
+            core[w] = k - 1
+            deg_plus[w] = cd[w]
+            self._append(w, k - 1)
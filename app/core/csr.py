@@ -0,0 +1,134 @@
+from __future__ import annotations
+from array import array
+
+import numpy as np
+
+from app.core.node_table import rows_of
+
+
+class CSRGraph:
+    """
+    Graph'ın değişmez, dizi tabanlı (CSR) anlık görüntüsü.
+
+    Düğümler artan id sırasıyla 0..n-1 yoğun indekslerine eşlenir. i. düğümün
+    komşuları indices[indptr[i]:indptr[i+1]] aralığındadır (artan sırada),
+    aynı aralıktaki weights da ilgili kenar ağırlıklarıdır.
+    """
+    __slots__ = ("ids", "index", "indptr", "indices", "weights", "xs", "ys", "version", "__weakref__")
+
+    def __init__(
+        self,
+        ids: list[int],
+        indptr: array,
+        indices: array,
+        weights: array,
+        xs: array,
+        ys: array,
+        version: int = 0,
+    ) -> None:
+        self.ids = ids
+        self.index = {nid: i for i, nid in enumerate(ids)}
+        self.indptr = indptr
+        self.indices = indices
+        self.weights = weights
+        self.xs = xs
+        self.ys = ys
+        self.version = version
+
+    @classmethod
+    def from_graph(cls, graph) -> CSRGraph:
+        nodes = getattr(graph, "nodes", {})
+        edges = getattr(graph, "edges", {})
+        ids = sorted(nodes)
+        index = {nid: i for i, nid in enumerate(ids)}
+
+        id_arr = np.asarray(ids, dtype=np.int64)
+        if edges:
+            if hasattr(edges, "arrays"):
+                # sıkıştırılmış depo (EdgeStore): uçlar ve ağırlıklar zaten dizide
+                a, b, w = edges.arrays()
+            else:
+                m = len(edges)
+                a = np.fromiter((k[0] for k in edges.keys()), dtype=np.int64, count=m)
+                b = np.fromiter((k[1] for k in edges.keys()), dtype=np.int64, count=m)
+                w = np.fromiter((float(getattr(e, "weight", 1.0)) for e in edges.values()),
+                                dtype=np.float64, count=m)
+            i, j = rows_of(id_arr, a), rows_of(id_arr, b)
+            ok = (i >= 0) & (j >= 0)
+            src = np.concatenate([i[ok], j[ok]])
+            dst = np.concatenate([j[ok], i[ok]])
+            wts = np.concatenate([w[ok], w[ok]])
+        else:
+            # edges yoksa (fallback) adj üzerinden, ağırlık 1.0
+            adj = getattr(graph, "adj", {})
+            pairs = [(index[nid], index[nb]) for nid, nbs in adj.items() if nid in index
+                     for nb in nbs if nb in index]
+            src = np.fromiter((p[0] for p in pairs), dtype=np.int64, count=len(pairs))
+            dst = np.fromiter((p[1] for p in pairs), dtype=np.int64, count=len(pairs))
+            wts = np.ones(len(pairs), dtype=np.float64)
+
+        # satır içinde komşular artan sırada
+        order = np.lexsort((dst, src))
+        counts = np.bincount(src, minlength=len(ids))
+        indptr = array("q", np.concatenate([[0], np.cumsum(counts)]).astype(np.int64).tobytes())
+        indices = array("q", dst[order].astype(np.int64).tobytes())
+        weights = array("d", wts[order].astype(np.float64).tobytes())
+
+        if hasattr(nodes, "column"):
+            # sütunlu depo (NodeTable): konumları tek seferde topla
+            rows = nodes.rows(ids)
+            xs = array("d", nodes.column("x")[rows].tobytes())
+            ys = array("d", nodes.column("y")[rows].tobytes())
+        else:
+            xs = array("d", (float(getattr(nodes[nid], "x", 0.0)) for nid in ids))
+            ys = array("d", (float(getattr(nodes[nid], "y", 0.0)) for nid in ids))
+        return cls(ids, indptr, indices, weights, xs, ys, version=getattr(graph, "version", 0))
+
+    def induced(self, node_ids) -> CSRGraph:
+        """Verilen düğümlerin indüklediği alt grafın CSR'si; yalnız onların satırları okunur."""
+        index = self.index
+        rows = np.asarray(sorted(index[nid] for nid in node_ids if nid in index), dtype=np.int64)
+        ptr = np.frombuffer(self.indptr, dtype=np.int64)
+        starts, lens = ptr[rows], ptr[rows + 1] - ptr[rows]
+        # seçili satırların komşu aralıklarını tek dizide topla
+        offs = np.cumsum(lens) - lens
+        pos = np.arange(int(lens.sum()), dtype=np.int64) - np.repeat(offs - starts, lens)
+        src = np.repeat(np.arange(len(rows), dtype=np.int64), lens)
+        dst = np.frombuffer(self.indices, dtype=np.int64)[pos]
+        wts = np.frombuffer(self.weights, dtype=np.float64)[pos]
+
+        # alt graf dışındaki komşuları at; artan satır sırası korunduğundan komşular sıralı kalır
+        new = np.full(len(self.ids), -1, dtype=np.int64)
+        new[rows] = np.arange(len(rows), dtype=np.int64)
+        keep = new[dst] >= 0
+        counts = np.bincount(src[keep], minlength=len(rows))
+        indptr = array("q", np.concatenate([[0], np.cumsum(counts)]).astype(np.int64).tobytes())
+        indices = array("q", new[dst[keep]].tobytes())
+        weights = array("d", wts[keep].tobytes())
+        xs = array("d", np.frombuffer(self.xs, dtype=np.float64)[rows].tobytes()) if len(self.xs) else array("d")
+        ys = array("d", np.frombuffer(self.ys, dtype=np.float64)[rows].tobytes()) if len(self.ys) else array("d")
+        ids = self.ids
+        return CSRGraph([ids[r] for r in rows.tolist()], indptr, indices, weights, xs, ys, version=self.version)
+
+    @property
+    def n(self) -> int:
+        return len(self.ids)
+
+    @property
+    def m(self) -> int:
+        # yönsüz: her kenar iki kez saklanır
+        return len(self.indices) // 2
+
+    # ---- node id tabanlı erişim (eski API ile uyum için) ----
+    def neighbors(self, node_id: int) -> list[int]:
+        i = self.index.get(node_id)
+        if i is None:
+            return []
+        ids = self.ids
+        return [ids[j] for j in self.indices[self.indptr[i]:self.indptr[i + 1]]]
+
+    def degree(self, node_id: int) -> int:
+        i = self.index.get(node_id)
+        if i is None:
+            return 0
+        return self.indptr[i + 1] - self.indptr[i]
@@ -0,0 +1,237 @@
+from __future__ import annotations
+from typing import Iterator
+
+import numpy as np
+
+from app.core.edge import Edge, undirected_key
+
+_MASK = (1 << 32) - 1
+
+
+def pack_key(u: int, v: int) -> int:
+    """Yönsüz (u, v) anahtarını tek 64-bit tamsayıya paketler: (min << 32) | max."""
+    a, b = undirected_key(u, v)
+    if a < 0 or b > _MASK:
+        raise ValueError("Sıkıştırılmış edge deposu 0..2^32-1 aralığında node id ister.")
+    return (a << 32) | b
+
+
+def unpack_key(k: int) -> tuple[int, int]:
+    return (k >> 32, k & _MASK)
+
+
+class EdgeView:
+    """EdgeStore içindeki bir edge'e hafif görünüm; Edge ile aynı u/v/weight alanları."""
+    __slots__ = ("_store", "_key", "u", "v")
+
+    def __init__(self, store: EdgeStore, key: int) -> None:
+        self._store = store
+        self._key = key
+        self.u, self.v = unpack_key(key)
+
+    @property
+    def weight(self) -> float:
+        return self._store._get_weight(self._key)
+
+    @weight.setter
+    def weight(self, w: float) -> None:
+        self._store._set_weight(self._key, float(w))
+
+    def __repr__(self) -> str:
+        return f"EdgeView(u={self.u}, v={self.v}, weight={self.weight})"
+
+
+class EdgeStore:
+    """
+    dict[tuple[int, int], Edge] yerine kullanılabilen sıkıştırılmış edge deposu.
+
+    Her edge paketlenmiş uint64 anahtar + float64 ağırlık olarak sıralı dizilerde
+    tutulur (arama: searchsorted). Yeni eklemeler küçük bir bekleme sözlüğünde
+    birikir ve eşik aşılınca ana dizilere toplu birleştirilir; silmeler önce
+    işaretlenir, ölü kayıtlar birikince sıkıştırılır. Dışarıya yine
+    (u, v) -> edge eşlemesi gibi görünür.
+    """
+
+    def __init__(self) -> None:
+        self._keys = np.empty(0, dtype=np.uint64)
+        self._w = np.empty(0, dtype=np.float64)
+        self._alive = np.empty(0, dtype=bool)
+        self._dead = 0
+        self._pending: dict[int, float] = {}
+
+    # ---- iç yardımcılar ----
+    def _pos(self, k: int) -> int:
+        keys = self._keys
+        i = int(np.searchsorted(keys, k))
+        if i < len(keys) and int(keys[i]) == k and self._alive[i]:
+            return i
+        return -1
+
+    def _get_weight(self, k: int) -> float:
+        w = self._pending.get(k)
+        if w is not None:
+            return w
+        i = self._pos(k)
+        if i < 0:
+            raise KeyError(unpack_key(k))
+        return float(self._w[i])
+
+    def _set_weight(self, k: int, w: float) -> None:
+        if k in self._pending:
+            self._pending[k] = w
+            return
+        i = self._pos(k)
+        if i < 0:
+            raise KeyError(unpack_key(k))
+        self._w[i] = w
+
+    def _flush(self) -> None:
+        # bekleyenleri ve ölü kayıtları ana sıralı dizilere birleştir
+        if not self._pending and not self._dead:
+            return
+        keep = self._alive
+        keys = self._keys[keep]
+        w = self._w[keep]
+        if self._pending:
+            cnt = len(self._pending)
+            pk = np.fromiter(self._pending.keys(), dtype=np.uint64, count=cnt)
+            pw = np.fromiter(self._pending.values(), dtype=np.float64, count=cnt)
+            keys = np.concatenate([keys, pk])
+            w = np.concatenate([w, pw])
+            order = np.argsort(keys, kind="stable")
+            keys = keys[order]
+            w = w[order]
+        self._keys = keys
+        self._w = w
+        self._alive = np.ones(len(keys), dtype=bool)
+        self._dead = 0
+        self._pending.clear()
+
+    def _maybe_flush(self) -> None:
+        if len(self._pending) > max(4096, len(self._keys) >> 3) or self._dead > max(4096, len(self._keys) >> 1):
+            self._flush()
+
+    # ---- toplu erişim ----
+    def arrays(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """(us, vs, weights): anahtar sırasında tüm edge'ler (us < vs)."""
+        self._flush()
+        keys = self._keys
+        return (keys >> np.uint64(32)).astype(np.int64), (keys & np.uint64(_MASK)).astype(np.int64), self._w.copy()
+
+    def insert_many(self, us, vs, weights) -> None:
+        """Doğrulanmış (var olmayan, self-loop olmayan) edge'leri toplu ekler."""
+        us = np.asarray(us, dtype=np.int64)
+        vs = np.asarray(vs, dtype=np.int64)
+        lo = np.minimum(us, vs)
+        hi = np.maximum(us, vs)
+        if len(lo) and (lo.min() < 0 or hi.max() > _MASK):
+            raise ValueError("Sıkıştırılmış edge deposu 0..2^32-1 aralığında node id ister.")
+        pk = (lo.astype(np.uint64) << np.uint64(32)) | hi.astype(np.uint64)
+        self._flush()
+        keys = np.concatenate([self._keys, pk])
+        w = np.concatenate([self._w, np.asarray(weights, dtype=np.float64)])
+        order = np.argsort(keys, kind="stable")
+        self._keys = keys[order]
+        self._w = w[order]
+        self._alive = np.ones(len(keys), dtype=bool)
+
+    def contains_many(self, us, vs) -> np.ndarray:
+        """us[i]-vs[i] edge'i depoda var mı (bool dizisi); tek searchsorted geçişi."""
+        self._flush()
+        us = np.asarray(us, dtype=np.int64)
+        vs = np.asarray(vs, dtype=np.int64)
+        lo = np.minimum(us, vs)
+        hi = np.maximum(us, vs)
+        # aralık dışı id'ler depoda olamaz
+        ok = (lo >= 0) & (hi <= _MASK)
+        k = (np.where(ok, lo, 0).astype(np.uint64) << np.uint64(32)) | np.where(ok, hi, 0).astype(np.uint64)
+        keys = self._keys
+        if not len(keys):
+            return np.zeros(len(k), dtype=bool)
+        pos = np.minimum(np.searchsorted(keys, k), len(keys) - 1)
+        return ok & (keys[pos] == k) & self._alive[pos]
+
+    def set_many(self, us, vs, weights) -> np.ndarray:
+        """Ağırlıkları vektörel yazar; değeri gerçekten değişen satırların indekslerini döndürür."""
+        self._flush()
+        us = np.asarray(us, dtype=np.int64)
+        vs = np.asarray(vs, dtype=np.int64)
+        weights = np.asarray(weights, dtype=np.float64)
+        k = (np.minimum(us, vs).astype(np.uint64) << np.uint64(32)) | np.maximum(us, vs).astype(np.uint64)
+        pos = np.searchsorted(self._keys, k)
+        if len(k) and (pos.max() >= len(self._keys) or np.any(self._keys[pos] != k)):
+            raise KeyError("set_many: olmayan edge")
+        changed = np.nonzero(self._w[pos] != weights)[0]
+        self._w[pos[changed]] = weights[changed]
+        return changed
+
+    # ---- Mapping arayüzü ----
+    def __contains__(self, key) -> bool:
+        try:
+            k = pack_key(*key)
+        except ValueError:
+            return False
+        return k in self._pending or self._pos(k) >= 0
+
+    def __getitem__(self, key) -> EdgeView:
+        k = pack_key(*key)
+        if k not in self._pending and self._pos(k) < 0:
+            raise KeyError(key)
+        return EdgeView(self, k)
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except (KeyError, ValueError):
+            return default
+
+    def __setitem__(self, key, edge) -> None:
+        k = pack_key(*key)
+        w = float(getattr(edge, "weight", 1.0))
+        if k in self._pending:
+            self._pending[k] = w
+            return
+        i = self._pos(k)
+        if i >= 0:
+            self._w[i] = w
+            return
+        self._pending[k] = w
+        self._maybe_flush()
+
+    def pop(self, key, *default):
+        try:
+            k = pack_key(*key)
+        except ValueError:
+            k = -1
+        if k in self._pending:
+            w = self._pending.pop(k)
+        else:
+            i = self._pos(k) if k >= 0 else -1
+            if i < 0:
+                if default:
+                    return default[0]
+                raise KeyError(key)
+            w = float(self._w[i])
+            self._alive[i] = False
+            self._dead += 1
+            self._maybe_flush()
+        u, v = unpack_key(k)
+        return Edge(u, v, w)
+
+    def __len__(self) -> int:
+        return len(self._keys) - self._dead + len(self._pending)
+
+    def __iter__(self) -> Iterator[tuple[int, int]]:
+        return iter(self.keys())
+
+    def keys(self) -> list[tuple[int, int]]:
+        self._flush()
+        return [unpack_key(k) for k in self._keys.tolist()]
+
+    def values(self) -> list[EdgeView]:
+        self._flush()
+        return [EdgeView(self, k) for k in self._keys.tolist()]
+
+    def items(self) -> list[tuple[tuple[int, int], EdgeView]]:
+        self._flush()
+        return [(unpack_key(k), EdgeView(self, k)) for k in self._keys.tolist()]
@@ -1,17 +1,57 @@
 from __future__ import annotations
-from dataclasses import replace
-from typing import Callable
+from dataclasses import dataclass, field, replace
+from typing import Callable, Iterable
+
+import numpy as np
 
 from app.core.node import Node
+from app.core.node_table import COLUMNS, NodeTable, rows_of
 from app.core.edge import Edge, undirected_key
+from app.core.edge_store import EdgeStore
+from app.core.csr import CSRGraph
+from app.core.journal import EventKind, GraphEvent, Journal
+from app.core.union_find import UnionFind
+from app.core.core_index import CoreIndex
 
 WeightFn = Callable[[Node, Node], float]
 
+
+@dataclass(slots=True)
+class BulkResult:
+    added: int = 0
+    # neden -> reddedilen satırların girdi içindeki sırası
+    rejected: dict[str, list[int]] = field(default_factory=dict)
+
+    @property
+    def rejected_count(self) -> int:
+        return sum(len(rows) for rows in self.rejected.values())
+
+
 class Graph:
-    def __init__(self) -> None:
-        self.nodes: dict[int, Node] = {}
-        self.edges: dict[tuple[int, int], Edge] = {}
+    def __init__(self, columnar: bool = False, compact_edges: bool = False) -> None:
+        # columnar=True: node alanları NumPy sütunlarında (NodeTable) tutulur
+        self.nodes: dict[int, Node] | NodeTable = NodeTable() if columnar else {}
+        # compact_edges=True: edge'ler paketlenmiş 64-bit anahtar + ağırlık dizilerinde (EdgeStore)
+        self.edges: dict[tuple[int, int], Edge] | EdgeStore = EdgeStore() if compact_edges else {}
         self.adj: dict[int, set[int]] = {}
+        # her değişiklik journal'a bir olay olarak yazılır; version = son olayın numarası
+        self.journal = Journal()
+        self._csr: CSRGraph | None = None
+        # degree/özellik değişen node'lar; refresh_weights yalnız bunların edge'lerini günceller
+        self._dirty: set[int] = set()
+        # bağlı bileşenler: ekleme anında birleştirilir, silmede yalnız ilgili bileşen yeniden hesaplanır
+        self._uf = UnionFind()
+        # k-çekirdek numaraları: ilk sorguda kurulur, sonra tekil edge işlemleriyle güncellenir
+        self._cores: CoreIndex | None = None
+
+    @property
+    def version(self) -> int:
+        # her değişiklikte artar; freeze() anlık görüntüsü bununla damgalanır
+        return self.journal.version
+
+    def changes_since(self, cursor: int) -> list[GraphEvent] | None:
+        """cursor version'ından sonraki olaylar; journal kırpıldıysa None (tam yeniden kurulum)."""
+        return self.journal.since(cursor)
 
     # ---- Node CRUD ----
     def add_node(self, node: Node) -> None:
@@ -19,11 +59,23 @@ class Graph:
             raise ValueError(f"Duplicate node id: {node.id}")
         self.nodes[node.id] = node
         self.adj[node.id] = set()
+        if node.id in self._uf.parent:
+            # aynı id silinmiş ama bileşeni henüz yeniden hesaplanmamış
+            self._uf.refresh(self.adj)
+        self._uf.add(node.id)
+        if self._cores is not None:
+            self._cores.add_node(node.id)
+        self.journal.append(EventKind.NODE_ADDED, node_id=node.id)
 
     def update_node(self, node_id: int, **fields) -> None:
         if node_id not in self.nodes:
             raise ValueError(f"Node yok: id={node_id}")
-        self.nodes[node_id] = replace(self.nodes[node_id], **fields)
+        if isinstance(self.nodes, NodeTable):
+            self.nodes.set_fields(node_id, **fields)
+        else:
+            self.nodes[node_id] = replace(self.nodes[node_id], **fields)
+        self._dirty.add(node_id)
+        self.journal.append(EventKind.NODE_UPDATED, node_id=node_id)
 
     def remove_node(self, node_id: int) -> None:
         if node_id not in self.nodes:
@@ -31,11 +83,76 @@ class Graph:
         # bağlı edge’leri temizle
         for nb in list(self.adj[node_id]):
             self.remove_edge(node_id, nb)
+        self._uf.mark_stale(node_id)
+        if self._cores is not None:
+            self._cores.remove_node(node_id)
         self.adj.pop(node_id, None)
         self.nodes.pop(node_id, None)
+        self._dirty.discard(node_id)
+        self.journal.append(EventKind.NODE_REMOVED, node_id=node_id)
+
+    def add_nodes_bulk(self, nodes: Iterable[Node] | None = None, *, ids=None, **columns) -> BulkResult:
+        """
+        Çok sayıda node'u tek geçişte ekler: ya Node nesneleri ya da ids + sütun
+        dizileri (name, aktiflik, etkilesim, baglanti_sayisi, x, y) verilir.
+        Tekrarlanan/var olan id'ler hata fırlatmaz, BulkResult.rejected'da raporlanır.
+        """
+        if nodes is not None:
+            nodes = list(nodes)
+            ids_arr = np.fromiter((n.id for n in nodes), dtype=np.int64, count=len(nodes))
+        else:
+            ids_arr = np.asarray(ids if ids is not None else [], dtype=np.int64)
+        n = len(ids_arr)
+        if n == 0:
+            return BulkResult()
+
+        # toplu doğrulama: grup içi tekrar (ilki kalır) + grafta zaten var
+        first = np.zeros(n, dtype=bool)
+        first[np.unique(ids_arr, return_index=True)[1]] = True
+        bad = ~first
+        if self.nodes:
+            existing = np.fromiter(self.nodes.keys(), dtype=np.int64, count=len(self.nodes))
+            bad |= np.isin(ids_arr, existing)
+        res = BulkResult()
+        if bad.any():
+            res.rejected["duplicate"] = np.nonzero(bad)[0].tolist()
+        acc = np.nonzero(~bad)[0]
+        acc_ids = ids_arr[acc].tolist()
+
+        if isinstance(self.nodes, NodeTable):
+            if nodes is not None:
+                picked = [nodes[i] for i in acc.tolist()]
+                names = [n.name for n in picked]
+                cols = {c: np.fromiter((getattr(n, c) for n in picked), dtype=dt, count=len(picked))
+                        for c, (dt, _cast) in COLUMNS.items()}
+            else:
+                names = [str(x) for x in np.asarray(columns["name"])[acc]] if "name" in columns else [""] * len(acc)
+                cols = {c: np.asarray(columns[c])[acc] for c in COLUMNS if c in columns}
+            self.nodes.append_bulk(acc_ids, names, cols)
+        elif nodes is not None:
+            for i in acc.tolist():
+                self.nodes[nodes[i].id] = nodes[i]
+        else:
+            names = np.asarray(columns["name"])[acc].tolist() if "name" in columns else [""] * len(acc)
+            cols = [np.asarray(columns[c])[acc].tolist() if c in columns else [0] * len(acc) for c in COLUMNS]
+            for nid, name, *vals in zip(acc_ids, names, *cols):
+                self.nodes[nid] = Node(nid, str(name), *vals)
+
+        uf = self._uf
+        if uf.stale:
+            uf.refresh(self.adj)
+        for nid in acc_ids:
+            self.adj[nid] = set()
+            uf.add(nid)
+        if self._cores is not None:
+            for nid in acc_ids:
+                self._cores.add_node(nid)
+        self.journal.extend(EventKind.NODE_ADDED, node_ids=acc_ids)
+        res.added = len(acc_ids)
+        return res
 
     # ---- Edge CRUD ----
-    def add_edge(self, u: int, v: int, weight_fn: WeightFn | None = None) -> Edge:
+    def add_edge(self, u: int, v: int, weight_fn: WeightFn | None = None, weight: float | None = None) -> Edge:
         if u == v:
             raise ValueError("Self-loop yasak (u == v).")
         if u not in self.nodes or v not in self.nodes:
@@ -45,22 +162,180 @@ class Graph:
             raise ValueError("Duplicate edge (yönsüz).")
 
         w = 1.0
-        if weight_fn:
+        if weight is not None:
+            w = float(weight)
+        elif weight_fn:
             w = float(weight_fn(self.nodes[u], self.nodes[v]))
 
-        e = Edge(u=key[0], v=key[1], weight=w)
-        self.edges[key] = e
+        self.edges[key] = Edge(u=key[0], v=key[1], weight=w)
         self.adj[u].add(v)
         self.adj[v].add(u)
-        return e
+        self._uf.union(u, v)
+        if self._cores is not None:
+            self._cores.edge_added(u, v)
+        self._dirty.add(u)
+        self._dirty.add(v)
+        self.journal.append(EventKind.EDGE_ADDED, edge=key, weight=w)
+        return self.edges[key]
+
+    def add_edges_bulk(self, triples: Iterable | None = None, *, us=None, vs=None, weights=None) -> BulkResult:
+        """
+        (u, v, w) üçlülerini (ya da us/vs/weights dizilerini) tek geçişte ekler.
+        Self-loop, eksik node ve (grup içi ya da mevcut) duplicate edge'ler toplu
+        doğrulanır ve hata fırlatmak yerine BulkResult.rejected'da raporlanır.
+        """
+        if triples is not None:
+            rows = triples if isinstance(triples, list) else list(triples)
+            m = len(rows)
+            us = np.fromiter((r[0] for r in rows), dtype=np.int64, count=m)
+            vs = np.fromiter((r[1] for r in rows), dtype=np.int64, count=m)
+            ws = np.fromiter((r[2] for r in rows), dtype=np.float64, count=m)
+        else:
+            us = np.asarray(us if us is not None else [], dtype=np.int64)
+            vs = np.asarray(vs if vs is not None else [], dtype=np.int64)
+            ws = np.ones(len(us)) if weights is None else np.asarray(weights, dtype=np.float64)
+            m = len(us)
+        if m == 0:
+            return BulkResult()
+
+        res = BulkResult()
+        ids = np.fromiter(self.nodes.keys(), dtype=np.int64, count=len(self.nodes))
+        ru = rows_of(ids, us)
+        rv = rows_of(ids, vs)
+
+        loop = us == vs
+        missing = ~loop & ((ru < 0) | (rv < 0))
+        ok = ~(loop | missing)
+
+        # grup içi duplicate: yönsüz satır çiftini tek int64'e paketle, ilki kalır
+        lo = np.minimum(ru, rv)
+        hi = np.maximum(ru, rv)
+        packed = (lo << 32) | hi
+        cand = np.nonzero(ok)[0]
+        first = np.zeros(m, dtype=bool)
+        first[cand[np.unique(packed[cand], return_index=True)[1]]] = True
+        dup = ok & ~first
+
+        a_ids = np.minimum(us, vs)
+        b_ids = np.maximum(us, vs)
+        acc = np.nonzero(first)[0]
+        if self.edges:
+            edges = self.edges
+            if isinstance(edges, EdgeStore):
+                exists = edges.contains_many(a_ids[acc], b_ids[acc])
+            else:
+                exists = np.fromiter(((a, b) in edges for a, b in zip(a_ids[acc].tolist(), b_ids[acc].tolist())),
+                                     dtype=bool, count=len(acc))
+            dup[acc[exists]] = True
+            acc = acc[~exists]
+
+        for reason, mask in (("self_loop", loop), ("missing_node", missing), ("duplicate", dup)):
+            if mask.any():
+                res.rejected[reason] = np.nonzero(mask)[0].tolist()
+
+        # tek geçişte edges + adj
+        edges, adj, dirty = self.edges, self.adj, self._dirty
+        a_list = a_ids[acc].tolist()
+        b_list = b_ids[acc].tolist()
+        w_list = ws[acc].tolist()
+        keys = list(zip(a_list, b_list))
+        union = self._uf.union
+        if isinstance(edges, EdgeStore):
+            edges.insert_many(a_ids[acc], b_ids[acc], ws[acc])
+            for a, b in keys:
+                adj[a].add(b)
+                adj[b].add(a)
+                union(a, b)
+        else:
+            for key, w in zip(keys, w_list):
+                a, b = key
+                edges[key] = Edge(a, b, w)
+                adj[a].add(b)
+                adj[b].add(a)
+                union(a, b)
+        if keys:
+            # toplu eklemede yerel güncelleme yerine sonraki sorguda O(n + m) yeniden kurulum
+            self._cores = None
+        self.journal.extend(EventKind.EDGE_ADDED, edges=keys, weights=w_list)
+        dirty.update(a_list)
+        dirty.update(b_list)
+        res.added = len(a_list)
+        return res
 
     def remove_edge(self, u: int, v: int) -> None:
         key = undirected_key(u, v)
-        self.edges.pop(key, None)
+        if self.edges.pop(key, None) is None:
+            return
+        self._dirty.update(n for n in key if n in self.nodes)
         if u in self.adj:
             self.adj[u].discard(v)
         if v in self.adj:
             self.adj[v].discard(u)
+        # bileşen bölünmüş olabilir: sorguda yalnız bu bileşen yeniden hesaplanır
+        self._uf.mark_stale(u)
+        if self._cores is not None:
+            self._cores.edge_removed(u, v)
+        self.journal.append(EventKind.EDGE_REMOVED, edge=key)
+
+    # ---- Bağlı bileşenler ----
+    def _components(self) -> UnionFind:
+        uf = self._uf
+        if uf.stale:
+            uf.refresh(self.adj)
+        return uf
+
+    def component_id(self, node_id: int) -> int:
+        """Bileşenin temsilci düğümü (aynı bileşendeki düğümler için aynı)."""
+        if node_id not in self.nodes:
+            raise ValueError(f"Node yok: id={node_id}")
+        return self._components().find(node_id)
+
+    def component_size(self, node_id: int) -> int:
+        if node_id not in self.nodes:
+            raise ValueError(f"Node yok: id={node_id}")
+        return self._components().size(node_id)
+
+    def same_component(self, a: int, b: int) -> bool:
+        if a not in self.nodes or b not in self.nodes:
+            return False
+        uf = self._components()
+        return uf.find(a) == uf.find(b)
+
+    def components(self) -> list[list[int]]:
+        """
+        Bileşenler, en küçük id'ye göre sıralı; her biri en küçük id'sinden
+        başlayan BFS sırasında (komşular artan id ile), eski çıktıyla aynı.
+        Üyelik union-find'dan gelir, yalnız sıralama için bileşen içi gezilir.
+        """
+        adj = self.adj
+        comps: list[list[int]] = []
+        for members in self._components().groups():
+            s = min(members)
+            seen = {s}
+            comp = [s]
+            for u in comp:
+                for v in sorted(adj[u]):
+                    if v not in seen:
+                        seen.add(v)
+                        comp.append(v)
+            comps.append(comp)
+        comps.sort(key=lambda c: c[0])
+        return comps
+
+    # ---- k-çekirdek ----
+    def _core_index(self) -> CoreIndex:
+        if self._cores is None:
+            self._cores = CoreIndex(self.adj)
+        return self._cores
+
+    def core_number(self, node_id: int) -> int:
+        if node_id not in self.nodes:
+            raise ValueError(f"Node yok: id={node_id}")
+        return self._core_index().core[node_id]
+
+    def core_numbers(self) -> dict[int, int]:
+        """id -> çekirdek numarası (kopya)."""
+        return dict(self._core_index().core)
 
     def neighbors(self, node_id: int) -> list[int]:
         return sorted(self.adj.get(node_id, set()))
@@ -72,4 +347,82 @@ class Graph:
         for e in self.edges.values():
             a = self.nodes[e.u]
             b = self.nodes[e.v]
-            e.weight = float(weight_fn(a, b))
+            self._set_weight(e, float(weight_fn(a, b)))
+        self._dirty.clear()
+
+    def mark_clean(self, node_ids=None) -> None:
+        """Ağırlıkları dışarıda toplu yeniden hesaplanan düğümleri dirty kümesinden çıkar (None: hepsi)."""
+        if node_ids is None:
+            self._dirty.clear()
+        else:
+            self._dirty.difference_update(node_ids)
+
+    def _set_weight(self, e: Edge, w: float) -> None:
+        # yalnız gerçekten değişen ağırlık olay üretir
+        if e.weight != w:
+            e.weight = w
+            self.journal.append(EventKind.WEIGHT_CHANGED, edge=(e.u, e.v), weight=w)
+
+    def refresh_weights(self, weight_fn: WeightFn, sync_degree: bool = False) -> list[tuple[int, int]]:
+        """
+        Yalnız dirty node'lara bağlı edge'lerin ağırlığını yeniden hesaplar (O(deg)).
+        sync_degree=True ise önce dirty node'ların baglanti_sayisi = degree yapılır.
+        Güncellenen edge key'lerini döndürür.
+        """
+        dirty = self._dirty
+        if not dirty:
+            return []
+        if sync_degree:
+            for nid in dirty:
+                deg = len(self.adj[nid])
+                if self.nodes[nid].baglanti_sayisi != deg:
+                    self.nodes[nid].baglanti_sayisi = deg
+                    self.journal.append(EventKind.NODE_UPDATED, node_id=nid)
+
+        keys = {undirected_key(nid, nb) for nid in dirty for nb in self.adj[nid]}
+        for key in keys:
+            e = self.edges[key]
+            self._set_weight(e, float(weight_fn(self.nodes[e.u], self.nodes[e.v])))
+        dirty.clear()
+        return sorted(keys)
+
+    def set_weights(self, keys, weights) -> None:
+        # toplu ağırlık yazımı (keys ile weights aynı sırada)
+        edges = self.edges
+        if isinstance(edges, EdgeStore):
+            ends = np.asarray(keys, dtype=np.int64).reshape(-1, 2)
+            self.set_weights_arrays(ends[:, 0], ends[:, 1], weights)
+            return
+        changed_keys: list[tuple[int, int]] = []
+        changed_w: list[float] = []
+        for key, w in zip(keys, weights.tolist() if hasattr(weights, "tolist") else weights):
+            e = edges[key]
+            if e.weight != w:
+                e.weight = float(w)
+                changed_keys.append((e.u, e.v))
+                changed_w.append(e.weight)
+        self.journal.extend(EventKind.WEIGHT_CHANGED, edges=changed_keys, weights=changed_w)
+
+    def set_weights_arrays(self, us, vs, weights) -> None:
+        """set_weights'in dizi sürümü: us[i]-vs[i] edge'ine weights[i] yazılır."""
+        edges = self.edges
+        if not isinstance(edges, EdgeStore):
+            self.set_weights(list(zip(np.minimum(us, vs).tolist(), np.maximum(us, vs).tolist())), weights)
+            return
+        us = np.asarray(us, dtype=np.int64)
+        vs = np.asarray(vs, dtype=np.int64)
+        weights = np.asarray(weights, dtype=np.float64)
+        changed = edges.set_many(us, vs, weights)
+        # journal yalnız kırpmadan sağ çıkacak olayları listeye çevirir
+        keys = np.column_stack((np.minimum(us[changed], vs[changed]), np.maximum(us[changed], vs[changed])))
+        self.journal.extend(EventKind.WEIGHT_CHANGED, edges=keys, weights=weights[changed])
+
+    # ---- Anlık görüntü ----
+    def freeze(self) -> CSRGraph:
+        """Algoritmalar için değişmez CSR görüntüsü (version değişmedikçe önbellekten)."""
+        csr = self._csr
+        if csr is None or csr.version != self.version:
+            csr = CSRGraph.from_graph(self)
+            self._csr = csr
+        return csr
+
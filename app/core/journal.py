@@ -0,0 +1,111 @@
+from __future__ import annotations
+from dataclasses import dataclass
+from enum import Enum
+
+
+class EventKind(str, Enum):
+    NODE_ADDED = "node_added"
+    NODE_UPDATED = "node_updated"
+    NODE_REMOVED = "node_removed"
+    EDGE_ADDED = "edge_added"
+    EDGE_REMOVED = "edge_removed"
+    WEIGHT_CHANGED = "weight_changed"
+
+
+@dataclass(slots=True)
+class GraphEvent:
+    version: int            # olay uygulandıktan sonraki graph.version
+    kind: EventKind
+    node_id: int | None = None
+    edge: tuple[int, int] | None = None   # undirected_key
+    weight: float | None = None           # EDGE_ADDED / WEIGHT_CHANGED için yeni ağırlık
+
+
+class Journal:
+    """
+    Graph değişikliklerinin sadece eklenen (append-only) kaydı.
+
+    events[i].version == base + i + 1. Abone, en son işlediği version'ı imleç
+    olarak tutar ve since(imleç) ile yalnız yeni olayları alır. Kayıt max_events'i
+    aşınca en eski olaylar atılır; bu kadar geride kalan imleçler için since()
+    None döner ve abonenin tam yeniden kurulum yapması gerekir.
+    """
+
+    def __init__(self, max_events: int = 200_000) -> None:
+        self.max_events = max_events
+        self.base = 0
+        self.events: list[GraphEvent] = []
+
+    @property
+    def version(self) -> int:
+        return self.base + len(self.events)
+
+    def append(self, kind: EventKind, node_id: int | None = None,
+               edge: tuple[int, int] | None = None, weight: float | None = None) -> GraphEvent:
+        ev = GraphEvent(self.version + 1, kind, node_id, edge, weight)
+        self.events.append(ev)
+        self._trim()
+        return ev
+
+    def _trim(self) -> None:
+        if len(self.events) > self.max_events:
+            drop = len(self.events) - self.max_events // 2
+            del self.events[:drop]
+            self.base += drop
+
+    def extend(self, kind: EventKind, node_ids=None, edges=None, weights=None) -> None:
+        """
+        Toplu işlemler için: aynı türden çok sayıda olayı tek seferde ekler.
+
+        Sonuç _trim ile aynıdır, ama kırpmada hemen atılacak baştaki olaylar hiç
+        oluşturulmaz; yalnız base ilerler. Girdiler dilimlenebilir olmalıdır; edges
+        (k, 2) NumPy dizisi, weights NumPy dizisi de olabilir.
+        """
+        items = node_ids if node_ids is not None else edges
+        count = len(items)
+        skip = 0
+        total = len(self.events) + count
+        if total > self.max_events:
+            drop = total - self.max_events // 2
+            old = min(drop, len(self.events))
+            del self.events[:old]
+            skip = drop - old
+            self.base += drop
+
+        start = self.version + 1
+        if node_ids is not None:
+            node_ids = node_ids[skip:]
+            if hasattr(node_ids, "tolist"):
+                node_ids = node_ids.tolist()
+            self.events.extend(GraphEvent(start + i, kind, nid) for i, nid in enumerate(node_ids))
+            return
+        edges = edges[skip:]
+        if hasattr(edges, "tolist"):
+            edges = list(map(tuple, edges.tolist()))
+        if weights is not None:
+            weights = weights[skip:]
+            if hasattr(weights, "tolist"):
+                weights = weights.tolist()
+            self.events.extend(GraphEvent(start + i, kind, None, key, w)
+                               for i, (key, w) in enumerate(zip(edges, weights)))
+        else:
+            self.events.extend(GraphEvent(start + i, kind, None, key) for i, key in enumerate(edges))
+
+    def since(self, cursor: int) -> list[GraphEvent] | None:
+        if cursor < self.base:
+            return None
+        return self.events[cursor - self.base:]
+
+    def touched(self, cursor: int) -> tuple[set[int], set[tuple[int, int]]] | None:
+        """İmleçten bu yana değişen node id'leri ve edge key'leri (birleştirilmiş)."""
+        events = self.since(cursor)
+        if events is None:
+            return None
+        nodes: set[int] = set()
+        edges: set[tuple[int, int]] = set()
+        for ev in events:
+            if ev.edge is not None:
+                edges.add(ev.edge)
+            else:
+                nodes.add(ev.node_id)
+        return nodes, edges
@@ -74,6 +74,79 @@ class MySqlStorageService:
         finally:
             con.close()
 
+    @staticmethod
+    def save_changes(graph: Graph, since_version: int, graph_id: int = 1, name: str = "SocialGraph") -> int:
+        """
+        since_version'dan bu yana journal'daki değişiklikleri yazar (O(değişiklik)).
+        Journal o kadar geriye gitmiyorsa save_graph ile tam kayda düşer.
+        Bir sonraki çağrı için imleç olarak graph.version döner.
+        """
+        touched = graph.journal.touched(since_version)
+        if touched is None:
+            MySqlStorageService.save_graph(graph, graph_id, name)
+            return graph.version
+        node_ids, edge_keys = touched
+        if not node_ids and not edge_keys:
+            return graph.version
+
+        con = MySqlStorageService._connect()
+        try:
+            cur = con.cursor()
+            con.start_transaction()
+
+            # önce silinen/değişen edge'ler (node silmeden önce)
+            for (u, v) in edge_keys:
+                cur.execute(
+                    "DELETE FROM edges WHERE graph_id=%s AND u_id=%s AND v_id=%s",
+                    (graph_id, int(u), int(v)),
+                )
+
+            for nid in node_ids:
+                n = graph.nodes.get(nid)
+                if n is None:
+                    cur.execute("DELETE FROM nodes WHERE graph_id=%s AND node_id=%s", (graph_id, int(nid)))
+                    continue
+                cur.execute(
+                    """
+                    INSERT INTO nodes(graph_id, node_id, name, aktiflik, etkilesim, baglanti_sayisi, x, y)
+                    VALUES (%s,%s,%s,%s,%s,%s,%s,%s)
+                    ON DUPLICATE KEY UPDATE name=VALUES(name), aktiflik=VALUES(aktiflik),
+                        etkilesim=VALUES(etkilesim), baglanti_sayisi=VALUES(baglanti_sayisi),
+                        x=VALUES(x), y=VALUES(y)
+                    """,
+                    (
+                        graph_id,
+                        int(nid),
+                        str(getattr(n, "name", "")),
+                        float(getattr(n, "aktiflik", 0.0)),
+                        float(getattr(n, "etkilesim", 0.0)),
+                        int(getattr(n, "baglanti_sayisi", 0)),
+                        float(getattr(n, "x", 0.0)),
+                        float(getattr(n, "y", 0.0)),
+                    ),
+                )
+
+            # hâlâ var olan edge'leri son ağırlıklarıyla geri yaz
+            for key in edge_keys:
+                e = graph.edges.get(key)
+                if e is None:
+                    continue
+                cur.execute(
+                    """
+                    INSERT INTO edges(graph_id, u_id, v_id, weight)
+                    VALUES (%s,%s,%s,%s)
+                    """,
+                    (graph_id, int(key[0]), int(key[1]), float(getattr(e, "weight", 1.0))),
+                )
+
+            con.commit()
+        except Exception:
+            con.rollback()
+            raise
+        finally:
+            con.close()
+        return graph.version
+
     @staticmethod
     def load_graph(graph_id: int = 1) -> Graph:
         con = MySqlStorageService._connect()
@@ -90,11 +163,10 @@ class MySqlStorageService:
                 """,
                 (graph_id,),
             )
-            for node_id, name, aktiflik, etkilesim, baglanti, x, y in cur.fetchall():
-                n = Node(int(node_id), str(name), float(aktiflik), float(etkilesim), int(baglanti))
-                setattr(n, "x", float(x))
-                setattr(n, "y", float(y))
-                g.add_node(n)
+            g.add_nodes_bulk(
+                Node(int(node_id), str(name), float(aktiflik), float(etkilesim), int(baglanti), float(x), float(y))
+                for node_id, name, aktiflik, etkilesim, baglanti, x, y in cur.fetchall()
+            )
 
             cur.execute(
                 """
@@ -104,9 +176,8 @@ class MySqlStorageService:
                 """,
                 (graph_id,),
             )
-            for u, v, w in cur.fetchall():
-                # weight direkt DB'den
-                g.add_edge(int(u), int(v), weight=float(w))
+            # weight direkt DB'den
+            g.add_edges_bulk((int(u), int(v), float(w)) for u, v, w in cur.fetchall())
 
             return g
         finally:
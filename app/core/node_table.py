@@ -0,0 +1,203 @@
+from __future__ import annotations
+from typing import Iterator
+
+import numpy as np
+
+from app.core.node import Node
+
+# sütun adı -> (numpy dtype, python tipi)
+COLUMNS: dict[str, tuple[type, type]] = {
+    "aktiflik": (np.float64, float),
+    "etkilesim": (np.float64, float),
+    "baglanti_sayisi": (np.int64, int),
+    "x": (np.float64, float),
+    "y": (np.float64, float),
+}
+
+
+def rows_of(ids: np.ndarray, query: np.ndarray) -> np.ndarray:
+    """query içindeki id'lerin ids dizisindeki konumları; bulunamayanlar -1."""
+    query = np.asarray(query, dtype=np.int64)
+    if len(ids) == 0:
+        return np.full(len(query), -1, dtype=np.int64)
+    lo = int(ids.min())
+    span = int(ids.max()) - lo + 1
+    if span <= 4 * len(ids) + 1024:
+        # id'ler yoğunsa doğrudan tablo
+        table = np.full(span, -1, dtype=np.int64)
+        table[ids - lo] = np.arange(len(ids), dtype=np.int64)
+        inside = (query >= lo) & (query < lo + span)
+        out = np.full(len(query), -1, dtype=np.int64)
+        out[inside] = table[query[inside] - lo]
+        return out
+    sorter = np.argsort(ids, kind="stable")
+    pos = np.searchsorted(ids, query, sorter=sorter)
+    pos[pos == len(ids)] = 0
+    out = sorter[pos]
+    out[ids[out] != query] = -1
+    return out
+
+
+def _column_property(name: str, cast: type) -> property:
+    def fget(self: NodeView):
+        t = self._table
+        return cast(t._cols[name][t.index[self.id]])
+
+    def fset(self: NodeView, value) -> None:
+        t = self._table
+        t._cols[name][t.index[self.id]] = value
+
+    return property(fget, fset)
+
+
+class NodeView:
+    """NodeTable içindeki bir satıra hafif görünüm; Node ile aynı alanları okur/yazar."""
+    __slots__ = ("_table", "id")
+
+    def __init__(self, table: NodeTable, node_id: int) -> None:
+        self._table = table
+        self.id = node_id
+
+    aktiflik = _column_property("aktiflik", float)
+    etkilesim = _column_property("etkilesim", float)
+    baglanti_sayisi = _column_property("baglanti_sayisi", int)
+    x = _column_property("x", float)
+    y = _column_property("y", float)
+
+    @property
+    def name(self) -> str:
+        t = self._table
+        return t._names[t.index[self.id]]
+
+    @name.setter
+    def name(self, value: str) -> None:
+        t = self._table
+        t._names[t.index[self.id]] = value
+
+    def to_node(self) -> Node:
+        return Node(self.id, self.name, self.aktiflik, self.etkilesim, self.baglanti_sayisi, self.x, self.y)
+
+    def __repr__(self) -> str:
+        return f"NodeView({self.to_node()!r})"
+
+
+class NodeTable:
+    """
+    Node alanlarını yoğun indeksli, bitişik NumPy dizilerinde tutan sütunlu depo.
+
+    dict[int, Node] yerine kullanılabilir: graph.nodes[nid].aktiflik gibi erişimler
+    NodeView üzerinden çalışır, toplu işlemler column() ile tüm sütunu kopyasız okur.
+    Silmede son satır boşalan yere taşınır; satır indeksleri bu yüzden kalıcı değildir.
+    """
+
+    def __init__(self, capacity: int = 16) -> None:
+        self.index: dict[int, int] = {}
+        self.ids: list[int] = []
+        self._names: list[str] = []
+        self._cols: dict[str, np.ndarray] = {
+            name: np.zeros(max(capacity, 1), dtype=dtype) for name, (dtype, _cast) in COLUMNS.items()
+        }
+
+    # ---- toplu erişim ----
+    def column(self, name: str) -> np.ndarray:
+        """Canlı sütun görünümü (kopya değil); i. eleman ids[i] düğümüne aittir."""
+        return self._cols[name][:len(self.ids)]
+
+    def rows(self, node_ids) -> np.ndarray:
+        index = self.index
+        return np.fromiter((index[nid] for nid in node_ids), dtype=np.int64)
+
+    def reserve(self, capacity: int) -> None:
+        cur = len(next(iter(self._cols.values())))
+        if capacity <= cur:
+            return
+        new_cap = max(capacity, cur * 2)
+        for name, arr in self._cols.items():
+            grown = np.zeros(new_cap, dtype=arr.dtype)
+            grown[:len(self.ids)] = arr[:len(self.ids)]
+            self._cols[name] = grown
+
+    def append_bulk(self, node_ids: list[int], names: list[str], columns: dict[str, np.ndarray]) -> None:
+        """Yeni (var olmayan) id'leri sütunlara tek dilim ataması ile ekler."""
+        start = len(self.ids)
+        end = start + len(node_ids)
+        self.reserve(end)
+        for name, arr in self._cols.items():
+            col = columns.get(name)
+            arr[start:end] = 0 if col is None else col
+        self.index.update(zip(node_ids, range(start, end)))
+        self.ids.extend(node_ids)
+        self._names.extend(names)
+
+    # ---- satır işlemleri ----
+    def set_fields(self, node_id: int, **fields) -> None:
+        row = self.index[node_id]
+        for name, value in fields.items():
+            if name == "name":
+                self._names[row] = str(value)
+            elif name in self._cols:
+                self._cols[name][row] = value
+            else:
+                raise AttributeError(f"Node alanı yok: {name}")
+
+    def __setitem__(self, node_id: int, node) -> None:
+        row = self.index.get(node_id)
+        if row is None:
+            row = len(self.ids)
+            self.reserve(row + 1)
+            self.index[node_id] = row
+            self.ids.append(node_id)
+            self._names.append("")
+        self._names[row] = str(getattr(node, "name", ""))
+        for name, arr in self._cols.items():
+            arr[row] = getattr(node, name, 0)
+
+    def pop(self, node_id: int, *default):
+        row = self.index.get(node_id)
+        if row is None:
+            if default:
+                return default[0]
+            raise KeyError(node_id)
+        node = NodeView(self, node_id).to_node()
+
+        last = len(self.ids) - 1
+        if row != last:
+            moved = self.ids[last]
+            self.ids[row] = moved
+            self._names[row] = self._names[last]
+            for arr in self._cols.values():
+                arr[row] = arr[last]
+            self.index[moved] = row
+        self.ids.pop()
+        self._names.pop()
+        del self.index[node_id]
+        return node
+
+    # ---- Mapping arayüzü ----
+    def __getitem__(self, node_id: int) -> NodeView:
+        if node_id not in self.index:
+            raise KeyError(node_id)
+        return NodeView(self, node_id)
+
+    def get(self, node_id: int, default=None):
+        if node_id not in self.index:
+            return default
+        return NodeView(self, node_id)
+
+    def __contains__(self, node_id) -> bool:
+        return node_id in self.index
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(list(self.ids))
+
+    def keys(self) -> list[int]:
+        return list(self.ids)
+
+    def values(self) -> list[NodeView]:
+        return [NodeView(self, nid) for nid in self.ids]
+
+    def items(self) -> list[tuple[int, NodeView]]:
+        return [(nid, NodeView(self, nid)) for nid in self.ids]
@@ -53,33 +53,38 @@ class StorageService:
 
         g = Graph()
 
-        # nodes
-        for row in data.get("nodes", []):
-            n = Node(
+        # nodes (konum varsa yükle)
+        res = g.add_nodes_bulk(
+            Node(
                 id=int(row["id"]),
                 name=str(row.get("name", "")),
                 aktiflik=float(row.get("aktiflik", 0.0)),
                 etkilesim=float(row.get("etkilesim", 0.0)),
                 baglanti_sayisi=int(row.get("baglanti_sayisi", 0)),
+                x=float(row.get("x", 0.0)),
+                y=float(row.get("y", 0.0)),
             )
-            # konum varsa yükle
-            n.x = float(row.get("x", 0.0))
-            n.y = float(row.get("y", 0.0))
-            g.add_node(n)
+            for row in data.get("nodes", [])
+        )
+        StorageService._check_bulk("node", res)
 
         # edges
-        for row in data.get("edges", []):
-            u = int(row["u"])
-            v = int(row["v"])
-            w = float(row.get("weight", 1.0))
-
-            # add_edge weight param kabul etmese bile güvenli set edeceğiz
-            e = g.add_edge(u, v, weight_fn=None)
-            if hasattr(e, "weight"):
-                e.weight = w
+        res = g.add_edges_bulk(
+            (int(row["u"]), int(row["v"]), float(row.get("weight", 1.0)))
+            for row in data.get("edges", [])
+        )
+        StorageService._check_bulk("edge", res)
 
         return g
 
+    @staticmethod
+    def _check_bulk(what: str, res) -> None:
+        # toplu eklemede reddedilen satırları tek hata mesajında raporla
+        if res.rejected:
+            detail = ", ".join(f"{reason}={len(rows)}" for reason, rows in res.rejected.items())
+            raise ValueError(f"Geçersiz {what} satırları ({detail}); ilkleri: "
+                             f"{ {reason: rows[:5] for reason, rows in res.rejected.items()} }")
+
     # ---------------- CSV ----------------
     @staticmethod
     def load_csv(path: str) -> Graph:
@@ -98,6 +103,7 @@ class StorageService:
             return ""
 
         # 1) Node'ları ekle
+        nodes: list[Node] = []
         for r in rows:
             nid = int(get_col(r, "DugumId", "dugumId", "id"))
             aktiflik = float(get_col(r, "Aktiflik", "aktiflik", "Activity").replace(",", ".") or "0")
@@ -106,15 +112,17 @@ class StorageService:
             _baglanti = get_col(r, "Baglanti Sayisi", "BaglantiSayisi", "baglanti", "Degree")
             baglanti = int(_baglanti) if _baglanti else 0
 
-            g.add_node(Node(
+            nodes.append(Node(
                 id=nid,
                 name=str(nid),
                 aktiflik=aktiflik,
                 etkilesim=etkilesim,
                 baglanti_sayisi=baglanti,
             ))
+        StorageService._check_bulk("node", g.add_nodes_bulk(nodes))
 
-        # 2) Komşulardan edge kur
+        # 2) Komşulardan edge kur (ağırlık 4. adımda toplu hesaplanır)
+        pairs: list[tuple[int, int, float]] = []
         for r in rows:
             u = int(get_col(r, "DugumId", "dugumId", "id"))
             komsular = get_col(r, "Komsular", "Komşular", "neighbors", "Neighbors")
@@ -127,20 +135,16 @@ class StorageService:
                     v = int(p)
                 except ValueError:
                     continue
-                if v not in g.nodes:
-                    continue
-                try:
-                    g.add_edge(u, v, weight_fn=WeightService.compute)
-                except ValueError:
-                    # duplicate / self-loop vs.
-                    pass
+                pairs.append((u, v, 1.0))
+        # duplicate / self-loop / bilinmeyen komşu satırları sessizce atlanır
+        g.add_edges_bulk(pairs)
 
         # 3) Bağlantı sayısını gerçek degree’den güncelle (komşulardan türetelim)
         for nid in g.nodes:
             g.nodes[nid].baglanti_sayisi = g.degree(nid)
 
-        # 4) Weight'leri garanti olsun diye tekrar hesapla
-        g.recompute_all_weights(WeightService.compute)
+        # 4) Weight'leri degree güncellemesinden sonra tek seferde hesapla
+        WeightService.compute_batch(g)
 
         return g
 
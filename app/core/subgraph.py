@@ -0,0 +1,93 @@
+from __future__ import annotations
+from typing import Iterable, Iterator
+
+from app.core.csr import CSRGraph
+from app.core.edge import Edge, undirected_key
+
+
+class SubgraphView:
+    """
+    Graph'ın verilen düğüm kümesiyle indüklenen alt grafı (kopyasız görünüm).
+
+    Yalnız düğüm id kümesi tutulur; komşuluk ve edge'ler her erişimde ana
+    graftan süzülür, maliyet alt grafın boyutuyla orantılıdır. Ana graf
+    değişirse görünüm de değişikliği görür. graph bir CSRGraph da olabilir; o
+    durumda komşular CSR satırlarından okunur, nodes değerleri None'dır (Node
+    nesnesi yoktur) ve freeze() satırları doğrudan süzer.
+    """
+    __slots__ = ("graph", "node_ids")
+
+    def __init__(self, graph, node_ids: Iterable[int]) -> None:
+        self.graph = graph
+        known = graph.index if isinstance(graph, CSRGraph) else graph.nodes
+        self.node_ids = frozenset(nid for nid in node_ids if nid in known)
+
+    def _nbrs(self, node_id: int):
+        # ana graftaki komşular (alt küme süzülmeden)
+        graph = self.graph
+        if isinstance(graph, CSRGraph):
+            return graph.neighbors(node_id)
+        return graph.adj[node_id]
+
+    @property
+    def version(self) -> int:
+        return getattr(self.graph, "version", 0)
+
+    @property
+    def nodes(self) -> dict:
+        if isinstance(self.graph, CSRGraph):
+            return dict.fromkeys(self.node_ids)
+        nodes = self.graph.nodes
+        return {nid: nodes[nid] for nid in self.node_ids}
+
+    @property
+    def adj(self) -> dict[int, set[int]]:
+        keep = self.node_ids
+        return {nid: keep.intersection(self._nbrs(nid)) for nid in keep}
+
+    @property
+    def edges(self) -> dict:
+        graph = self.graph
+        if isinstance(graph, CSRGraph):
+            ids, index, indptr, indices, weights = graph.ids, graph.index, graph.indptr, graph.indices, graph.weights
+            keep = self.node_ids
+            out = {}
+            for u in keep:
+                i = index[u]
+                for p in range(indptr[i], indptr[i + 1]):
+                    v = ids[indices[p]]
+                    if u < v and v in keep:
+                        out[(u, v)] = Edge(u, v, weights[p])
+            return out
+        edges = graph.edges
+        return {key: edges[key] for key in self.edge_keys()}
+
+    def edge_keys(self) -> Iterator[tuple[int, int]]:
+        keep = self.node_ids
+        for u in keep:
+            for v in self._nbrs(u):
+                if u < v and v in keep:
+                    yield undirected_key(u, v)
+
+    def neighbors(self, node_id: int) -> list[int]:
+        if node_id not in self.node_ids:
+            return []
+        return sorted(self.node_ids.intersection(self._nbrs(node_id)))
+
+    def degree(self, node_id: int) -> int:
+        return len(self.neighbors(node_id))
+
+    def freeze(self) -> CSRGraph:
+        # algoritmalar için alt grafın CSR anlık görüntüsü
+        if isinstance(self.graph, CSRGraph):
+            return self.graph.induced(self.node_ids)
+        return CSRGraph.from_graph(self)
+
+    def __contains__(self, node_id: object) -> bool:
+        return node_id in self.node_ids
+
+    def __len__(self) -> int:
+        return len(self.node_ids)
+
+    def __repr__(self) -> str:
+        return f"SubgraphView({len(self.node_ids)} düğüm)"
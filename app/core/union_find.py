@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+
+class UnionFind:
+    """
+    Bağlı bileşenler için ayrık küme (path compression + union by rank).
+
+    Ekleme/birleştirme ve sorgular O(α(n)). Kenar ya da düğüm silmek bileşeni
+    bölebileceği için o bileşenin kökü "stale" işaretlenir; refresh() yalnız
+    işaretli bileşenlerin üyelerini adj üzerinden yeniden birleştirir.
+    """
+
+    def __init__(self) -> None:
+        self.parent: dict[int, int] = {}
+        self.rank: dict[int, int] = {}
+        # kök -> bileşen üyeleri (birleşmede küçük liste büyüğe eklenir)
+        self.members: dict[int, list[int]] = {}
+        self.stale: set[int] = set()
+
+    def add(self, x: int) -> None:
+        self.parent[x] = x
+        self.rank[x] = 0
+        self.members[x] = [x]
+
+    def find(self, x: int) -> int:
+        parent = self.parent
+        root = x
+        while parent[root] != root:
+            root = parent[root]
+        while parent[x] != root:
+            parent[x], x = root, parent[x]
+        return root
+
+    def union(self, a: int, b: int) -> int:
+        ra, rb = self.find(a), self.find(b)
+        if ra == rb:
+            return ra
+        rank = self.rank
+        if rank[ra] < rank[rb]:
+            ra, rb = rb, ra
+        self.parent[rb] = ra
+        if rank[ra] == rank[rb]:
+            rank[ra] += 1
+        small, big = self.members.pop(rb), self.members[ra]
+        if len(small) > len(big):
+            small, big = big, small
+            self.members[ra] = big
+        big.extend(small)
+        # stale bir bileşenle birleşen bileşen de yeniden hesaplanmalı
+        if rb in self.stale:
+            self.stale.discard(rb)
+            self.stale.add(ra)
+        return ra
+
+    def mark_stale(self, x: int) -> None:
+        self.stale.add(self.find(x))
+
+    def refresh(self, adj: dict[int, set[int]]) -> None:
+        """Stale bileşenleri yeniden böl; adj'de olmayan (silinmiş) düğümler atılır."""
+        while self.stale:
+            root = self.stale.pop()
+            old = self.members.pop(root)
+            alive = [x for x in old if x in adj]
+            for x in old:
+                self.parent.pop(x, None)
+                self.rank.pop(x, None)
+            for x in alive:
+                self.add(x)
+            for x in alive:
+                for y in adj[x]:
+                    if x < y:
+                        self.union(x, y)
+
+    def size(self, x: int) -> int:
+        return len(self.members[self.find(x)])
+
+    def groups(self) -> list[list[int]]:
+        return list(self.members.values())
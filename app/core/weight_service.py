@@ -1,6 +1,10 @@
 from __future__ import annotations
 from dataclasses import dataclass
+
+import numpy as np
+
 from app.core.node import Node
+from app.core.node_table import rows_of
 
 @dataclass(slots=True)
 class WeightParams:
@@ -18,3 +22,56 @@ class WeightService:
         db = (n1.baglanti_sayisi - n2.baglanti_sayisi) ** 2
         p = WeightService.params
         return 1.0 / (1.0 + p.a * da + p.b * de + p.c * db)
+
+    @staticmethod
+    def compute_batch(graph, keys=None) -> None:
+        """
+        compute() formülünü tüm kenarlar (ya da verilen keys) için tek NumPy
+        ifadesinde hesaplar ve sonuçları graph.set_weights ile topluca yazar.
+        """
+        edges = graph.edges
+        full = keys is None
+        if keys is None and hasattr(edges, "arrays"):
+            # sıkıştırılmış depo: uç noktalar doğrudan dizilerden
+            us, vs, _w = edges.arrays()
+        else:
+            if keys is None:
+                keys = list(edges.keys())
+            m = len(keys)
+            ends = np.fromiter((x for k in keys for x in k), dtype=np.int64, count=2 * m)
+            us, vs = ends[0::2], ends[1::2]
+        if len(us) == 0:
+            if full:
+                graph.mark_clean()
+            return
+
+        nodes = graph.nodes
+        if hasattr(nodes, "column"):
+            # sütunlu depo: kopyasız sütunlar
+            ids = np.asarray(nodes.ids, dtype=np.int64)
+            akt = nodes.column("aktiflik")
+            etk = nodes.column("etkilesim")
+            bag = nodes.column("baglanti_sayisi")
+        else:
+            cnt = len(nodes)
+            vals = nodes.values()
+            ids = np.fromiter(nodes.keys(), dtype=np.int64, count=cnt)
+            akt = np.fromiter((n.aktiflik for n in vals), dtype=np.float64, count=cnt)
+            etk = np.fromiter((n.etkilesim for n in vals), dtype=np.float64, count=cnt)
+            bag = np.fromiter((n.baglanti_sayisi for n in vals), dtype=np.int64, count=cnt)
+
+        # uç noktaları (id) -> satır indeksine çevir
+        iu, iv = rows_of(ids, us), rows_of(ids, vs)
+
+        da = (akt[iu] - akt[iv]) ** 2
+        de = (etk[iu] - etk[iv]) ** 2
+        db = (bag[iu] - bag[iv]) ** 2
+        p = WeightService.params
+        w = 1.0 / (1.0 + p.a * da + p.b * de + p.c * db)
+
+        if hasattr(edges, "arrays"):
+            graph.set_weights_arrays(us, vs, w)
+        else:
+            graph.set_weights(keys, w)
+        # yazılan edge'lerin uçları artık güncel: sonraki refresh_weights O(deg) kalır
+        graph.mark_clean(None if full else np.unique(np.concatenate((us, vs))).tolist())
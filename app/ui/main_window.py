@@ -4,7 +4,7 @@ import math
 from PySide6.QtWidgets import (
     QMainWindow, QWidget, QSplitter, QVBoxLayout, QFormLayout,
     QLineEdit, QPushButton, QLabel, QGroupBox, QFileDialog, QMessageBox,
-    QDialog, QTextEdit
+    QDialog, QTextEdit, QComboBox
 )
 from PySide6.QtCore import Qt
 
@@ -16,15 +16,35 @@ from app.core.storage import StorageService
 from app.core.graph import Graph
 from app.core.node import Node
 from app.core.edge import undirected_key
+from app.core.journal import EventKind
 from app.core.weight_service import WeightService
 
-from app.algorithms.bfs import bfs
-from app.algorithms.dfs import dfs
-from app.algorithms.dijkstra import dijkstra
+from app.algorithms.base import VisitEvent
+from app.algorithms.bfs import bfs, iter_bfs
+from app.algorithms.dfs import dfs, iter_dfs
+from app.algorithms.dijkstra import dijkstra, iter_dijkstra
 from app.algorithms.astar import astar
+from app.algorithms.spt_cache import spt_cache
 from app.algorithms.components import connected_components
-from app.algorithms.centrality import degree_centrality, closeness_centrality
+from app.algorithms.centrality import degree_centrality, closeness_centrality, closeness_topk, betweenness_centrality
+from app.algorithms.parallel import default_workers
 from app.algorithms.welsh_powell import welsh_powell_coloring
+from app.algorithms.dsatur import dsatur_coloring
+from app.algorithms.clustering import average_clustering, clustering_approx, global_clustering, triangles
+from app.algorithms.community import label_propagation, louvain, modularity
+from app.algorithms.ego import ego_network
+
+# renklendirme seçici: görünen ad -> algoritma
+COLORING_ALGORITHMS = {
+    "Welsh–Powell": welsh_powell_coloring,
+    "DSATUR": dsatur_coloring,
+}
+
+# topluluk seçici: görünen ad -> algoritma
+COMMUNITY_ALGORITHMS = {
+    "Louvain": louvain,
+    "Label Propagation": label_propagation,
+}
 
 from PySide6.QtWidgets import QScrollArea, QSizePolicy
 
@@ -32,6 +52,8 @@ from PySide6.QtWidgets import QTableWidget, QTableWidgetItem, QHeaderView
 
 import random
 import time
+from itertools import chain
+from typing import Iterable, Iterator, Mapping, Sequence
 
 
 
@@ -60,12 +82,16 @@ class MainWindow(QMainWindow):
 
         self.node_items: dict[int, NodeItem] = {}
         self.edge_items: dict[tuple[int, int], EdgeItem] = {}
+        # sahnenin yansıttığı son graph.version (journal imleci)
+        self._scene_version = 0
         # --- animasyon state ---
         self._anim_timer = QTimer(self)
         self._anim_timer.timeout.connect(self._anim_step)
+        # zamanlayıcı her tikte bu akıştan bir ziyaret olayı çeker
+        self._anim_events: Iterator[VisitEvent] = iter(())
+        self._anim_title = ""
         self._anim_order: list[int] = []
-        self._anim_parent: dict[int, int | None] = {}
-        self._anim_idx = 0
+        self._anim_report = False
         self._anim_prev: int | None = None
         self._anim_last_edge_key: tuple[int, int] | None = None
 
@@ -141,13 +167,26 @@ class MainWindow(QMainWindow):
         btn_cent = QPushButton("Centrality (Degree+Closeness)")
         btn_cent.clicked.connect(self.centrality_clicked)
 
-        btn_color = QPushButton("Welsh–Powell (Coloring)")
+        self.sp_ego_k = QSpinBox()
+        self.sp_ego_k.setRange(1, 10)
+        self.sp_ego_k.setValue(2)
+        btn_ego = QPushButton("Ego Ağı (Start, k-hop)")
+        btn_ego.clicked.connect(self.ego_clicked)
+
+        self.cmb_coloring = QComboBox()
+        self.cmb_coloring.addItems(list(COLORING_ALGORITHMS))
+        btn_color = QPushButton("Renklendir (Coloring)")
         btn_color.clicked.connect(self.coloring_clicked)
 
+        self.cmb_community = QComboBox()
+        self.cmb_community.addItems(list(COMMUNITY_ALGORITHMS))
+        btn_comm = QPushButton("Toplulukları Bul")
+        btn_comm.clicked.connect(self.community_clicked)
+
         btn_test = QPushButton("Tüm Algoritmaları Test Et")
         btn_test.clicked.connect(self.test_all_algorithms)
 
-        for b in (btn_bfs, btn_dfs, btn_dij, btn_ast, btn_comp, btn_cent, btn_color, btn_test):
+        for b in (btn_bfs, btn_dfs, btn_dij, btn_ast, btn_comp, btn_cent, btn_ego, btn_color, btn_comm, btn_test):
             b.setMinimumHeight(30)
             b.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
 
@@ -157,7 +196,12 @@ class MainWindow(QMainWindow):
         fA.addRow(btn_ast)
         fA.addRow(btn_comp)
         fA.addRow(btn_cent)
+        fA.addRow("Ego k", self.sp_ego_k)
+        fA.addRow(btn_ego)
+        fA.addRow("Renklendirme", self.cmb_coloring)
         fA.addRow(btn_color)
+        fA.addRow("Topluluk", self.cmb_community)
+        fA.addRow(btn_comm)
         fA.addRow(btn_test)
 
         # ---- Node form ----
@@ -385,11 +429,9 @@ class MainWindow(QMainWindow):
                 etkilesim=node.etkilesim,
                 baglanti_sayisi=node.baglanti_sayisi,
             )
-            if node.id in self.node_items:
-                self.node_items[node.id].set_label(f"{node.id}:{node.name}")
-
-            self.graph.recompute_all_weights(WeightService.compute)
-            self._sync_edge_labels()
+            # yalnız bu node'a bağlı edge'ler yeniden hesaplanır
+            self.graph.refresh_weights(WeightService.compute)
+            self._sync_scene()
 
             self.lbl.setText(f"Node güncellendi: {node.id}")
         except Exception as e:
@@ -428,8 +470,8 @@ class MainWindow(QMainWindow):
             WeightService.params.b = float(self.in_b.text().strip())
             WeightService.params.c = float(self.in_c.text().strip())
 
-            self.graph.recompute_all_weights(WeightService.compute)
-            self._sync_edge_labels()
+            WeightService.compute_batch(self.graph)
+            self._sync_scene()
 
             self.lbl.setText("Weight güncellendi.")
         except Exception as e:
@@ -442,7 +484,7 @@ class MainWindow(QMainWindow):
         lines = [f"{u}-{v}   w={e.weight:.6f}" for (u, v), e in sorted(self.graph.edges.items())]
         self._show_text_dialog("Edge Weights", "\n".join(lines))
 
-    def _show_result(self, title: str, out: dict, start=None, goal=None) -> None:
+    def _show_result(self, title: str, out: Mapping, start=None, goal=None) -> None:
         # tabloyu temizle
         self._table_clear()
 
@@ -455,7 +497,7 @@ class MainWindow(QMainWindow):
         self._table_add_row("ALGO", title, " ".join(meta) if meta else "OK")
 
         # çıkan order/path/cost gibi alanları satır satır yaz
-        if isinstance(out, dict):
+        if isinstance(out, Mapping):
             if "order" in out:
                 self._table_add_row("ORDER", "-", " -> ".join(map(str, out.get("order", []))))
             if "path" in out:
@@ -465,7 +507,7 @@ class MainWindow(QMainWindow):
         # --- GRAF ÜSTÜNDE GÖSTERİM ---
         self._clear_highlights()
 
-        if isinstance(out, dict):
+        if isinstance(out, Mapping):
             if out.get("path"):
                 self._highlight_path(list(out["path"]))
             elif out.get("order"):
@@ -494,8 +536,10 @@ class MainWindow(QMainWindow):
         self._highlight_nodes(path)
 
         # path üzerindeki edge'leri de parlat
-        for u, v in zip(path, path[1:]):
-            key = undirected_key(u, v)  # yönsüz key
+        self._highlight_edges(undirected_key(u, v) for u, v in zip(path, path[1:]))
+
+    def _highlight_edges(self, keys) -> None:
+        for key in keys:
             eit = self.edge_items.get(key)
             if eit and hasattr(eit, "set_highlight"):
                 eit.set_highlight(True)
@@ -510,7 +554,6 @@ class MainWindow(QMainWindow):
             return
         try:
             self.graph = StorageService.load_csv(path)
-            self.graph.recompute_all_weights(WeightService.compute)
             self._render_graph()
             self._sync_edge_labels()
             self.lbl.setText(f"CSV yüklendi: {path}")
@@ -533,7 +576,7 @@ class MainWindow(QMainWindow):
             return
         try:
             self.graph = StorageService.load_json(path)
-            self.graph.recompute_all_weights(WeightService.compute)
+            WeightService.compute_batch(self.graph)
             self._render_graph()
             self._sync_edge_labels()
             self.lbl.setText(f"JSON yüklendi: {path}")
@@ -588,6 +631,7 @@ class MainWindow(QMainWindow):
 
     def _render_graph(self) -> None:
         self._clear_scene()
+        self._scene_version = self.graph.version
         ids = sorted(self.graph.nodes.keys())
         n = len(ids)
         if n == 0:
@@ -613,6 +657,50 @@ class MainWindow(QMainWindow):
             self.view.scene.addItem(eit)
             self.edge_items[key] = eit
 
+    def _sync_scene(self) -> None:
+        """Sahneyi journal'daki son olaylarla günceller (O(değişiklik))."""
+        events = self.graph.changes_since(self._scene_version)
+        if events is None:
+            self._render_graph()
+            return
+
+        for ev in events:
+            if ev.kind == EventKind.NODE_ADDED:
+                node = self.graph.nodes.get(ev.node_id)
+                if node is None or ev.node_id in self.node_items:
+                    continue
+                item = NodeItem(ev.node_id, label=f"{ev.node_id}:{node.name}")
+                item.setPos(node.x, node.y)
+                self.view.scene.addItem(item)
+                self.node_items[ev.node_id] = item
+            elif ev.kind == EventKind.NODE_UPDATED:
+                node = self.graph.nodes.get(ev.node_id)
+                item = self.node_items.get(ev.node_id)
+                if node is not None and item is not None:
+                    item.set_label(f"{ev.node_id}:{node.name}")
+            elif ev.kind == EventKind.NODE_REMOVED:
+                item = self.node_items.pop(ev.node_id, None)
+                if item:
+                    self.view.scene.removeItem(item)
+            elif ev.kind == EventKind.EDGE_ADDED:
+                a = self.node_items.get(ev.edge[0])
+                b = self.node_items.get(ev.edge[1])
+                if a is None or b is None or ev.edge in self.edge_items:
+                    continue
+                eit = EdgeItem(a, b, weight=ev.weight)
+                self.view.scene.addItem(eit)
+                self.edge_items[ev.edge] = eit
+            elif ev.kind == EventKind.EDGE_REMOVED:
+                eit = self.edge_items.pop(ev.edge, None)
+                if eit:
+                    self.view.scene.removeItem(eit)
+            elif ev.kind == EventKind.WEIGHT_CHANGED:
+                eit = self.edge_items.get(ev.edge)
+                if eit:
+                    eit.set_weight(ev.weight)
+
+        self._scene_version = self.graph.version
+
     def _sync_edge_labels(self) -> None:
         for (u, v), e in self.graph.edges.items():
             key = undirected_key(u, v)
@@ -650,38 +738,24 @@ class MainWindow(QMainWindow):
         )
 
     def _add_node(self, node: Node, x: float, y: float) -> None:
+        node.x = x
+        node.y = y
         self.graph.add_node(node)
-        item = NodeItem(node.id, label=f"{node.id}:{node.name}")
-        item.setPos(x, y)
-        self.view.scene.addItem(item)
-        self.node_items[node.id] = item
+        self._sync_scene()
 
     def _remove_node(self, node_id: int) -> None:
-        for nb in list(self.graph.neighbors(node_id)):
-            self._remove_edge(node_id, nb)
+        # bağlı edge'ler de journal üzerinden sahneden düşer
         self.graph.remove_node(node_id)
-        it = self.node_items.pop(node_id, None)
-        if it:
-            self.view.scene.removeItem(it)
+        self._sync_scene()
 
     def _add_edge(self, u: int, v: int):
         e = self.graph.add_edge(u, v, weight_fn=WeightService.compute)
-        key = undirected_key(u, v)
-
-        a = self.node_items[key[0]]
-        b = self.node_items[key[1]]
-
-        eit = EdgeItem(a, b, weight=e.weight)
-        self.view.scene.addItem(eit)
-        self.edge_items[key] = eit
+        self._sync_scene()
         return e
 
     def _remove_edge(self, u: int, v: int) -> None:
-        key = undirected_key(u, v)
         self.graph.remove_edge(u, v)
-        eit = self.edge_items.pop(key, None)
-        if eit:
-            self.view.scene.removeItem(eit)
+        self._sync_scene()
 
     def _read_start_goal(self):
         s = int(self.in_start.text().strip())
@@ -692,11 +766,10 @@ class MainWindow(QMainWindow):
     def bfs_clicked(self):
         try:
             s, _ = self._read_start_goal()
-            out = bfs(self.graph, s)
-            self._show_result("BFS", out)  # sende varsa
-            order = out.get("order", [])
-            parent = out.get("parent", {})
-            self.animate_traversal(order, parent, title="BFS")
+            self._table_clear()
+            self._table_add_row("ALGO", "BFS", f"Start={s}")
+            # gezinti tembel: ilk kare tüm grafın gezilmesini beklemez
+            self.animate_events(iter_bfs(self.graph, s), title="BFS", report=True)
         except Exception as e:
             QMessageBox.critical(self, "Hata", str(e))
 
@@ -706,11 +779,9 @@ class MainWindow(QMainWindow):
     def dfs_clicked(self):
         try:
             s, _ = self._read_start_goal()
-            out = dfs(self.graph, s)
-            self._show_result("DFS", out)
-            order = out.get("order", [])
-            parent = out.get("parent", {})
-            self.animate_traversal(order, parent, title="DFS")
+            self._table_clear()
+            self._table_add_row("ALGO", "DFS", f"Start={s}")
+            self.animate_events(iter_dfs(self.graph, s), title="DFS", report=True)
         except Exception as e:
             QMessageBox.critical(self, "Hata", str(e))
 
@@ -718,21 +789,20 @@ class MainWindow(QMainWindow):
     def dijkstra_clicked(self):
         try:
             s, g = self._read_start_goal()
-            out = dijkstra(self.graph, s, g)
+            # aynı kaynaktan tekrar sorgular önbellekteki en kısa yol ağacından okunur
+            tree = spt_cache.get(self.graph, s)
+            if tree is not None:
+                out = tree.result(g)
+                # animasyon ağacın kesinleşme sırasından oynar; Dijkstra yeniden koşmaz
+                events = tree.iter_settled(g)
+            else:
+                out = dijkstra(self.graph, s, g)
+                events = iter_dijkstra(self.graph, s, g)
 
             self._show_result("Dijkstra", out, start=s, goal=g)
 
-            # Animasyon için order'ı oluştur (prev'den)
-            prev = out.get("prev", {})
-            order = []
-            # Ziyaret edilen düğümleri sıra ile ekle
-            visited = set()
-            for nid in sorted(prev.keys()):
-                if nid not in visited:
-                    order.append(nid)
-                    visited.add(nid)
-            
-            self.animate_traversal(order, prev, title="Dijkstra")
+            # animasyon düğümleri kesinleşme sırasıyla, her tikte bir tane üretir
+            self.animate_events(events, title="Dijkstra")
 
             QMessageBox.information(self, "Dijkstra", f"Path: {out['path']}\nCost: {out['cost']}")
         except Exception as e:
@@ -741,20 +811,25 @@ class MainWindow(QMainWindow):
     def astar_clicked(self):
         try:
             s, g = self._read_start_goal()
+            tree = spt_cache.get(self.graph, s, build=False)
+            if tree is not None:
+                # bu kaynağın ağacı zaten hazır: A* koşmaz, sonuç ve animasyon
+                # önbellekteki Dijkstra ağacındandır (etiket bunu belirtir)
+                title = "A* (önbellek: Dijkstra ağacı)"
+                out = tree.result(g, dist_key="g")
+                self._show_result(title, out, start=s, goal=g)
+                self.animate_events(tree.iter_settled(g), title=title)
+                QMessageBox.information(self, title, f"Path: {out['path']}\nCost: {out['cost']}")
+                return
+
             out = astar(self.graph, s, g)
 
             self._show_result("A*", out, start=s, goal=g)
             
-            # Animasyon için order'ı oluştur (prev'den)
+            # Animasyon için order'ı oluştur (prev'den); görünüm A*'ın keşif sırasıyla gezer
             prev = out.get("prev", {})
-            order = []
-            # Ziyaret edilen düğümleri sıra ile ekle
-            visited = set()
-            for nid in sorted(prev.keys()):
-                if nid not in visited:
-                    order.append(nid)
-                    visited.add(nid)
-            
+            order = list(prev)
+
             self.animate_traversal(order, prev, title="A*")
             
             QMessageBox.information(self, "A*", f"Path: {out['path']}\nCost: {out['cost']}")
@@ -769,16 +844,61 @@ class MainWindow(QMainWindow):
         except Exception as e:
             QMessageBox.critical(self, "Hata", str(e))
 
+    def ego_clicked(self):
+        try:
+            s, _ = self._read_start_goal()
+            k = self.sp_ego_k.value()
+            # yalnız k derinliğe kadar gezilir; tüm graf dolaşılmaz
+            ego = ego_network(self.graph, s, k)
+
+            self._clear_highlights()
+            self._highlight_nodes(list(ego.node_ids))
+            self._highlight_edges(ego.edge_keys())
+
+            self._table_clear()
+            self._table_add_row("ALGO", "Ego", f"Start={s} k={k}")
+            self._table_add_row("EGO", "-", f"{len(ego)} düğüm")
+            self.lbl.setText(f"Ego ağı: {s} için {k}-hop içinde {len(ego)} düğüm.")
+        except Exception as e:
+            QMessageBox.critical(self, "Hata", str(e))
+
+    def _centrality_workers(self) -> int:
+        # küçük graflarda süreç başlatma maliyeti kazancı aşar
+        return default_workers() if len(self.graph.nodes) >= 2000 else 1
+
+    def _top_closeness(self, k: int = 5) -> list[tuple[int, float]]:
+        # büyük graflarda tüm düğümler yerine örneklemeli top-k
+        if len(self.graph.nodes) >= 5000:
+            return closeness_topk(self.graph, k=k, workers=self._centrality_workers())["top"]
+        clo = closeness_centrality(self.graph, workers=self._centrality_workers())
+        return sorted(clo.items(), key=lambda x: x[1], reverse=True)[:k]
+
+    def _top_betweenness(self, k: int = 5) -> list[tuple[int, float]]:
+        # büyük graflarda kaynak örneklemeli kestirim
+        samples = 256 if len(self.graph.nodes) >= 5000 else None
+        bet = betweenness_centrality(self.graph, samples=samples, workers=self._centrality_workers())
+        return sorted(bet.items(), key=lambda x: x[1], reverse=True)[:k]
+
+    def _clustering(self) -> tuple[float, float, str]:
+        # (geçişlilik, ortalama yerel katsayı, yöntem); büyük graflarda kama örneklemesi
+        if len(self.graph.nodes) >= 5000:
+            est = clustering_approx(self.graph, epsilon=0.01)
+            return est["transitivity"], est["average"], f"kama örneklemesi, ±{est['epsilon']:.3f}"
+        return global_clustering(self.graph), average_clustering(self.graph), "kesin"
+
     def centrality_clicked(self):
         try:
             deg = degree_centrality(self.graph)
-            clo = closeness_centrality(self.graph)
+            top_clo = self._top_closeness(5)
+            top_bet = self._top_betweenness(5)
 
             top_deg = sorted(deg.items(), key=lambda x: x[1], reverse=True)[:5]
-            top_clo = sorted(clo.items(), key=lambda x: x[1], reverse=True)[:5]
 
             msg = "Top Degree:\n" + "\n".join([f"{nid}: {v:.4f}" for nid, v in top_deg])
             msg += "\n\nTop Closeness:\n" + "\n".join([f"{nid}: {v:.4f}" for nid, v in top_clo])
+            msg += "\n\nTop Betweenness:\n" + "\n".join([f"{nid}: {v:.4f}" for nid, v in top_bet])
+            trans, avg_c, how = self._clustering()
+            msg += f"\n\nKümelenme ({how}):\nGlobal: {trans:.4f}\nOrtalama yerel: {avg_c:.4f}"
 
             QMessageBox.information(self, "Centrality", msg)
         except Exception as e:
@@ -786,19 +906,54 @@ class MainWindow(QMainWindow):
 
     def coloring_clicked(self):
         try:
-            coloring = welsh_powell_coloring(self.graph)
+            algo = self.cmb_coloring.currentText()
+            if algo not in COLORING_ALGORITHMS:
+                algo = "Welsh–Powell"
+            t0 = time.perf_counter()
+            coloring = COLORING_ALGORITHMS[algo](self.graph)
+            col_time = (time.perf_counter() - t0) * 1000
             k = (max(coloring.values()) + 1) if coloring else 0
 
             # UI label'a renk numarası ekleyelim ve düğüme renk ata
-            for nid, col in coloring.items():
-                n = self.graph.nodes.get(nid)
-                name = n.name if n else ""
-                if nid in self.node_items:
-                    self.node_items[nid].set_label(f"{nid}:{name} (c{col})")
-                    self.node_items[nid].set_color(col)
-
-            text = f"Renk sayısı: {k}\n\n" + "\n".join([f"{nid} -> c{col}" for nid, col in sorted(coloring.items())])
-            self._show_text_dialog("Welsh–Powell", text)
+            self._paint_groups(coloring, "c")
+
+            text = (f"Renk sayısı: {k}\nÇalışma süresi: {col_time:.4f} ms\n\n"
+                    + "\n".join([f"{nid} -> c{col}" for nid, col in sorted(coloring.items())]))
+            self._show_text_dialog(algo, text)
+        except Exception as e:
+            QMessageBox.critical(self, "Hata", str(e))
+
+    def _paint_groups(self, groups: dict[int, int], tag: str) -> None:
+        # düğümleri grup numarasına göre boya (renklendirme / topluluk)
+        for nid, col in groups.items():
+            item = self.node_items.get(nid)
+            if item is None:
+                continue
+            n = self.graph.nodes.get(nid)
+            name = n.name if n else ""
+            item.set_label(f"{nid}:{name} ({tag}{col})")
+            item.set_color(col)
+
+    def community_clicked(self):
+        try:
+            algo = self.cmb_community.currentText()
+            if algo not in COMMUNITY_ALGORITHMS:
+                algo = "Louvain"
+            t0 = time.perf_counter()
+            comms = COMMUNITY_ALGORITHMS[algo](self.graph)
+            comm_time = (time.perf_counter() - t0) * 1000
+            k = (max(comms.values()) + 1) if comms else 0
+            q = modularity(self.graph, comms)
+
+            self._paint_groups(comms, "t")
+
+            sizes: dict[int, int] = {}
+            for c in comms.values():
+                sizes[c] = sizes.get(c, 0) + 1
+            top = sorted(sizes.items(), key=lambda x: x[1], reverse=True)[:10]
+            text = (f"Topluluk sayısı: {k}\nModülerlik: {q:.4f}\nÇalışma süresi: {comm_time:.4f} ms\n\n"
+                    + "\n".join([f"t{c}: {size} düğüm" for c, size in top]))
+            self._show_text_dialog(algo, text)
         except Exception as e:
             QMessageBox.critical(self, "Hata", str(e))
 
@@ -868,7 +1023,7 @@ class MainWindow(QMainWindow):
             try:
                 s, g = self._read_start_goal()
                 t0 = time.perf_counter()
-                out = dijkstra(self.graph, s, g)
+                out = spt_cache.shortest_path(self.graph, s, g)
                 t1 = time.perf_counter()
                 dij_time = (t1 - t0) * 1000
                 
@@ -930,12 +1085,14 @@ class MainWindow(QMainWindow):
             try:
                 t0 = time.perf_counter()
                 deg = degree_centrality(self.graph)
-                clo = closeness_centrality(self.graph)
+                top_clo = self._top_closeness(5)
+                top_bet = self._top_betweenness(5)
+                trans, avg_c, how = self._clustering()
+                tri = triangles(self.graph) if len(self.graph.nodes) < 5000 else None
                 t1 = time.perf_counter()
                 cent_time = (t1 - t0) * 1000
                 
                 top_deg = sorted(deg.items(), key=lambda x: x[1], reverse=True)[:5]
-                top_clo = sorted(clo.items(), key=lambda x: x[1], reverse=True)[:5]
                 
                 dlg.add_result(f"✅ Centrality Tamamlandı")
                 dlg.add_result(f"  Top 5 Degree Centrality:")
@@ -944,6 +1101,14 @@ class MainWindow(QMainWindow):
                 dlg.add_result(f"  Top 5 Closeness Centrality:")
                 for nid, v in top_clo:
                     dlg.add_result(f"    Düğüm {nid}: {v:.6f}")
+                dlg.add_result(f"  Top 5 Betweenness Centrality:")
+                for nid, v in top_bet:
+                    dlg.add_result(f"    Düğüm {nid}: {v:.6f}")
+                dlg.add_result(f"  Kümelenme Katsayısı ({how}):")
+                dlg.add_result(f"    Global (geçişlilik): {trans:.6f}")
+                dlg.add_result(f"    Ortalama yerel: {avg_c:.6f}")
+                if tri is not None:
+                    dlg.add_result(f"    Üçgen Sayısı: {sum(tri.values()) // 3}")
                 dlg.add_result(f"  Çalışma Süresi: {cent_time:.4f} ms")
             except Exception as e:
                 dlg.add_result(f"❌ Centrality Hatası: {str(e)}")
@@ -966,6 +1131,24 @@ class MainWindow(QMainWindow):
             except Exception as e:
                 dlg.add_result(f"❌ Welsh-Powell Hatası: {str(e)}")
 
+            dlg.add_separator()
+
+            # DSATUR Coloring Testi
+            dlg.add_result(f"\n8️⃣  DSATUR Renklendirme Algoritması Çalışıyor...")
+            try:
+                t0 = time.perf_counter()
+                coloring = dsatur_coloring(self.graph)
+                t1 = time.perf_counter()
+                col_time = (t1 - t0) * 1000
+
+                k = (max(coloring.values()) + 1) if coloring else 0
+                dlg.add_result(f"✅ DSATUR Tamamlandı")
+                dlg.add_result(f"  Kullanılan Renk Sayısı: {k}")
+                dlg.add_result(f"  Renkli Düğüm Sayısı: {len(coloring)}")
+                dlg.add_result(f"  Çalışma Süresi: {col_time:.4f} ms")
+            except Exception as e:
+                dlg.add_result(f"❌ DSATUR Hatası: {str(e)}")
+
             dlg.add_separator()
             dlg.add_result(f"\n✨ TÜM ALGORITMALAR BAŞARILI BİR ŞEKİLDE TEST EDİLDİ ✨")
 
@@ -983,49 +1166,51 @@ class MainWindow(QMainWindow):
         """
         g = Graph()
 
-        # Node'lar
-        for i in range(1, n + 1):
-            node = Node(
+        # Node'lar (A* için koordinat da ver), tek seferde
+        g.add_nodes_bulk(
+            Node(
                 id=i,
                 name=f"N{i}",
                 aktiflik=random.random(),
                 etkilesim=random.randint(0, 20),
                 baglanti_sayisi=0,  # degree sonrası güncelleriz
+                x=random.uniform(-300, 300),
+                y=random.uniform(-300, 300),
             )
-            # A* için (heuristic kullanıyorsan) koordinat ver
-            node.x = random.uniform(-300, 300)
-            node.y = random.uniform(-300, 300)
-            g.add_node(node)
+            for i in range(1, n + 1)
+        )
 
-        # Edge'ler (yönsüz, duplicate yok)
-        for i in range(1, n + 1):
-            for j in range(i + 1, n + 1):
-                if random.random() < p:
-                    g.add_edge(i, j, weight_fn=WeightService.compute)
+        # Edge'ler (yönsüz, duplicate yok): her çift p olasılıkla.
+        # Ardışık seçilen çiftler arası atlama geometrik dağılır (Batagelj–Brandes), O(n + m)
+        triples: list[tuple[int, int, float]] = []
+        if p >= 1.0:
+            triples = [(i, j, 1.0) for j in range(2, n + 1) for i in range(1, j)]
+        elif p > 0.0:
+            lp = math.log(1.0 - p)
+            v, w = 1, -1
+            while v < n:
+                w += 1 + int(math.log(1.0 - random.random()) / lp)
+                while w >= v and v < n:
+                    w -= v
+                    v += 1
+                if v < n:
+                    triples.append((w + 1, v + 1, 1.0))
+        g.add_edges_bulk(triples)
 
         # Node'ların bağlantı sayısını degree'e göre düzelt
         for nid in g.nodes:
-            try:
-                deg = len(list(g.neighbors(nid)))
-            except Exception:
-                # neighbors yoksa (çok düşük ihtimal) 0 geç
-                deg = 0
-            g.nodes[nid].baglanti_sayisi = deg
+            g.nodes[nid].baglanti_sayisi = g.degree(nid)
 
         # weight'leri bir daha hesapla (baglanti_sayisi update sonrası)
-        g.recompute_all_weights(WeightService.compute)
+        WeightService.compute_batch(g)
 
         return g
 
-
-
-
     def stop_animation(self) -> None:
         if self._anim_timer.isActive():
             self._anim_timer.stop()
+        self._anim_events = iter(())
         self._anim_order = []
-        self._anim_parent = {}
-        self._anim_idx = 0
         self._anim_prev = None
         self._anim_last_edge_key = None
 
@@ -1038,34 +1223,52 @@ class MainWindow(QMainWindow):
             if hasattr(eitem, "set_state"):
                 eitem.set_state("default")
 
-    def animate_traversal(self, order: list[int], parent: dict[int, int | None] | None = None, title: str = "Traversal") -> None:
+    def animate_traversal(self, order: Sequence[int], parent: Mapping[int, int | None] | None = None, title: str = "Traversal") -> None:
+        parent = parent or {}
+        events = (VisitEvent(nid, parent.get(nid), depth) for depth, nid in enumerate(order))
+        self.animate_events(events, title=title)
+
+    def animate_events(self, events: Iterable[VisitEvent], title: str = "Traversal", report: bool = False) -> None:
+        """
+        Ziyaret olaylarını zamanlayıcıyla oynatır; her tikte akıştan yalnız bir
+        olay çekilir. report=True ise animasyon bitince ziyaret sırası _show_result
+        ile tabloya yazılır ve graf üzerinde parlatılır.
+        """
         self.stop_animation()
         self._reset_visual_states()
 
-        if not order:
+        events = iter(events)
+        first = next(events, None)
+        if first is None:
             self.lbl.setText(f"{title}: gezilecek düğüm yok (order boş).")
             return
 
-        self._anim_order = order
-        self._anim_parent = parent or {}
-        self._anim_idx = 0
+        self._anim_events = chain([first], events)
+        self._anim_title = title
+        self._anim_report = report
+        self._anim_order = []
         self._anim_prev = None
         self._anim_last_edge_key = None
 
         interval = int(self.sp_anim_ms.value()) if hasattr(self, "sp_anim_ms") else 250
-        self.lbl.setText(f"{title} animasyonu başladı. Ziyaret sayısı: {len(order)}")
+        self.lbl.setText(f"{title} animasyonu başladı.")
         self._anim_timer.start(interval)
 
     def _anim_step(self) -> None:
-        if self._anim_idx >= len(self._anim_order):
+        ev = next(self._anim_events, None)
+        if ev is None:
             # bitti
             if self._anim_prev is not None and self._anim_prev in self.node_items:
                 self.node_items[self._anim_prev].set_state("visited")
             self._anim_timer.stop()
-            self.lbl.setText("Animasyon bitti.")
+            if self._anim_report:
+                self._show_result(self._anim_title, {"order": self._anim_order})
+            self.lbl.setText(f"Animasyon bitti. {self._anim_title} ziyaret sayısı: {len(self._anim_order)}")
+            self._anim_events = iter(())
             return
 
-        nid = self._anim_order[self._anim_idx]
+        nid = ev.node
+        self._anim_order.append(nid)
 
         # önceki node visited olsun
         if self._anim_prev is not None and self._anim_prev in self.node_items:
@@ -1081,58 +1284,32 @@ class MainWindow(QMainWindow):
                 pass
 
         # parent varsa: tree edge’i de highlight edelim (çok iyi durur)
-        if nid in self._anim_parent:
-            p = self._anim_parent.get(nid)
-            if p is not None:
-                key = undirected_key(p, nid)
-                eitem = self.edge_items.get(key)
-                if eitem and hasattr(eitem, "set_state"):
-                    eitem.set_state("active")
-                # önceki active edge'i visited yap
-                if self._anim_last_edge_key and self._anim_last_edge_key in self.edge_items:
-                    prev_e = self.edge_items[self._anim_last_edge_key]
-                    if hasattr(prev_e, "set_state"):
-                        prev_e.set_state("visited")
-                self._anim_last_edge_key = key
+        p = ev.parent
+        if p is not None:
+            key = undirected_key(p, nid)
+            eitem = self.edge_items.get(key)
+            if eitem and hasattr(eitem, "set_state"):
+                eitem.set_state("active")
+            # önceki active edge'i visited yap
+            if self._anim_last_edge_key and self._anim_last_edge_key in self.edge_items:
+                prev_e = self.edge_items[self._anim_last_edge_key]
+                if hasattr(prev_e, "set_state"):
+                    prev_e.set_state("visited")
+            self._anim_last_edge_key = key
 
         self._anim_prev = nid
-        self._anim_idx += 1
 
     def make_random_graph_clicked(self) -> None:
         n = int(self.sp_test_n.value())
         p = float(self.sp_test_p.value())
 
         # model
-        g = Graph()
-        for i in range(1, n + 1):
-            node = Node(
-                id=i,
-                name=f"N{i}",
-                aktiflik=random.random(),
-                etkilesim=random.randint(0, 20),
-                baglanti_sayisi=0,
-            )
-            # A* için x/y (varsa kullanılır)
-            node.x = random.uniform(-300, 300)
-            node.y = random.uniform(-300, 300)
-            g.add_node(node)
-
-        for i in range(1, n + 1):
-            for j in range(i + 1, n + 1):
-                if random.random() < p:
-                    g.add_edge(i, j, weight_fn=WeightService.compute)
-
-        # degree -> baglanti_sayisi
-        for nid in g.nodes:
-            deg = len(list(g.neighbors(nid)))
-            g.nodes[nid].baglanti_sayisi = deg
-
-        g.recompute_all_weights(WeightService.compute)
+        g = self._make_random_graph(n, p)
 
         # UI'ya bas
         self.graph = g
         self._render_graph()
-        self._sync_edge_labels() if hasattr(self, "_sync_edge_labels") else None
+        self._sync_edge_labels()
         self.lbl.setText(f"Rastgele graf üretildi: n={n}, m={len(g.edges)}, p={p}")
 
 